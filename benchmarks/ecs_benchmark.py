@@ -0,0 +1,233 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from ecs_framework.ecs import ECS, Component
+
+BASELINE = Path(__file__).with_name('baseline.json')
+SIZES = (1_000, 10_000, 100_000)
+TICKS = 10
+MIN_TIME = 0.2
+
+
+@dataclass(slots=True)
+class Position(Component):
+    x: float
+    y: float
+
+
+@dataclass(slots=True)
+class Velocity(Component):
+    x: float
+    y: float
+
+
+class MoveSystem:
+
+    reads = (Velocity,)
+    writes = (Position,)
+
+    def __init__(self, world: ECS):
+        self.world = world
+        self.query = world.query(Position, Velocity)
+
+    def execute(self, delta_time: float) -> None:
+        for _, (position, velocity) in self.query:
+            position.x += velocity.x * delta_time
+            position.y += velocity.y * delta_time
+
+
+def populated(size: int, moving: bool = False) -> Tuple[ECS, List[int]]:
+    world = ECS()
+    entities = [world.create_entity() for _ in range(size)]
+    for entity in entities:
+        world.add_component(entity, Position(0.0, 0.0))
+    if moving:
+        for entity in entities[::2]:
+            world.add_component(entity, Velocity(1.0, 1.0))
+    return world, entities
+
+
+def create_entities(size: int) -> Callable[[], int]:
+    world = ECS()
+
+    def run() -> int:
+        for _ in range(size):
+            world.create_entity()
+        return size
+    return run
+
+
+def add_component(size: int) -> Callable[[], int]:
+    world = ECS()
+    entities = [world.create_entity() for _ in range(size)]
+
+    def run() -> int:
+        for entity in entities:
+            world.add_component(entity, Position(0.0, 0.0))
+        return size
+    return run
+
+
+def remove_component(size: int) -> Callable[[], int]:
+    world, entities = populated(size)
+
+    def run() -> int:
+        for entity in entities:
+            world.remove_component(entity, Position)
+        return size
+    return run
+
+
+def query_single(size: int) -> Callable[[], int]:
+    world, _ = populated(size)
+    query = world.query(Position)
+
+    def run() -> int:
+        count = 0
+        for _ in query:
+            count += 1
+        return count
+    return run
+
+
+def query_multi(size: int) -> Callable[[], int]:
+    world, _ = populated(size, moving=True)
+    query = world.query(Position, Velocity)
+
+    def run() -> int:
+        count = 0
+        for _ in query:
+            count += 1
+        return count
+    return run
+
+
+def delete_entities(size: int) -> Callable[[], int]:
+    world, entities = populated(size)
+
+    def run() -> int:
+        for entity in entities:
+            world.delete_entity(entity)
+        return size
+    return run
+
+
+def execute(size: int) -> Callable[[], int]:
+    world, _ = populated(size, moving=True)
+    world.add_system(MoveSystem(world))
+
+    def run() -> int:
+        for _ in range(TICKS):
+            world.execute(1 / 60)
+        return TICKS * (size // 2)
+    return run
+
+
+CASES: Dict[str, Callable[[int], Callable[[], int]]] = {
+    'create_entities': create_entities,
+    'add_component': add_component,
+    'remove_component': remove_component,
+    'query_single': query_single,
+    'query_multi': query_multi,
+    'delete_entities': delete_entities,
+    'execute': execute,
+}
+
+
+def measure(case: Callable[[int], Callable[[], int]], size: int, repeat: int) -> Dict[str, float]:
+    best = float('inf')
+    operations = 0
+    total = 0.0
+    runs = 0
+    while runs < repeat or total < MIN_TIME:
+        run = case(size)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            operations = run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+
+    run = case(size)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'ops_per_sec': operations / best, 'peak_bytes': peak}
+
+
+def run_benchmarks(sizes: Tuple[int, ...], repeat: int, cases: List[str]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name in cases:
+        for size in sizes:
+            results[f'{name}[{size}]'] = measure(CASES[name], size, repeat)
+    return results
+
+
+def regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    failures = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+
+        ratio = result['ops_per_sec'] / expected['ops_per_sec']
+        if ratio < 1 - threshold:
+            failures.append(f'{key}: {result["ops_per_sec"]:,.0f} ops/s is {1 - ratio:.0%} below baseline {expected["ops_per_sec"]:,.0f} ops/s')
+
+        growth = result['peak_bytes'] / expected['peak_bytes'] - 1 if expected['peak_bytes'] else 0.0
+        if growth > threshold:
+            failures.append(f'{key}: peak {result["peak_bytes"] / 1024:,.1f} KiB is {growth:.0%} above baseline {expected["peak_bytes"] / 1024:,.1f} KiB')
+    return failures
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> str:
+    lines = ['\t'.join(['benchmark', 'ops/s', 'peak KiB', 'vs baseline'])]
+    for key, result in results.items():
+        expected = baseline.get(key)
+        change = f'{result["ops_per_sec"] / expected["ops_per_sec"] - 1:+.1%}' if expected else '-'
+        lines.append('\t'.join([key, f'{result["ops_per_sec"]:,.0f}', f'{result["peak_bytes"] / 1024:,.1f}', change]))
+    return '\n'.join(lines)
+
+
+def main(arguments: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description='ECS micro-benchmarks, compared against a stored baseline',
+        epilog='The baseline holds absolute timings and is only meaningful on the machine that recorded it; regenerate it there with --save before comparing.',
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.3, help='allowed fraction below the baseline ops/s and above the baseline peak memory')
+    parser.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args(arguments)
+
+    results = run_benchmarks(tuple(args.sizes), args.repeat, args.cases)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print(report(results, baseline))
+
+    if args.save:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + '\n')
+        return 0
+
+    failures = regressions(results, baseline, args.threshold)
+    for failure in failures:
+        print(f'REGRESSION {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,19 +1,20 @@
-from ecs_framework.ecs import ComponentProtocol
+from dataclasses import dataclass
 
-
-class AttackTarget(ComponentProtocol):
-    entity: int
+from ecs_framework.ecs import Component
 
 
-class AttackTargetDirty(ComponentProtocol):
-    pass
+@dataclass(slots=True)
+class AttackTarget(Component):
+    entity: int
 
 
-class AttackCommand(ComponentProtocol):
+@dataclass(slots=True)
+class AttackCommand(Component):
     pass
 
 
-class CombatPreview(ComponentProtocol):
+@dataclass(slots=True)
+class CombatPreview(Component):
     attacker: int
     attack: int
     defender: int
@@ -21,17 +22,18 @@ class CombatPreview(ComponentProtocol):
     damage: int
 
 
-class CombatPreviewDirty(ComponentProtocol):
-    pass
-
-
-class AttackInstance(ComponentProtocol):
+@dataclass(slots=True)
+class AttackInstance:
+    entity: int
     attack: int
 
 
-class IncomingDamage(ComponentProtocol):
-    damage: int
+@dataclass(slots=True)
+class IncomingDamage:
+    entity: int
+    damage: float
 
 
-class MarkedForDeath(ComponentProtocol):
+@dataclass(slots=True)
+class MarkedForDeath(Component):
     pass
@@ -1,27 +1,42 @@
-from typing import List
+from dataclasses import dataclass
+from typing import ClassVar, List
 
-from ecs_framework.ecs import ComponentProtocol
+import numpy as np
+
+from ecs_framework.ecs import Component
+from ecs_framework.pool import PoolLayout, Scalar, Struct
 from model.hex_coordinate import HexCoordinate, VecF2
 from model.hex_map import HexCell
 
 
-class TargetGridPosition(ComponentProtocol):
+@dataclass(slots=True)
+class TargetGridPosition(Component):
     cell: HexCoordinate
 
 
-class PreviewPath(ComponentProtocol):
+@dataclass(slots=True)
+class PreviewPath(Component):
     path: List[HexCoordinate]
 
 
-class Path(ComponentProtocol):
+@dataclass(slots=True)
+class Path(Component):
     path: List[HexCell]
 
 
-class MoveCommand(ComponentProtocol):
+@dataclass(slots=True)
+class MoveCommand(Component):
     pass
 
 
-class MovementProgress(ComponentProtocol):
+@dataclass(slots=True)
+class MovementProgress(Component):
+    pool_layout: ClassVar[PoolLayout] = {
+        'origin': Struct(VecF2, ('x', 'y')),
+        'destination': Struct(VecF2, ('x', 'y')),
+        'cell': Struct(HexCoordinate, ('q', 'r'), np.int64),
+        'progress': Scalar(),
+    }
     origin: VecF2
     destination: VecF2
     cell: HexCoordinate
@@ -1,19 +1,24 @@
-from ecs_framework.ecs import ComponentProtocol
+from dataclasses import dataclass
+from typing import ClassVar
+
+from ecs_framework.ecs import Component
+from ecs_framework.pool import PoolLayout, Struct
 from model.hex_coordinate import HexCoordinate, VecF2
 
 
-class GridPosition(ComponentProtocol):
+@dataclass(slots=True)
+class GridPosition(Component):
     cell: HexCoordinate
 
 
-class GridPositionChanged(ComponentProtocol):
-    pass
-
-
-class WorldPosition(ComponentProtocol):
+@dataclass(slots=True)
+class WorldPosition(Component):
+    pool_layout: ClassVar[PoolLayout] = {'point': Struct(VecF2, ('x', 'y'))}
     point: VecF2
 
 
-class ScreenPosition(ComponentProtocol):
+@dataclass(slots=True)
+class ScreenPosition(Component):
+    pool_layout: ClassVar[PoolLayout] = {'point': Struct(VecF2, ('x', 'y'))}
     point: VecF2
 
@@ -1,4 +1,4 @@
-from typing import Dict, List, Protocol
+from typing import Dict, List, Protocol, get_type_hints
 
 
 class GlobalComponentRegistry:
@@ -20,6 +20,16 @@ class GlobalComponentRegistry:
     @classmethod
     def get_section(cls, name: str) -> Dict[str, callable]:
         return cls.component_builders.get(name, {})
+
+    @classmethod
+    def component_keys(cls) -> Dict[type, str]:
+        keys = {}
+        for section, builders in cls.component_builders.items():
+            for component, fn in builders.items():
+                component_type = get_type_hints(fn).get('return')
+                if isinstance(component_type, type):
+                    keys[component_type] = f'{section}/{component}'
+        return keys
     
 
 class ComponentRegistryProtocol(Protocol):
@@ -1,5 +1,8 @@
-from ecs_framework.ecs import ComponentProtocol
+from dataclasses import dataclass
 
+from ecs_framework.ecs import Component
 
-class RenderLayer(ComponentProtocol):
+
+@dataclass(slots=True)
+class RenderLayer(Component):
     z: int
@@ -1,11 +1,15 @@
+from dataclasses import dataclass
+
 from pygame import Surface
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
-class Sprite(ComponentProtocol):
+@dataclass(slots=True)
+class Sprite(Component):
     sprite: Surface
 
 
-class ScreenSprite(ComponentProtocol):
+@dataclass(slots=True)
+class ScreenSprite(Component):
     sprite: Surface
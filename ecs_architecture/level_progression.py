@@ -2,29 +2,29 @@ from dataclasses import dataclass
 import math
 
 from ecs_architecture.component.stats import HP, Attack, Defense
-from ecs_framework.ecs import ECS, ComponentProtocol, SystemProtocol
+from ecs_framework.ecs import ECS, Component, SystemProtocol
 
 
-@dataclass
-class XP(ComponentProtocol):
+@dataclass(slots=True)
+class XP(Component):
     current: int
     needed: int
     total: int
     growth: float
 
 
-@dataclass
-class XPGained(ComponentProtocol):
+@dataclass(slots=True)
+class XPGained(Component):
     amount: int
 
 
-@dataclass
-class Level(ComponentProtocol):
+@dataclass(slots=True)
+class Level(Component):
     current: int
 
 
-@dataclass
-class LevelUp(ComponentProtocol):
+@dataclass(slots=True)
+class LevelUp(Component):
     amount: int
 
 
@@ -1,103 +1,129 @@
-from ecs_architecture.component.combat import AttackCommand, AttackInstance, AttackTarget, AttackTargetDirty, CombatPreview, CombatPreviewDirty, IncomingDamage, MarkedForDeath
-from ecs_architecture.component.stats import HP, Attack, Defense
+import numpy as np
+
+from ecs_architecture.component.combat import AttackCommand, AttackInstance, AttackTarget, CombatPreview, IncomingDamage, MarkedForDeath
+from ecs_architecture.component.stats.attack import Attack
+from ecs_architecture.component.stats.defense import Defense
+from ecs_architecture.component.stats.hp import HP
 from ecs_framework.ecs import ECS, SystemProtocol
+from ecs_framework.pool import entity_slots
 
 
 class CombatSimulatorSystem(SystemProtocol):
 
+    reads = (AttackTarget, Attack, Defense)
+    writes = (CombatPreview,)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
+        self.query = ecs.query(AttackTarget)
+        self.last_run = 0
 
     def execute(self, delta_time: int):
-        for entity, _ in self.ecs.get_entities_with_single_component(AttackTargetDirty):
-            target = self.ecs.get_entity_component(entity, AttackTarget)
-
-            if target:
-                attack = self.ecs.get_entity_component(entity, Attack).base
-                defense = self.ecs.get_entity_component(target.entity, Defense).base
-                damage = attack - defense
-                self.ecs.add_component(entity, CombatPreview(entity, attack, target.entity, defense, damage))
-                self.ecs.add_component(entity, CombatPreviewDirty())
-
-            self.ecs.remove_component(entity, AttackTargetDirty)
+        commands = self.ecs.defer()
+        for entity, (target,) in self.query.changed(self.last_run):
+            attack = self.ecs.get_entity_component(entity, Attack).base
+            defense = self.ecs.get_entity_component(target.entity, Defense).base
+            damage = attack - defense
+            commands.add_component(entity, CombatPreview(entity, attack, target.entity, defense, damage))
 
 
 class CombatPreviewerSystem(SystemProtocol):
 
+    reads = (CombatPreview,)
+    writes = ()
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
+        self.query = ecs.query(CombatPreview)
+        self.last_run = 0
 
     def execute(self, delta_time):
-        for entity, _ in self.ecs.get_entities_with_single_component(CombatPreviewDirty):
-            combat_preview = self.ecs.get_entity_component(entity, CombatPreview)
-
-            if combat_preview:
-                print('Combat Preview')
-                print(f'Attacker: {combat_preview.attacker} ({combat_preview.attack})')
-                print(f'Defender: {combat_preview.defender} ({combat_preview.defense})')
-                print(f'Damage: {combat_preview.damage}')
-
-            self.ecs.remove_component(entity, CombatPreviewDirty)
+        for _, (combat_preview,) in self.query.changed(self.last_run):
+            print('Combat Preview')
+            print(f'Attacker: {combat_preview.attacker} ({combat_preview.attack})')
+            print(f'Defender: {combat_preview.defender} ({combat_preview.defense})')
+            print(f'Damage: {combat_preview.damage}')
 
 
 class AttackTriggerSystem(SystemProtocol):
 
+    reads = (AttackCommand, AttackTarget, Attack)
+    writes = (CombatPreview, AttackInstance, AttackCommand)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
 
     def execute(self, delta_time):
+        commands = self.ecs.defer()
         for entity, _ in self.ecs.get_entities_with_single_component(AttackCommand):
-            self.ecs.remove_component(entity, CombatPreview)
+            commands.remove_component(entity, CombatPreview)
             target = self.ecs.get_entity_component(entity, AttackTarget)
 
             if target:
                 attack = self.ecs.get_entity_component(entity, Attack).base
-                self.ecs.add_component(target.entity, AttackInstance(attack))
+                self.ecs.send(AttackInstance(target.entity, attack))
                 print(f'{entity} attacked {target.entity} with power {attack}')
 
-            self.ecs.remove_component(entity, AttackCommand)
+            commands.remove_component(entity, AttackCommand)
 
 
 class AttackResolutionSystem(SystemProtocol):
 
+    reads = (AttackInstance, Defense)
+    writes = (IncomingDamage,)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
+        self.attacks = ecs.reader(AttackInstance)
 
     def execute(self, delta_time):
-        for entity, attack_instance in self.ecs.get_entities_with_single_component(AttackInstance):
-            defense = self.ecs.get_entity_component(entity, Defense).base
+        for attack_instance in self.attacks.read():
+            entity = attack_instance.entity
+            defense = self.ecs.get_entity_component(entity, Defense)
+            if defense is None:
+                continue
 
-            damage = attack_instance.attack - defense
-            self.ecs.add_component(entity, IncomingDamage(damage))
-            print(f'{entity} blocked attack with power {attack_instance} with defense {defense} resulting in {damage} damage')
-
-            self.ecs.remove_component(entity, AttackInstance)
+            damage = attack_instance.attack - defense.base
+            self.ecs.send(IncomingDamage(entity, damage))
+            print(f'{entity} blocked attack with power {attack_instance.attack} with defense {defense.base} resulting in {damage} damage')
 
 
 class DamageApplicationSystem(SystemProtocol):
 
+    reads = (IncomingDamage, HP)
+    writes = (HP, MarkedForDeath)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
+        self.health = ecs.pool(HP)
+        self.incoming_damage = ecs.reader(IncomingDamage)
 
     def execute(self, delta_time):
-        for entity, incoming_damage in self.ecs.get_entities_with_single_component(IncomingDamage):
-            hp = self.ecs.get_entity_component(entity, HP)
+        damages = [damage for damage in self.incoming_damage.read() if self.ecs.entity_has_component(damage.entity, HP)]
+        if not damages:
+            return
 
-            hp.current -= incoming_damage.damage
-            print(f'{entity} took {incoming_damage.damage} damage. It is now with {hp.current} hp')
-            if hp.current <= 0:
-                self.ecs.add_component(entity, MarkedForDeath())
-                print(f'{entity} does not have hp')
+        commands = self.ecs.defer()
+        entities = list(dict.fromkeys(damage.entity for damage in damages))
+        current = self.health['current']
+        np.subtract.at(current, entity_slots([damage.entity for damage in damages]), np.fromiter((damage.damage for damage in damages), dtype=np.float64, count=len(damages)))
+        self.ecs.mark_changed_many(entities, HP)
 
-            self.ecs.remove_component(entity, IncomingDamage)
+        for index in np.flatnonzero(current[entity_slots(entities)] <= 0):
+            commands.add_component(entities[index], MarkedForDeath())
+            print(f'{entities[index]} does not have hp')
 
 
 class DeathSystem(SystemProtocol):
 
+    reads = (MarkedForDeath,)
+    writes = (MarkedForDeath,)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
 
     def execute(self, delta_time):
+        commands = self.ecs.defer()
         for entity, _ in self.ecs.get_entities_with_single_component(MarkedForDeath):
             print(f'{entity} died')
-            self.ecs.remove_component(entity, MarkedForDeath)
+            commands.remove_component(entity, MarkedForDeath)
@@ -1,9 +1,10 @@
-import math
-import time
+import numpy as np
 import pygame
+
 from ecs_architecture.component.path import MoveCommand, MovementProgress, Path, PreviewPath, TargetGridPosition
-from ecs_architecture.component.position import GridPosition, GridPositionChanged, WorldPosition
+from ecs_architecture.component.position import GridPosition, WorldPosition
 from ecs_framework.ecs import ECS, SystemProtocol
+from ecs_framework.pool import entity_slots
 from editor.hex_camera import HexCamera
 from model.hex_geometry import HexLayout
 from model.hex_map import HexMap
@@ -12,11 +13,15 @@ from pathfinding.pathfinding import PathfindingHelper
 
 class PathCalculatorSystem(SystemProtocol):
 
+    reads = (TargetGridPosition, GridPosition)
+    writes = (PreviewPath, TargetGridPosition)
+
     def __init__(self, ecs: ECS, hex_map: HexMap):
         self.ecs = ecs
         self.hex_map = hex_map
 
     def execute(self, delta_time: float):
+        commands = self.ecs.defer()
         for entity, destination in self.ecs.get_entities_with_single_component(TargetGridPosition):
             origin = self.ecs.get_entity_component(entity, GridPosition)
             path = []
@@ -25,13 +30,16 @@ class PathCalculatorSystem(SystemProtocol):
                 path = PathfindingHelper.astar(self.hex_map, origin.cell, destination.cell)
 
             if path:
-                self.ecs.add_component(entity, PreviewPath(path))
+                commands.add_component(entity, PreviewPath(path))
             
-            self.ecs.remove_component(entity, TargetGridPosition)
+            commands.remove_component(entity, TargetGridPosition)
 
 
 class PathPreviewerSystem(SystemProtocol):
 
+    reads = (PreviewPath,)
+    writes = (pygame.Surface,)
+
     def __init__(self, ecs: ECS, screen: pygame.Surface, layout: HexLayout, camera: HexCamera):
         self.ecs = ecs
         self.screen = screen
@@ -39,46 +47,59 @@ class PathPreviewerSystem(SystemProtocol):
         self.camera = camera
 
     def execute(self, delta_time: float):
+        viewport = self.screen.get_clip()
         for _, preview_path in self.ecs.get_entities_with_single_component(PreviewPath):
-            coordinates = []
-            for cell in preview_path.path:
-                hex_center = self.layout.hex_to_point(cell.coordinate)
-                screen_point = self.camera.world_to_screen(hex_center)
-                coordinates.append(screen_point.as_tuple)
-            for index in range(len(coordinates)-1):
-                pygame.draw.line(self.screen, pygame.Color('blue'), coordinates[index], coordinates[index+1], 2)
+            if len(preview_path.path) < 2:
+                continue
+
+            coordinates = np.array([(cell.coordinate.q, cell.coordinate.r) for cell in preview_path.path])
+            points = self.camera.world_to_screen_points(self.layout.hexes_to_points(coordinates))
+            starts, ends = points[:-1], points[1:]
+            low = np.minimum(starts, ends)
+            high = np.maximum(starts, ends)
+            visible = (high[:, 0] >= viewport.left) & (low[:, 0] <= viewport.right) & (high[:, 1] >= viewport.top) & (low[:, 1] <= viewport.bottom)
+            for start, end in zip(starts[visible].tolist(), ends[visible].tolist()):
+                pygame.draw.line(self.screen, pygame.Color('blue'), start, end, 2)
 
 
 class StartMovementSystem(SystemProtocol):
 
+    reads = (MoveCommand, PreviewPath)
+    writes = (Path, PreviewPath, MoveCommand)
+
     def __init__(self, ecs: ECS):
         self.ecs = ecs
 
     def execute(self, delta_time: float):
+        commands = self.ecs.defer()
         for entity, _ in self.ecs.get_entities_with_single_component(MoveCommand):
 
             preview_path = self.ecs.get_entity_component(entity, PreviewPath)
 
             if preview_path is not None:
                 path = Path(preview_path.path)
-                self.ecs.add_component(entity, path)
-                self.ecs.remove_component(entity, PreviewPath)
+                commands.add_component(entity, path)
+                commands.remove_component(entity, PreviewPath)
 
-            self.ecs.remove_component(entity, MoveCommand)
+            commands.remove_component(entity, MoveCommand)
 
 class PathStepperSystem(SystemProtocol):
 
+    reads = (GridPosition, Path, MovementProgress)
+    writes = (Path, MovementProgress)
+
     def __init__(self, ecs: ECS, layout: HexLayout):
         self.ecs = ecs
         self.layout = layout
 
     def execute(self, delta_time: float):
+        commands = self.ecs.defer()
         for entity, (grid_position, path) in self.ecs.get_entities_with_components(GridPosition, Path):
             if self.ecs.has_component(MovementProgress) and self.ecs.entity_has_component(entity, MovementProgress):
                 continue
 
             if not path.path:
-                self.ecs.remove_component(entity, Path)
+                commands.remove_component(entity, Path)
                 continue
 
             next_cell = path.path.pop()
@@ -86,30 +107,46 @@ class PathStepperSystem(SystemProtocol):
                 continue
 
             movement_progress = MovementProgress(self.layout.hex_to_point(grid_position.cell), self.layout.hex_to_point(next_cell.coordinate), next_cell.coordinate)
-            self.ecs.add_component(entity, movement_progress)
+            commands.add_component(entity, movement_progress)
 
 
 class MovementSystem(SystemProtocol):
 
+    reads = (MovementProgress, WorldPosition)
+    writes = (WorldPosition, GridPosition, MovementProgress)
+
     def __init__(self, ecs: ECS, layout: HexLayout, speed: int):
         self.ecs = ecs
         self.layout = layout
         self.speed = speed
+        self.progress = ecs.pool(MovementProgress)
+        self.positions = ecs.pool(WorldPosition)
+        self.query = ecs.query(MovementProgress, WorldPosition)
     
     def execute(self, delta_time: float):
-        for entity, (movement_progress, world_position) in self.ecs.get_entities_with_components(MovementProgress, WorldPosition):
-
-            step = self.speed * delta_time
-            direction = movement_progress.destination - movement_progress.origin
-            length = math.hypot(*direction.as_tuple)
-            normal_vector = direction / length
-
-            world_position.point = world_position.point + normal_vector * step
-
-            distance = math.hypot(*(movement_progress.destination - world_position.point).as_tuple)
-
-            if distance == 0 or step >= distance:
-                self.ecs.add_component(entity, GridPosition(movement_progress.cell))
-                self.ecs.add_component(entity, GridPositionChanged())
-                self.ecs.remove_component(entity, MovementProgress)
-            
\ No newline at end of file
+        entities = self.query.entities()
+        if not entities:
+            return
+
+        slots = entity_slots(entities)
+        step = self.speed * delta_time
+        destination_x = self.progress['destination_x'][slots]
+        destination_y = self.progress['destination_y'][slots]
+        direction_x = destination_x - self.progress['origin_x'][slots]
+        direction_y = destination_y - self.progress['origin_y'][slots]
+        length = np.hypot(direction_x, direction_y)
+
+        x = self.positions['point_x']
+        y = self.positions['point_y']
+        x[slots] += direction_x / length * step
+        y[slots] += direction_y / length * step
+        self.ecs.mark_changed_many(entities, WorldPosition)
+
+        distance = np.hypot(destination_x - x[slots], destination_y - y[slots])
+
+        commands = self.ecs.defer()
+        for index in np.flatnonzero((distance == 0) | (step >= distance)):
+            entity = entities[index]
+            movement_progress = self.ecs.get_entity_component(entity, MovementProgress)
+            commands.add_component(entity, GridPosition(movement_progress.cell))
+            commands.remove_component(entity, MovementProgress)
@@ -1,63 +1,154 @@
-import math
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
 import pygame
-from ecs_architecture.component.position import GridPosition, GridPositionChanged, ScreenPosition, WorldPosition
+
+from ecs_architecture.component.position import GridPosition, ScreenPosition, WorldPosition
 #from ecs_architecture.component.render_layer import RenderLayer
 from ecs_architecture.component.sprite import ScreenSprite, Sprite
 from ecs_framework.ecs import ECS, SystemProtocol
+from ecs_framework.pool import entity_slots
 from editor.hex_camera import HexCamera
-from model.hex_coordinate import VecF2
 from model.hex_geometry import HexLayout
 
 
 class SyncGridToWorldPositionSystem(SystemProtocol):
 
+    reads = (GridPosition,)
+    writes = (WorldPosition,)
+
     def __init__(self, ecs: ECS, layout: HexLayout):
         self.ecs = ecs
         self.layout = layout
+        self.query = ecs.query(GridPosition)
+        self.last_run = 0
 
     def execute(self, delta_time: float):
-        for entity, (grid_position, _) in self.ecs.get_entities_with_components(GridPosition, GridPositionChanged):
+        commands = self.ecs.defer()
+        for entity, (grid_position,) in self.query.changed(self.last_run):
             world_center = self.layout.hex_to_point(grid_position.cell)
             world_position = WorldPosition(world_center)
 
-            self.ecs.add_component(entity, world_position)
-            self.ecs.remove_component(entity, GridPositionChanged)
+            commands.add_component(entity, world_position)
             
 
 class WorldToScreenPositionSystem(SystemProtocol):
 
+    reads = (WorldPosition, ScreenPosition)
+    writes = (ScreenPosition,)
+
     def __init__(self, ecs: ECS, camera: HexCamera):
         self.ecs = ecs
         self.camera = camera
+        self.world_positions = ecs.pool(WorldPosition)
+        self.screen_positions = ecs.pool(ScreenPosition)
+        self.positioned = ecs.query(WorldPosition)
+        self.query = ecs.query(WorldPosition, ScreenPosition)
 
     def execute(self, delta_time: float):
-        for entity, world_position in self.ecs.get_entities_with_single_component(WorldPosition):
-            screen_coordinates = self.camera.world_to_screen(world_position.point)
-            screen_position = ScreenPosition(screen_coordinates)
-            
-            self.ecs.add_component(entity, screen_position)
+        slots = self.query.slots()
+        zoom = self.camera.zoom
+        position = self.camera.position
+        self.screen_positions['point_x'][slots] = self.world_positions['point_x'][slots] * zoom + position.x
+        self.screen_positions['point_y'][slots] = self.world_positions['point_y'][slots] * zoom + position.y
+
+        if len(self.positioned) == len(self.query):
+            return
+
+        commands = self.ecs.defer()
+        for entity, world_position in self.positioned.single():
+            if not self.ecs.entity_has_component(entity, ScreenPosition):
+                screen_coordinates = self.camera.world_to_screen(world_position.point)
+                commands.add_component(entity, ScreenPosition(screen_coordinates))
+
+
+class ScaledSpriteCache:
+
+    def __init__(self, budget: int = 64 * 1024 * 1024, quantum: float = 0.01):
+        self.budget = budget
+        self.quantum = quantum
+        self.entries: OrderedDict[Tuple[pygame.Surface, int], pygame.Surface] = OrderedDict()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, sprite: pygame.Surface, zoom: float) -> pygame.Surface:
+        key = (sprite, round(zoom / self.quantum))
+        scaled = self.entries.get(key)
+        if scaled is not None:
+            self.entries.move_to_end(key)
+            return scaled
+
+        scaled = pygame.transform.scale_by(sprite, key[1] * self.quantum)
+        self.entries[key] = scaled
+        self.size += scaled.get_pitch() * scaled.get_height()
+        while self.size > self.budget and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= evicted.get_pitch() * evicted.get_height()
+        return scaled
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.size = 0
 
 
 class SpriteScalerSystem(SystemProtocol):
 
-    def __init__(self, ecs: ECS, camera: HexCamera):
+    reads = (Sprite, ScreenSprite)
+    writes = (ScreenSprite,)
+
+    def __init__(self, ecs: ECS, camera: HexCamera, cache: ScaledSpriteCache | None = None):
         self.ecs = ecs
         self.camera = camera
+        self.cache = cache or ScaledSpriteCache()
+        self.sprites = ecs.query(Sprite)
+        self.scaled = ecs.query(Sprite, ScreenSprite)
+        self.zoom = None
+        self.last_run = 0
 
     def execute(self, delta_time: float):
-        for entity, sprite in self.ecs.get_entities_with_single_component(Sprite):
-            screen_sprite = ScreenSprite(pygame.transform.scale_by(sprite.sprite, self.camera.zoom))
-            self.ecs.add_component(entity, screen_sprite)
+        zoom = self.camera.zoom
+        if zoom != self.zoom or len(self.scaled) != len(self.sprites):
+            self.zoom = zoom
+            rows = self.sprites.single()
+        else:
+            rows = [(entity, sprite) for entity, (sprite,) in self.sprites.changed(self.last_run)]
+
+        commands = self.ecs.defer()
+        for entity, sprite in rows:
+            scaled = self.cache.get(sprite.sprite, zoom)
+            screen_sprite = self.ecs.get_entity_component(entity, ScreenSprite)
+            if screen_sprite is None:
+                commands.add_component(entity, ScreenSprite(scaled))
+            else:
+                screen_sprite.sprite = scaled
 
 
 class RendererSystem(SystemProtocol):
 
+    reads = (ScreenPosition, ScreenSprite)
+    writes = (pygame.Surface,)
+
     def __init__(self, ecs: ECS, screen: pygame.Surface):
         self.ecs = ecs
         self.screen = screen
+        self.screen_positions = ecs.pool(ScreenPosition)
+        self.query = ecs.query(ScreenPosition, ScreenSprite)
 
     def execute(self, delta_time: float):
-        for _, (screen_position, sprite) in self.ecs.get_entities_with_components(ScreenPosition, ScreenSprite):
-            adjusted_cell_position = screen_position.point - VecF2(*sprite.sprite.get_size()) / 2
-            self.screen.blit(sprite.sprite, adjusted_cell_position.as_tuple)
-            
\ No newline at end of file
+        rows = self.query.rows()
+        if not rows:
+            return
+
+        sprites = [screen_sprite.sprite for _, (_, screen_sprite) in rows]
+        slots = entity_slots([entity for entity, _ in rows])
+        x = self.screen_positions['point_x'][slots]
+        y = self.screen_positions['point_y'][slots]
+        half_width, half_height = np.array([sprite.get_size() for sprite in sprites], dtype=np.float64).T / 2
+        viewport = self.screen.get_clip()
+        visible = (x + half_width > viewport.left) & (x - half_width < viewport.right) & (y + half_height > viewport.top) & (y - half_height < viewport.bottom)
+
+        for index in np.flatnonzero(visible).tolist():
+            self.screen.blit(sprites[index], (x[index] - half_width[index], y[index] - half_height[index]))
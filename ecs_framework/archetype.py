@@ -0,0 +1,118 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class Archetype:
+
+    def __init__(self, component_types: Tuple[type, ...]):
+        self.component_types = component_types
+        self.signature = frozenset(component_types)
+        self.entities: List[int] = []
+        self.rows: Dict[int, int] = {}
+        self.columns: Dict[type, List[Any]] = {component_type: [] for component_type in component_types}
+        self.ticks: Dict[type, List[int]] = {component_type: [] for component_type in component_types}
+        self.last_change = 0
+        self.add_edges: Dict[type, 'Archetype'] = {}
+        self.remove_edges: Dict[type, 'Archetype'] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.rows
+
+    def column(self, component_type: type) -> List[Any]:
+        return self.columns[component_type]
+
+    def load(self, entities: List[int], columns: Dict[type, List[Any]], tick: int) -> None:
+        self.entities = list(entities)
+        self.rows = {entity_id: row for row, entity_id in enumerate(self.entities)}
+        self.columns = dict(columns)
+        self.ticks = {component_type: [tick] * len(self.entities) for component_type in self.columns}
+        self.last_change = tick
+
+    def get(self, entity_id: int, component_type: type) -> Any:
+        return self.columns[component_type][self.rows[entity_id]]
+
+    def set(self, entity_id: int, component_type: type, component: Any, tick: int) -> None:
+        row = self.rows[entity_id]
+        self.columns[component_type][row] = component
+        self.ticks[component_type][row] = tick
+        self.last_change = max(self.last_change, tick)
+
+    def get_tick(self, entity_id: int, component_type: type) -> int:
+        return self.ticks[component_type][self.rows[entity_id]]
+
+    def set_tick(self, entity_id: int, component_type: type, tick: int) -> None:
+        self.ticks[component_type][self.rows[entity_id]] = tick
+        self.last_change = max(self.last_change, tick)
+
+    def components(self, entity_id: int) -> Dict[type, Any]:
+        row = self.rows[entity_id]
+        return {component_type: column[row] for component_type, column in self.columns.items()}
+
+    def component_ticks(self, entity_id: int) -> Dict[type, int]:
+        row = self.rows[entity_id]
+        return {component_type: ticks[row] for component_type, ticks in self.ticks.items()}
+
+    def append(self, entity_id: int, components: Dict[type, Any], ticks: Dict[type, int]) -> None:
+        self.rows[entity_id] = len(self.entities)
+        self.entities.append(entity_id)
+        for component_type, column in self.columns.items():
+            column.append(components[component_type])
+            tick = ticks[component_type]
+            self.ticks[component_type].append(tick)
+            self.last_change = max(self.last_change, tick)
+
+    def pop(self, entity_id: int) -> Tuple[Dict[type, Any], Dict[type, int]]:
+        row = self.rows.pop(entity_id)
+        last = len(self.entities) - 1
+
+        components = {}
+        ticks = {}
+        for component_type, column in self.columns.items():
+            components[component_type] = column[row]
+            column[row] = column[last]
+            column.pop()
+            tick_column = self.ticks[component_type]
+            ticks[component_type] = tick_column[row]
+            tick_column[row] = tick_column[last]
+            tick_column.pop()
+
+        moved_entity = self.entities.pop()
+        if row != last:
+            self.entities[row] = moved_entity
+            self.rows[moved_entity] = row
+        return components, ticks
+
+    def clear(self) -> None:
+        self.entities.clear()
+        self.rows.clear()
+        self.columns = {component_type: [] for component_type in self.component_types}
+        self.ticks = {component_type: [] for component_type in self.component_types}
+        self.last_change = 0
+
+
+class ComponentTable(Mapping):
+
+    def __init__(self, component_type: type, locations: Dict[int, Archetype]):
+        self.component_type = component_type
+        self.archetypes: List[Archetype] = []
+        self._locations = locations
+
+    def __getitem__(self, entity_id: int) -> Any:
+        archetype = self._locations.get(entity_id)
+        if archetype is None or self.component_type not in archetype.signature:
+            raise KeyError(entity_id)
+        return archetype.get(entity_id, self.component_type)
+
+    def __contains__(self, entity_id: object) -> bool:
+        archetype = self._locations.get(entity_id)
+        return archetype is not None and self.component_type in archetype.signature
+
+    def __iter__(self) -> Iterator[int]:
+        for archetype in self.archetypes:
+            yield from archetype.entities
+
+    def __len__(self) -> int:
+        return sum(len(archetype) for archetype in self.archetypes)
@@ -0,0 +1,65 @@
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+from ecs_framework.pool import component_type_of
+
+if TYPE_CHECKING:
+    from ecs_framework.ecs import ECS
+
+
+class Command(Enum):
+    ADD_COMPONENT = 0
+    REMOVE_COMPONENT = 1
+    DELETE_ENTITY = 2
+
+
+REMOVED = object()
+
+
+class CommandBuffer:
+
+    def __init__(self, world: 'ECS'):
+        self.world = world
+        self.commands: List[Tuple[Command, int, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def add_component(self, entity_id: int, component: Any) -> None:
+        self.commands.append((Command.ADD_COMPONENT, entity_id, component))
+
+    def remove_component(self, entity_id: int, component_type: type) -> None:
+        self.commands.append((Command.REMOVE_COMPONENT, entity_id, component_type))
+
+    def delete_entity(self, entity_id: int) -> None:
+        self.commands.append((Command.DELETE_ENTITY, entity_id, None))
+
+    def clear(self) -> None:
+        self.commands.clear()
+
+    def apply(self) -> None:
+        if not self.commands:
+            return
+
+        commands = self.commands
+        self.commands = []
+
+        changes: Dict[int, Dict[type, Any]] = {}
+        deleted: Set[int] = set()
+        for command, entity_id, payload in commands:
+            if entity_id in deleted:
+                continue
+
+            if command == Command.ADD_COMPONENT:
+                changes.setdefault(entity_id, {})[component_type_of(payload)] = payload
+            elif command == Command.REMOVE_COMPONENT:
+                changes.setdefault(entity_id, {})[payload] = REMOVED
+            elif command == Command.DELETE_ENTITY:
+                changes.pop(entity_id, None)
+                deleted.add(entity_id)
+
+        for entity_id in deleted:
+            self.world.delete_entity(entity_id)
+
+        for entity_id, entity_changes in changes.items():
+            self.world.apply_changes(entity_id, entity_changes)
@@ -1,13 +1,39 @@
-from itertools import count
-from typing import Any, Dict, Generator, List, Protocol, Set, Tuple
+import copy
+from typing import Any, Dict, FrozenSet, Generator, Iterable, List, Protocol, Self, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from ecs_framework.archetype import Archetype, ComponentTable
+from ecs_framework.command_buffer import REMOVED, CommandBuffer
+from ecs_framework.entity import EntityAllocator, entity_slot
+from ecs_framework.events import EventChannel, EventReader
+from ecs_framework.pool import ComponentPool, PooledComponent, PoolLayout, component_type_of
+from ecs_framework.profiler import Profiler
+from ecs_framework.query import Query
+from ecs_framework.scheduler import Scheduler
+from ecs_framework.snapshot import ArchetypeState, PoolState, WorldSnapshot, clone_component
 
 
 class ComponentProtocol(BaseModel):
     ...
 
 
+_component_adapters: Dict[type, TypeAdapter] = {}
+
+
+class Component:
+    __slots__ = ()
+    __pydantic_config__ = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def validate(cls, **kwargs: Any) -> Self:
+        adapter = _component_adapters.get(cls)
+        if adapter is None:
+            adapter = TypeAdapter(cls)
+            _component_adapters[cls] = adapter
+        return adapter.validate_python(kwargs)
+
+
 class SystemProtocol(Protocol):
 
     def execute(self, delta_time: float) -> None:
@@ -16,23 +42,53 @@ class SystemProtocol(Protocol):
 
 class ECS:
 
-    def __init__(self) -> None:
-        self._next_entity_id = count()
-        self.entities: Set[int] = set()
-        self.world: Dict[type, Dict[int, ComponentProtocol]] = {}
+    def __init__(self, workers: int = 1) -> None:
+        self.entities = EntityAllocator()
+        self.world: Dict[type, ComponentTable] = {}
+        self.archetypes: Dict[FrozenSet[type], Archetype] = {}
+        self.locations: Dict[int, Archetype] = {}
+        self.queries: Dict[Tuple[type, ...], Query] = {}
+        self.pools: Dict[type, ComponentPool] = {}
+        self.channels: Dict[type, EventChannel] = {}
+        self.resources: Dict[type, Any] = {}
+        self.command_buffer = CommandBuffer(self)
+        self.root = self._get_archetype(())
         self.systems: list = []
+        self.scheduler = Scheduler(self.systems, workers)
+        self.profiler: Profiler | None = None
+        self.tick = 1
         self.running = True
 
     def reset(self) -> None:
         self.entities.clear()
         self.world.clear()
+        self.archetypes.clear()
+        self.locations.clear()
+        for query in self.queries.values():
+            query.clear()
+        for pool in self.pools.values():
+            pool.clear()
+        for channel in self.channels.values():
+            channel.clear()
+        self.resources.clear()
+        self.command_buffer.clear()
+        self.root = self._get_archetype(())
         self.systems.clear()
+        self.scheduler.invalidate()
+        self.scheduler.shutdown()
 
     def has_entity(self, entity_id: int) -> bool:
         return entity_id in self.entities
     
     def entity_has_component(self, entity_id: int, component_type: type) -> bool:
-        return self.has_component(component_type) and entity_id in self.world[component_type]
+        archetype = self.locations.get(entity_id)
+        return archetype is not None and component_type in archetype.signature
+
+    def get_entity_signature(self, entity_id: int) -> FrozenSet[type]:
+        archetype = self.locations.get(entity_id)
+        if archetype is None:
+            return None
+        return archetype.signature
 
     def has_component(self, component_type: type) -> bool:
         return component_type in self.world
@@ -41,77 +97,289 @@ class ECS:
         return system in self.systems
 
     def create_entity(self) -> int:
-        entity_id = next(self._next_entity_id)
-        self.entities.add(entity_id)
+        entity_id = self.entities.create()
+        self.root.append(entity_id, {}, {})
+        self.locations[entity_id] = self.root
         return entity_id
     
     def delete_entity(self, entity_id: int) -> None:
         if not self.has_entity(entity_id):
             return
         
-        self.entities.remove(entity_id)
-        for component in self.world.values():
-            if entity_id in component:
-                component.pop(entity_id)
+        self.entities.destroy(entity_id)
+        archetype = self.locations.pop(entity_id)
+        archetype.pop(entity_id)
+        if self.pools:
+            for component_type in archetype.signature & self.pools.keys():
+                self.pools[component_type].remove(entity_slot(entity_id))
 
     def add_component(self, entity_id: int, component: ComponentProtocol) -> None:
         if not self.has_entity(entity_id):
             return
 
-        component_type = type(component)
-        if component_type not in self.world:
-            self.world[component_type] = {}
-            
-        self.world[component_type][entity_id] = component
+        component_type = component_type_of(component)
+        pool = self.pools.get(component_type)
+        if pool is not None:
+            component = pool.write(entity_slot(entity_id), component)
+
+        archetype = self.locations[entity_id]
+        if component_type in archetype.signature:
+            archetype.set(entity_id, component_type, component, self.tick)
+            return
+
+        target = archetype.add_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype((*archetype.component_types, component_type))
+            archetype.add_edges[component_type] = target
+            target.remove_edges[component_type] = archetype
+
+        components, ticks = archetype.pop(entity_id)
+        components[component_type] = component
+        ticks[component_type] = self.tick
+        self._move(entity_id, target, components, ticks)
 
     def remove_component(self, entity_id: int, component_type: type) -> None:
         if self.get_entity_component(entity_id, component_type) is None:
             return
         
-        self.world[component_type].pop(entity_id)
+        archetype = self.locations[entity_id]
+        target = archetype.remove_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype(tuple(other for other in archetype.component_types if other != component_type))
+            archetype.remove_edges[component_type] = target
+            target.add_edges[component_type] = archetype
+
+        components, ticks = archetype.pop(entity_id)
+        components.pop(component_type)
+        ticks.pop(component_type)
+        self._move(entity_id, target, components, ticks)
+
+        pool = self.pools.get(component_type)
+        if pool is not None:
+            pool.remove(entity_slot(entity_id))
+
+    def apply_changes(self, entity_id: int, changes: Dict[type, ComponentProtocol]) -> None:
+        if not self.has_entity(entity_id):
+            return
+
+        archetype = self.locations[entity_id]
+        components = archetype.components(entity_id)
+        ticks = archetype.component_ticks(entity_id)
+        for component_type, component in changes.items():
+            pool = self.pools.get(component_type)
+            if component is REMOVED:
+                ticks.pop(component_type, None)
+                if components.pop(component_type, None) is not None and pool is not None:
+                    pool.remove(entity_slot(entity_id))
+            else:
+                if pool is not None:
+                    component = pool.write(entity_slot(entity_id), component)
+                components[component_type] = component
+                ticks[component_type] = self.tick
+
+        if components.keys() == archetype.signature:
+            for component_type, component in changes.items():
+                if component is not REMOVED:
+                    archetype.set(entity_id, component_type, components[component_type], self.tick)
+            return
+
+        archetype.pop(entity_id)
+        self._move(entity_id, self._get_archetype(tuple(components)), components, ticks)
+
+    def mark_changed(self, entity_id: int, component_type: type) -> None:
+        archetype = self.locations.get(entity_id)
+        if archetype is None or component_type not in archetype.signature:
+            return
+
+        archetype.set_tick(entity_id, component_type, self.tick)
+
+    def mark_changed_many(self, entity_ids: Iterable[int], component_type: type) -> None:
+        for entity_id in entity_ids:
+            self.mark_changed(entity_id, component_type)
+
+    def is_changed(self, entity_id: int, component_type: type, tick: int) -> bool:
+        archetype = self.locations.get(entity_id)
+        if archetype is None or component_type not in archetype.signature:
+            return False
+
+        return archetype.get_tick(entity_id, component_type) > tick
+
+    def add_pool(self, component_type: type, layout: PoolLayout | None = None) -> ComponentPool:
+        pool = self.pools.get(component_type)
+        if pool is not None:
+            return pool
+
+        pool = ComponentPool(component_type, layout if layout is not None else getattr(component_type, 'pool_layout', None))
+        self.pools[component_type] = pool
+        self._fill_pool(pool)
+        return pool
+
+    def pool(self, component_type: type) -> ComponentPool:
+        pool = self.pools.get(component_type)
+        if pool is None:
+            raise KeyError(f'No pool registered for {component_type.__name__}; call add_pool during world setup')
+        return pool
+
+    def insert_resource(self, resource: Any) -> None:
+        self.resources[type(resource)] = resource
+
+    def resource(self, resource_type: type) -> Any:
+        return self.resources.get(resource_type)
+
+    def has_resource(self, resource_type: type) -> bool:
+        return resource_type in self.resources
+
+    def remove_resource(self, resource_type: type) -> Any:
+        return self.resources.pop(resource_type, None)
+
+    def add_channel(self, event_type: type) -> EventChannel:
+        channel = self.channels.get(event_type)
+        if channel is None:
+            channel = EventChannel(event_type)
+            self.channels[event_type] = channel
+        return channel
+
+    def channel(self, event_type: type) -> EventChannel:
+        return self.channels.get(event_type)
+
+    def reader(self, event_type: type) -> EventReader:
+        return EventReader(self.add_channel(event_type))
+
+    def send(self, event: Any) -> None:
+        self.add_channel(type(event)).send(event)
+
+    def snapshot(self) -> WorldSnapshot:
+        archetypes = [
+            ArchetypeState(archetype.component_types, list(archetype.entities), {
+                component_type: self._clone_column(component_type, column) for component_type, column in archetype.columns.items()
+            })
+            for archetype in self.archetypes.values() if archetype.entities
+        ]
+        pools = {component_type: PoolState(pool.layout, *pool.copy_columns()) for component_type, pool in self.pools.items()}
+        return WorldSnapshot(self.entities.copy(), self.tick, archetypes, pools)
+
+    def restore(self, snapshot: WorldSnapshot, copy: bool = True) -> None:
+        self.command_buffer.clear()
+        for channel in self.channels.values():
+            channel.clear()
+        self.entities = snapshot.entities.copy()
+        self.tick = max(self.tick, snapshot.tick) + 1
+        self.locations.clear()
+        for archetype in self.archetypes.values():
+            archetype.clear()
+
+        for pool in self.pools.values():
+            pool.clear()
+        for component_type, state in snapshot.pools.items():
+            self.add_pool(component_type, state.layout).load_columns(state.columns, state.present)
+
+        for state in snapshot.archetypes:
+            archetype = self._get_archetype(state.component_types)
+            columns = {
+                component_type: self._clone_column(component_type, column) if copy or component_type in self.pools else column
+                for component_type, column in state.columns.items()
+            }
+            archetype.load(state.entities, columns, self.tick)
+            self.locations.update(dict.fromkeys(state.entities, archetype))
+
+        for component_type, pool in self.pools.items():
+            if component_type not in snapshot.pools:
+                self._fill_pool(pool)
+
+    def fork(self, resources: Iterable[Any] | None = None) -> 'ECS':
+        world = ECS(self.scheduler.workers)
+        if resources is None:
+            resources = [copy.deepcopy(resource) for resource in self.resources.values()]
+        for resource in resources:
+            world.insert_resource(resource)
+        world.restore(self.snapshot(), copy=False)
+        return world
+
+    def defer(self) -> CommandBuffer:
+        return self.command_buffer
+
+    def flush(self) -> None:
+        self.command_buffer.apply()
 
     def get_entity_component(self, entity_id: int, component_type: type) -> ComponentProtocol:
-        if not self.has_component(component_type):
-            return None
-        
-        if not self.entity_has_component(entity_id, component_type):
+        archetype = self.locations.get(entity_id)
+        if archetype is None or component_type not in archetype.signature:
             return None
-        
-        return self.world[component_type][entity_id]
+
+        return archetype.get(entity_id, component_type)
 
     def get_all_entity_components(self, entity_id: int) -> List[ComponentProtocol]:
-        if not self.has_entity(entity_id):
+        archetype = self.locations.get(entity_id)
+        if archetype is None:
             return None
-        
-        entity_components = []
-        for component in self.world.keys():
-            entity_components.append(self.get_entity_component(entity_id, component))
-        return entity_components
 
-    def get_entities_with(self, *component_types) -> List[int]:
-        if not component_types:
-            return []
+        return list(archetype.components(entity_id).values())
 
-        eligible_entities = {}
-        for component_type in component_types:
-            if not self.has_component(component_type):
-                return []
-            
-            eligible_entities[component_type] = set(self.world[component_type].keys())
+    def query(self, *component_types) -> Query:
+        query = self.queries.get(component_types)
+        if query is None:
+            query = Query(component_types)
+            for archetype in self.archetypes.values():
+                query.register(archetype)
+            self.queries[component_types] = query
+        return query
 
-        return list(set.intersection(*eligible_entities.values()))
+    def get_entities_with(self, *component_types) -> List[int]:
+        return self.query(*component_types).entities()
 
     def get_entities_with_single_component(self, component_type) -> Generator[int, ComponentProtocol]:
-        for entity in self.get_entities_with(component_type):
-            yield entity, self.get_entity_component(entity, component_type)
+        yield from self.query(component_type).single()
 
     def get_entities_with_components(self, *component_types) -> Generator[int, Tuple[ComponentProtocol]]:
-        for entity in self.get_entities_with(*component_types):
-            yield entity, (self.get_entity_component(entity, component) for component in component_types)
+        yield from self.query(*component_types).rows()
 
     def add_system(self, system: Any) -> None:
         self.systems.append(system)
+        self.scheduler.invalidate()
+
+    @property
+    def stages(self) -> List[List[Any]]:
+        return self.scheduler.stages
 
     def execute(self, delta_time: float) -> None:
-        for system in self.systems:
-            system.execute(delta_time)
+        self.scheduler.run(self, delta_time)
+        for channel in self.channels.values():
+            channel.update()
+
+    def _get_archetype(self, component_types: Tuple[type, ...]) -> Archetype:
+        signature = frozenset(component_types)
+        archetype = self.archetypes.get(signature)
+        if archetype is not None:
+            return archetype
+
+        for component_type in component_types:
+            if component_type not in self.world:
+                self.world[component_type] = ComponentTable(component_type, self.locations)
+
+        archetype = Archetype(tuple(component_type for component_type in self.world if component_type in signature))
+        self.archetypes[signature] = archetype
+        for component_type in signature:
+            self.world[component_type].archetypes.append(archetype)
+        for query in self.queries.values():
+            query.register(archetype)
+        return archetype
+
+    def _clone_column(self, component_type: type, column: List[ComponentProtocol]) -> List[ComponentProtocol]:
+        pool = self.pools.get(component_type)
+        if pool is not None:
+            return [pool.view(component.slot) if isinstance(component, PooledComponent) else clone_component(component) for component in column]
+        return [clone_component(component) for component in column]
+
+    def _fill_pool(self, pool: ComponentPool) -> None:
+        table = self.world.get(pool.component_type)
+        if table is None:
+            return
+
+        for archetype in table.archetypes:
+            column = archetype.column(pool.component_type)
+            for row, entity_id in enumerate(archetype.entities):
+                column[row] = pool.write(entity_slot(entity_id), column[row])
+
+    def _move(self, entity_id: int, target: Archetype, components: Dict[type, ComponentProtocol], ticks: Dict[type, int]) -> None:
+        target.append(entity_id, components, ticks)
+        self.locations[entity_id] = target
@@ -0,0 +1,81 @@
+from typing import Iterator, List
+
+SLOT_BITS = 32
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+
+def entity_slot(entity_id: int) -> int:
+    return entity_id & SLOT_MASK
+
+
+def entity_generation(entity_id: int) -> int:
+    return entity_id >> SLOT_BITS
+
+
+def make_entity(slot: int, generation: int) -> int:
+    return (generation << SLOT_BITS) | slot
+
+
+class EntityAllocator:
+
+    def __init__(self):
+        self.generations: List[int] = []
+        self.alive = bytearray()
+        self.free_slots: List[int] = []
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, entity_id: object) -> bool:
+        return isinstance(entity_id, int) and self.is_alive(entity_id)
+
+    def __iter__(self) -> Iterator[int]:
+        for slot, alive in enumerate(self.alive):
+            if alive:
+                yield make_entity(slot, self.generations[slot])
+
+    @property
+    def capacity(self) -> int:
+        return len(self.generations)
+
+    def create(self) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.generations)
+            self.generations.append(0)
+            self.alive.append(0)
+
+        self.alive[slot] = 1
+        self.count += 1
+        return make_entity(slot, self.generations[slot])
+
+    def destroy(self, entity_id: int) -> bool:
+        if not self.is_alive(entity_id):
+            return False
+
+        slot = entity_slot(entity_id)
+        self.alive[slot] = 0
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+        self.count -= 1
+        return True
+
+    def is_alive(self, entity_id: int) -> bool:
+        slot = entity_slot(entity_id)
+        return slot < len(self.generations) and self.alive[slot] == 1 and self.generations[slot] == entity_generation(entity_id)
+
+    def copy(self) -> 'EntityAllocator':
+        allocator = EntityAllocator()
+        allocator.generations = list(self.generations)
+        allocator.alive = bytearray(self.alive)
+        allocator.free_slots = list(self.free_slots)
+        allocator.count = self.count
+        return allocator
+
+    def clear(self) -> None:
+        self.generations.clear()
+        self.alive.clear()
+        self.free_slots.clear()
+        self.count = 0
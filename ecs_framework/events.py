@@ -0,0 +1,62 @@
+from typing import Generic, Iterable, List, TypeVar
+
+T = TypeVar('T')
+
+
+class EventChannel(Generic[T]):
+
+    def __init__(self, event_type: type):
+        self.event_type = event_type
+        self.previous: List[T] = []
+        self.current: List[T] = []
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.previous) + len(self.current)
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self)
+
+    def send(self, event: T) -> None:
+        self.current.append(event)
+
+    def extend(self, events: Iterable[T]) -> None:
+        self.current.extend(events)
+
+    def events(self) -> List[T]:
+        return self.previous + self.current
+
+    def read(self, cursor: int) -> List[T]:
+        first = max(cursor - self.start, 0)
+        if first >= len(self.previous):
+            return self.current[first - len(self.previous):]
+        return self.previous[first:] + self.current
+
+    def update(self) -> None:
+        self.start += len(self.previous)
+        self.previous = self.current
+        self.current = []
+
+    def clear(self) -> None:
+        self.start = self.end
+        self.previous = []
+        self.current = []
+
+
+class EventReader(Generic[T]):
+
+    def __init__(self, channel: EventChannel[T]):
+        self.channel = channel
+        self.cursor = channel.start
+
+    def __len__(self) -> int:
+        return self.channel.end - max(self.cursor, self.channel.start)
+
+    def read(self) -> List[T]:
+        events = self.channel.read(self.cursor)
+        self.cursor = self.channel.end
+        return events
+
+    def clear(self) -> None:
+        self.cursor = self.channel.end
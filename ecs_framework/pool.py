@@ -0,0 +1,208 @@
+from dataclasses import dataclass, fields, is_dataclass
+from types import FunctionType, MethodType
+from typing import Any, Dict, List, Protocol, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from ecs_framework.entity import SLOT_MASK
+
+
+class FieldLayout(Protocol):
+
+    dtype: type
+
+    def columns(self, name: str) -> Tuple[str, ...]:
+        ...
+
+    def encode(self, value: Any) -> Tuple[Any, ...]:
+        ...
+
+    def decode(self, values: Tuple[Any, ...]) -> Any:
+        ...
+
+
+@dataclass(frozen=True)
+class Scalar:
+    dtype: type = np.float64
+
+    def columns(self, name: str) -> Tuple[str, ...]:
+        return (name,)
+
+    def encode(self, value: Any) -> Tuple[Any, ...]:
+        return (value,)
+
+    def decode(self, values: Tuple[Any, ...]) -> Any:
+        return values[0]
+
+
+@dataclass(frozen=True)
+class Struct:
+    cls: type
+    attributes: Tuple[str, ...]
+    dtype: type = np.float64
+
+    def columns(self, name: str) -> Tuple[str, ...]:
+        return tuple(f'{name}_{attribute}' for attribute in self.attributes)
+
+    def encode(self, value: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(value, attribute) for attribute in self.attributes)
+
+    def decode(self, values: Tuple[Any, ...]) -> Any:
+        return self.cls(*values)
+
+
+PoolLayout = Dict[str, FieldLayout]
+
+
+_SCALAR_DTYPES = {
+    float: np.float64,
+    int: np.int64,
+    bool: np.bool_,
+}
+
+
+def infer_layout(component_type: type) -> PoolLayout:
+    if isinstance(component_type, type) and issubclass(component_type, BaseModel):
+        annotations = {name: field.annotation for name, field in component_type.model_fields.items()}
+    elif is_dataclass(component_type):
+        annotations = {field.name: field.type for field in fields(component_type)}
+    else:
+        raise TypeError(f'Cannot infer a pool layout for {component_type.__name__}')
+
+    return {name: Scalar(_SCALAR_DTYPES.get(annotation, object)) for name, annotation in annotations.items()}
+
+
+class PooledComponent:
+    __slots__ = ('pool', 'slot')
+
+    def __init__(self, pool: 'ComponentPool', slot: int):
+        self.pool = pool
+        self.slot = slot
+
+    @property
+    def __class__(self) -> type:
+        return self.pool.component_type
+
+    def __getattr__(self, name: str) -> Any:
+        if name in PooledComponent.__slots__:
+            raise AttributeError(name)
+        attribute = getattr(self.pool.component_type, name)
+        if isinstance(attribute, FunctionType) and name in vars(self.pool.component_type):
+            return MethodType(attribute, self)
+        return getattr(self.pool.get(self.slot), name)
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.pool.layout)
+        return f'{self.pool.component_type.__name__}({values})'
+
+
+def component_type_of(component: Any) -> type:
+    if isinstance(component, PooledComponent):
+        return component.pool.component_type
+    return type(component)
+
+
+def _read(array: np.ndarray, slot: int) -> Any:
+    value = array[slot]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _field_property(name: str, field: FieldLayout) -> property:
+    columns = field.columns(name)
+
+    def getter(view: PooledComponent) -> Any:
+        arrays = view.pool.columns
+        return field.decode(tuple(_read(arrays[column], view.slot) for column in columns))
+
+    def setter(view: PooledComponent, value: Any) -> None:
+        arrays = view.pool.columns
+        for column, column_value in zip(columns, field.encode(value)):
+            arrays[column][view.slot] = column_value
+
+    return property(getter, setter)
+
+
+def _build_view_type(component_type: type, layout: PoolLayout) -> type:
+    namespace = {'__slots__': ()}
+    for name, field in layout.items():
+        namespace[name] = _field_property(name, field)
+    return type(f'{component_type.__name__}View', (PooledComponent,), namespace)
+
+
+class ComponentPool:
+
+    def __init__(self, component_type: type, layout: PoolLayout | None = None, capacity: int = 64):
+        self.component_type = component_type
+        self.layout = layout if layout is not None else infer_layout(component_type)
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, field in self.layout.items():
+            for column in field.columns(name):
+                self.columns[column] = np.zeros(capacity, dtype=field.dtype)
+        self.present = np.zeros(capacity, dtype=np.bool_)
+        self.view_type = _build_view_type(component_type, self.layout)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.present))
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.present)
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+
+        new_capacity = max(capacity, self.capacity * 2)
+        for column, array in self.columns.items():
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self.columns[column] = grown
+        present = np.zeros(new_capacity, dtype=np.bool_)
+        present[:len(self.present)] = self.present
+        self.present = present
+
+    def write(self, slot: int, component: Any) -> PooledComponent:
+        self.reserve(slot + 1)
+        for name, field in self.layout.items():
+            for column, value in zip(field.columns(name), field.encode(getattr(component, name))):
+                self.columns[column][slot] = value
+        self.present[slot] = True
+        return self.view_type(self, slot)
+
+    def remove(self, slot: int) -> None:
+        if slot < self.capacity:
+            self.present[slot] = False
+
+    def has(self, slot: int) -> bool:
+        return slot < self.capacity and bool(self.present[slot])
+
+    def view(self, slot: int) -> PooledComponent:
+        return self.view_type(self, slot)
+
+    def get(self, slot: int) -> Any:
+        view = self.view(slot)
+        values = {name: getattr(view, name) for name in self.layout}
+        if issubclass(self.component_type, BaseModel):
+            return self.component_type.model_construct(**values)
+        return self.component_type(**values)
+
+    def slots(self) -> np.ndarray:
+        return np.flatnonzero(self.present)
+
+    def copy_columns(self) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        return {column: array.copy() for column, array in self.columns.items()}, self.present.copy()
+
+    def load_columns(self, columns: Dict[str, np.ndarray], present: np.ndarray) -> None:
+        self.columns = {column: array.copy() for column, array in columns.items()}
+        self.present = present.copy()
+
+    def clear(self) -> None:
+        self.present[:] = False
+
+
+def entity_slots(entities: List[int]) -> np.ndarray:
+    return np.array(entities, dtype=np.int64) & SLOT_MASK
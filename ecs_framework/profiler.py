@@ -0,0 +1,127 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+PROFILE_VARIABLE = 'ECS_PROFILE'
+
+
+@dataclass(slots=True)
+class Sample:
+    start: float
+    duration: float
+    entities: int
+    thread: int
+
+
+class SystemStats:
+
+    def __init__(self, name: str, capacity: int):
+        self.name = name
+        self.samples: Deque[Sample] = deque(maxlen=capacity)
+        self.calls = 0
+
+    def record(self, sample: Sample) -> None:
+        self.samples.append(sample)
+        self.calls += 1
+
+    def percentiles(self, percentiles: Iterable[float]) -> Dict[float, float]:
+        if not self.samples:
+            return {percentile: 0.0 for percentile in percentiles}
+
+        durations = np.fromiter((sample.duration for sample in self.samples), dtype=np.float64)
+        return dict(zip(percentiles, np.percentile(durations, list(percentiles)).tolist()))
+
+    def entities(self) -> int:
+        return self.samples[-1].entities if self.samples else 0
+
+
+class Profiler:
+
+    def __init__(self, capacity: int = 600, budget: float = 1 / 60):
+        self.capacity = capacity
+        self.budget = budget
+        self.systems: Dict[int, SystemStats] = {}
+        self.frames: Deque[Tuple[float, float]] = deque(maxlen=capacity)
+        self.frame_depth = 0
+        self.origin = time.perf_counter()
+
+    def run(self, system: Any, delta_time: float) -> None:
+        query = getattr(system, 'query', None)
+        entities = len(query) if query is not None else 0
+
+        start = time.perf_counter()
+        system.execute(delta_time)
+        duration = time.perf_counter() - start
+
+        stats = self.systems.get(id(system))
+        if stats is None:
+            stats = SystemStats(type(system).__name__, self.capacity)
+            self.systems[id(system)] = stats
+        stats.record(Sample(start, duration, entities, threading.get_ident()))
+
+    def begin_frame(self) -> float:
+        self.frame_depth += 1
+        return time.perf_counter()
+
+    def end_frame(self, start: float) -> None:
+        self.frame_depth -= 1
+        if self.frame_depth == 0:
+            self.record_frame(start, time.perf_counter() - start)
+
+    def record_frame(self, start: float, duration: float) -> None:
+        self.frames.append((start, duration))
+
+    def over_budget(self) -> int:
+        return sum(1 for _, duration in self.frames if duration > self.budget)
+
+    def percentiles(self, percentiles: Tuple[float, ...] = (50, 95, 99)) -> Dict[str, Dict[float, float]]:
+        return {stats.name: stats.percentiles(percentiles) for stats in self.systems.values()}
+
+    def summary(self, percentiles: Tuple[float, ...] = (50, 95, 99)) -> str:
+        header = ['system', 'calls', 'entities', *(f'p{percentile:g} ms' for percentile in percentiles)]
+        lines = ['\t'.join(header)]
+        for stats in sorted(self.systems.values(), key=lambda stats: -stats.percentiles((95,))[95]):
+            values = stats.percentiles(percentiles)
+            lines.append('\t'.join([stats.name, str(stats.calls), str(stats.entities()), *(f'{values[percentile] * 1000:.3f}' for percentile in percentiles)]))
+        lines.append(f'frames over budget: {self.over_budget()}/{len(self.frames)}')
+        return '\n'.join(lines)
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        events = []
+        for start, duration in self.frames:
+            events.append(self._event('frame', start, duration, 0, {}))
+        for stats in self.systems.values():
+            for sample in stats.samples:
+                events.append(self._event(stats.name, sample.start, sample.duration, sample.thread, {'entities': sample.entities}))
+        events.sort(key=lambda event: event['ts'])
+        return events
+
+    def export(self, path: Path) -> None:
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, file)
+
+    def clear(self) -> None:
+        self.systems.clear()
+        self.frames.clear()
+
+    def _event(self, name: str, start: float, duration: float, thread: int, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self.origin) * 1_000_000,
+            'dur': duration * 1_000_000,
+            'pid': 0,
+            'tid': thread,
+            'args': args,
+        }
+
+
+def profiler_from_environment() -> Profiler | None:
+    return Profiler() if os.environ.get(PROFILE_VARIABLE) else None
@@ -0,0 +1,68 @@
+from typing import Any, Iterator, List, Tuple
+
+import numpy as np
+
+from ecs_framework.archetype import Archetype
+from ecs_framework.pool import entity_slots
+
+
+class Query:
+
+    def __init__(self, component_types: Tuple[type, ...]):
+        self.component_types = component_types
+        self.signature = frozenset(component_types)
+        self.archetypes: List[Archetype] = []
+
+    def __len__(self) -> int:
+        return sum(len(archetype) for archetype in self.archetypes)
+
+    def __iter__(self) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        yield from self.rows()
+
+    def matches(self, archetype: Archetype) -> bool:
+        return bool(self.signature) and self.signature <= archetype.signature
+
+    def register(self, archetype: Archetype) -> None:
+        if self.matches(archetype):
+            self.archetypes.append(archetype)
+
+    def clear(self) -> None:
+        self.archetypes.clear()
+
+    def entities(self) -> List[int]:
+        entities = []
+        for archetype in self.archetypes:
+            entities.extend(archetype.entities)
+        return entities
+
+    def slots(self) -> np.ndarray:
+        return entity_slots(self.entities())
+
+    def rows(self) -> List[Tuple[int, Tuple[Any, ...]]]:
+        rows = []
+        for archetype in self.archetypes:
+            if not archetype.entities:
+                continue
+            columns = [archetype.column(component_type) for component_type in self.component_types]
+            rows.extend(zip(archetype.entities, zip(*columns)))
+        return rows
+
+    def changed(self, tick: int, component_type: type | None = None) -> List[Tuple[int, Tuple[Any, ...]]]:
+        changed_types = (component_type,) if component_type is not None else self.component_types
+        rows = []
+        for archetype in self.archetypes:
+            if not archetype.entities or archetype.last_change <= tick:
+                continue
+            columns = [archetype.column(component_type) for component_type in self.component_types]
+            tick_columns = [archetype.ticks[component_type] for component_type in changed_types]
+            for row, entity_id in enumerate(archetype.entities):
+                if any(ticks[row] > tick for ticks in tick_columns):
+                    rows.append((entity_id, tuple(column[row] for column in columns)))
+        return rows
+
+    def single(self) -> List[Tuple[int, Any]]:
+        component_type = self.component_types[0]
+        rows = []
+        for archetype in self.archetypes:
+            rows.extend(zip(archetype.entities, archetype.column(component_type)))
+        return rows
@@ -0,0 +1,72 @@
+import time
+from typing import Any, Callable
+
+from ecs_framework.ecs import ECS
+from ecs_framework.scheduler import Scheduler
+
+
+class Runner:
+
+    def __init__(self, world: ECS, step: float = 1 / 60, max_steps: int = 5):
+        self.world = world
+        self.step = step
+        self.max_steps = max_steps
+        self.render_systems: list = []
+        self.render_scheduler = Scheduler(self.render_systems)
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.steps = 0
+
+    def add_render_system(self, system: Any) -> None:
+        self.render_systems.append(system)
+        self.render_scheduler.invalidate()
+
+    def simulate(self, elapsed: float) -> int:
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps and self.world.running:
+            self.world.execute(self.step)
+            self.accumulator -= self.step
+            steps += 1
+
+        if self.accumulator >= self.step:
+            self.accumulator %= self.step
+        self.alpha = self.accumulator / self.step
+        self.steps += steps
+        return steps
+
+    def render(self, elapsed: float) -> None:
+        if self.render_systems:
+            self.render_scheduler.run(self.world, elapsed)
+
+    def advance(self, elapsed: float) -> int:
+        profiler = self.world.profiler
+        if profiler is None:
+            steps = self.simulate(elapsed)
+            self.render(elapsed)
+            return steps
+
+        start = profiler.begin_frame()
+        try:
+            steps = self.simulate(elapsed)
+            self.render(elapsed)
+        finally:
+            profiler.end_frame(start)
+        return steps
+
+    def run(self, present: Callable[[], None] | None = None, clock: Callable[[], float] = time.perf_counter) -> None:
+        last = clock()
+        while self.world.running:
+            now = clock()
+            self.advance(now - last)
+            last = now
+            if present is not None:
+                present()
+
+    def run_headless(self, steps: int) -> int:
+        executed = 0
+        while executed < steps and self.world.running:
+            self.world.execute(self.step)
+            executed += 1
+        self.steps += executed
+        return executed
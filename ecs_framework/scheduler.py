@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+
+
+Access = Optional[Tuple[FrozenSet[Any], FrozenSet[Any]]]
+
+
+def system_access(system: Any) -> Access:
+    reads = getattr(system, 'reads', None)
+    writes = getattr(system, 'writes', None)
+    if reads is None and writes is None:
+        return None
+    return frozenset(reads or ()), frozenset(writes or ())
+
+
+def _execute(system: Any, delta_time: float) -> None:
+    system.execute(delta_time)
+
+
+def conflicts(first: Access, second: Access) -> bool:
+    if first is None or second is None:
+        return True
+
+    first_reads, first_writes = first
+    second_reads, second_writes = second
+    return not first_writes.isdisjoint(second_reads | second_writes) or not second_writes.isdisjoint(first_reads)
+
+
+class Scheduler:
+
+    def __init__(self, systems: List[Any], workers: int = 1):
+        self.systems = systems
+        self.workers = workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._stages: Optional[List[List[Any]]] = None
+
+    @property
+    def stages(self) -> List[List[Any]]:
+        if self._stages is None:
+            self._stages = self.build()
+        return self._stages
+
+    def invalidate(self) -> None:
+        self._stages = None
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def build(self) -> List[List[Any]]:
+        accesses = [system_access(system) for system in self.systems]
+        levels: List[int] = []
+        stages: List[List[Any]] = []
+        for index, system in enumerate(self.systems):
+            level = 0
+            for previous in range(index):
+                if levels[previous] >= level and conflicts(accesses[previous], accesses[index]):
+                    level = levels[previous] + 1
+            levels.append(level)
+
+            if level == len(stages):
+                stages.append([])
+            stages[level].append(system)
+        return stages
+
+    def run(self, world: Any, delta_time: float) -> None:
+        profiler = world.profiler
+        if profiler is None:
+            self._run_stages(world, delta_time, _execute)
+            return
+
+        start = profiler.begin_frame()
+        try:
+            self._run_stages(world, delta_time, profiler.run)
+        finally:
+            profiler.end_frame(start)
+
+    def _run_stages(self, world: Any, delta_time: float, run: Callable[[Any, float], None]) -> None:
+        for stage in self.stages:
+            tick = world.tick
+            if self.workers <= 1 or len(stage) == 1:
+                for system in stage:
+                    run(system, delta_time)
+            else:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(self.workers)
+                futures = [self.executor.submit(run, system, delta_time) for system in stage]
+                for future in futures:
+                    future.result()
+            world.flush()
+
+            for system in stage:
+                if getattr(system, 'last_run', None) is not None:
+                    system.last_run = tick
+            world.tick += 1
@@ -0,0 +1,329 @@
+import io
+import pickle
+import struct
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Tuple, get_args, get_type_hints
+
+import numpy as np
+from pydantic import BaseModel
+
+from ecs_framework.ecs import ECS
+from ecs_framework.entity import EntityAllocator
+from ecs_framework.pool import ComponentPool, entity_slots
+from ecs_framework.snapshot import ArchetypeState, PoolState, WorldSnapshot
+
+MAGIC = b'ECSW'
+VERSION = 1
+
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+_ARRAY_KINDS = {float: np.float64, int: np.int64, bool: np.bool_}
+_SAFE_GLOBALS = {
+    ('builtins', 'list'), ('builtins', 'dict'), ('builtins', 'tuple'), ('builtins', 'set'), ('builtins', 'frozenset'),
+    ('builtins', 'str'), ('builtins', 'bytes'), ('builtins', 'bytearray'), ('builtins', 'int'), ('builtins', 'float'),
+    ('builtins', 'bool'), ('builtins', 'complex'), ('builtins', 'slice'),
+    ('numpy', 'ndarray'), ('numpy', 'dtype'), ('numpy.core.multiarray', '_reconstruct'), ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'), ('numpy._core.multiarray', 'scalar'),
+}
+
+
+def component_fields(component_type: type) -> Tuple[str, ...] | None:
+    if is_dataclass(component_type):
+        return tuple(field.name for field in fields(component_type))
+    if isinstance(component_type, type) and issubclass(component_type, BaseModel):
+        return tuple(component_type.model_fields)
+    return None
+
+
+def type_path(value_type: type) -> Tuple[str, str]:
+    return value_type.__module__, value_type.__qualname__
+
+
+def value_types(component_type: type) -> Set[type]:
+    found = set()
+    pending = [component_type]
+    while pending:
+        value_type = pending.pop()
+        if not isinstance(value_type, type) or value_type in found:
+            pending.extend(get_args(value_type))
+            continue
+
+        found.add(value_type)
+        names = component_fields(value_type)
+        if not names:
+            continue
+        try:
+            hints = get_type_hints(value_type)
+        except (NameError, TypeError):
+            continue
+        pending.extend(hints[name] for name in names if name in hints)
+    return found
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+
+    def __init__(self, data: bytes, allowed: Dict[Tuple[str, str], type]):
+        super().__init__(io.BytesIO(data))
+        self.allowed = allowed
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        value_type = self.allowed.get((module, name))
+        if value_type is None:
+            raise pickle.UnpicklingError(f'Refusing to load {module}.{name} from world data')
+        return value_type
+
+
+class _Writer:
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+
+    def u32(self, value: int) -> None:
+        self.parts.append(_U32.pack(value))
+
+    def u64(self, value: int) -> None:
+        self.parts.append(_U64.pack(value))
+
+    def blob(self, data: bytes) -> None:
+        self.u32(len(data))
+        self.parts.append(data)
+
+    def text(self, value: str) -> None:
+        self.blob(value.encode())
+
+    def array(self, array: np.ndarray) -> None:
+        self.text(array.dtype.str)
+        self.blob(np.ascontiguousarray(array).tobytes())
+
+    def values(self, values: List[Any]) -> None:
+        kinds = {type(value) for value in values}
+        kind = _ARRAY_KINDS.get(kinds.pop()) if len(kinds) == 1 else None
+        if kind is None:
+            self.parts.append(b'p')
+            self.blob(pickle.dumps(values, pickle.HIGHEST_PROTOCOL))
+        else:
+            self.parts.append(b'a')
+            self.array(np.array(values, dtype=kind))
+
+    def getvalue(self) -> bytes:
+        return b''.join(self.parts)
+
+
+class _Reader:
+
+    def __init__(self, data: bytes, allowed: Dict[Tuple[str, str], type]):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.allowed = allowed
+
+    def take(self, size: int) -> memoryview:
+        chunk = self.data[self.offset:self.offset + size]
+        if len(chunk) != size:
+            raise ValueError('Truncated world data')
+        self.offset += size
+        return chunk
+
+    def u32(self) -> int:
+        return _U32.unpack(self.take(_U32.size))[0]
+
+    def u64(self) -> int:
+        return _U64.unpack(self.take(_U64.size))[0]
+
+    def blob(self) -> memoryview:
+        return self.take(self.u32())
+
+    def text(self) -> str:
+        return str(self.blob(), 'utf-8')
+
+    def array(self) -> np.ndarray:
+        dtype = np.dtype(self.text())
+        return np.frombuffer(self.blob(), dtype=dtype).copy()
+
+    def values(self) -> List[Any]:
+        if self.take(1) == b'p':
+            return _RestrictedUnpickler(bytes(self.blob()), self.allowed).load()
+        return self.array().tolist()
+
+
+def _build_rows(component_type: type, names: Tuple[str, ...], rows: Iterable[Tuple[Any, ...]]) -> List[Any]:
+    new = object.__new__
+    setattr = object.__setattr__
+    components = []
+    if not issubclass(component_type, BaseModel):
+        for row in rows:
+            component = new(component_type)
+            for name, value in zip(names, row):
+                setattr(component, name, value)
+            components.append(component)
+        return components
+
+    if component_type.__private_attributes__ or component_type.model_config.get('extra') == 'allow':
+        return [component_type.model_construct(**dict(zip(names, row))) for row in rows]
+
+    for row in rows:
+        model = new(component_type)
+        setattr(model, '__dict__', dict(zip(names, row)))
+        setattr(model, '__pydantic_fields_set__', set(names))
+        setattr(model, '__pydantic_extra__', None)
+        setattr(model, '__pydantic_private__', None)
+        components.append(model)
+    return components
+
+
+class WorldSerializer:
+
+    def __init__(self, type_keys: Dict[type, str] | None = None, transient: Iterable[type] = (), allowed: Iterable[type] = ()):
+        self.type_keys = dict(type_keys or {})
+        self.transient = frozenset(transient)
+        self.key_types = {key: component_type for component_type, key in self.type_keys.items()}
+        for component_type in allowed:
+            self.key_types.setdefault(self.type_key(component_type), component_type)
+
+        self.allowed: Dict[Tuple[str, str], type] = {}
+        for component_type in self.key_types.values():
+            for value_type in value_types(component_type):
+                self.allowed.setdefault(type_path(value_type), value_type)
+
+    def type_key(self, component_type: type) -> str:
+        key = self.type_keys.get(component_type)
+        if key is None:
+            key = f'{component_type.__module__}.{component_type.__qualname__}'
+        return key
+
+    def resolve(self, key: str) -> type:
+        component_type = self.key_types.get(key)
+        if component_type is None:
+            raise ValueError(f'Component type {key} is not registered with the serializer')
+        return component_type
+
+    def dumps(self, world: ECS) -> bytes:
+        writer = _Writer()
+        writer.parts.append(MAGIC)
+        writer.u32(VERSION)
+        writer.u64(world.tick)
+        self._write_entities(writer, world.entities)
+
+        pools = {component_type: pool for component_type, pool in world.pools.items() if component_type not in self.transient}
+        tables = self._tables(world)
+        types: Dict[type, int] = {}
+        for component_type in pools:
+            types.setdefault(component_type, len(types))
+        for component_types, _, _ in tables:
+            for component_type in component_types:
+                types.setdefault(component_type, len(types))
+
+        writer.u32(len(types))
+        for component_type in types:
+            writer.text(self.type_key(component_type))
+
+        writer.u32(len(pools))
+        for component_type, pool in pools.items():
+            writer.u32(types[component_type])
+            writer.u32(len(pool.columns))
+            for column, array in pool.columns.items():
+                writer.text(column)
+                writer.array(array)
+            writer.array(pool.present)
+
+        writer.u32(len(tables))
+        for component_types, entities, columns in tables:
+            writer.u32(len(component_types))
+            for component_type in component_types:
+                writer.u32(types[component_type])
+            writer.array(np.array(entities, dtype=np.int64))
+            for component_type in component_types:
+                if component_type not in pools:
+                    self._write_column(writer, component_type, columns[component_type])
+        return writer.getvalue()
+
+    def loads(self, data: bytes) -> WorldSnapshot:
+        reader = _Reader(data, self.allowed)
+        if reader.take(len(MAGIC)) != MAGIC:
+            raise ValueError('Not a serialized world')
+        version = reader.u32()
+        if version != VERSION:
+            raise ValueError(f'Unsupported world format version {version}')
+        tick = reader.u64()
+        entities = self._read_entities(reader)
+
+        types = [self.resolve(reader.text()) for _ in range(reader.u32())]
+
+        pools: Dict[type, ComponentPool] = {}
+        for _ in range(reader.u32()):
+            component_type = types[reader.u32()]
+            columns = {reader.text(): reader.array() for _ in range(reader.u32())}
+            pool = ComponentPool(component_type, getattr(component_type, 'pool_layout', None), 0)
+            expected = {column: array.dtype for column, array in pool.columns.items()}
+            if {column: array.dtype for column, array in columns.items()} != expected:
+                raise ValueError(f'Stored pool columns for {component_type.__name__} do not match its pool layout')
+            pool.load_columns(columns, reader.array())
+            pools[component_type] = pool
+
+        archetypes = []
+        for _ in range(reader.u32()):
+            component_types = tuple(types[reader.u32()] for _ in range(reader.u32()))
+            entity_ids = reader.array().tolist()
+            columns = {}
+            for component_type in component_types:
+                pool = pools.get(component_type)
+                if pool is None:
+                    columns[component_type] = self._read_column(reader, component_type, len(entity_ids))
+                else:
+                    columns[component_type] = [pool.view(slot) for slot in entity_slots(entity_ids).tolist()]
+            archetypes.append(ArchetypeState(component_types, entity_ids, columns))
+
+        pool_states = {component_type: PoolState(pool.layout, pool.columns, pool.present) for component_type, pool in pools.items()}
+        return WorldSnapshot(entities, tick, archetypes, pool_states)
+
+    def save(self, world: ECS, path: Path) -> None:
+        Path(path).write_bytes(self.dumps(world))
+
+    def load(self, path: Path) -> WorldSnapshot:
+        return self.loads(Path(path).read_bytes())
+
+    def _tables(self, world: ECS) -> List[Tuple[Tuple[type, ...], List[int], Dict[type, List[Any]]]]:
+        tables: Dict[FrozenSet[type], Tuple[Tuple[type, ...], List[int], Dict[type, List[Any]]]] = {}
+        for archetype in world.archetypes.values():
+            component_types = tuple(component_type for component_type in archetype.component_types if component_type not in self.transient)
+            if not archetype.entities:
+                continue
+
+            table = tables.setdefault(frozenset(component_types), (component_types, [], {component_type: [] for component_type in component_types}))
+            table[1].extend(archetype.entities)
+            for component_type in component_types:
+                table[2][component_type].extend(archetype.columns[component_type])
+        return list(tables.values())
+
+    def _write_entities(self, writer: _Writer, entities: EntityAllocator) -> None:
+        writer.u64(entities.count)
+        writer.array(np.array(entities.generations, dtype=np.int64))
+        writer.blob(bytes(entities.alive))
+        writer.array(np.array(entities.free_slots, dtype=np.int64))
+
+    def _read_entities(self, reader: _Reader) -> EntityAllocator:
+        entities = EntityAllocator()
+        entities.count = reader.u64()
+        entities.generations = reader.array().tolist()
+        entities.alive = bytearray(reader.blob())
+        entities.free_slots = reader.array().tolist()
+        return entities
+
+    def _write_column(self, writer: _Writer, component_type: type, column: List[Any]) -> None:
+        names = component_fields(component_type)
+        if names is None:
+            writer.values(column)
+            return
+
+        for name in names:
+            writer.values([getattr(component, name) for component in column])
+
+    def _read_column(self, reader: _Reader, component_type: type, size: int) -> List[Any]:
+        names = component_fields(component_type)
+        if names is None:
+            return reader.values()
+
+        rows = zip(*(reader.values() for _ in names)) if names else [()] * size
+        return _build_rows(component_type, names, rows)
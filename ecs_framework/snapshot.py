@@ -0,0 +1,70 @@
+import copy
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from ecs_framework.entity import EntityAllocator
+from ecs_framework.pool import PoolLayout
+
+
+@dataclass(frozen=True, slots=True)
+class ArchetypeState:
+    component_types: Tuple[type, ...]
+    entities: List[int]
+    columns: Dict[type, List[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class PoolState:
+    layout: PoolLayout
+    columns: Dict[str, np.ndarray]
+    present: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    entities: EntityAllocator
+    tick: int
+    archetypes: List[ArchetypeState]
+    pools: Dict[type, PoolState]
+
+
+_CONTAINERS = (list, dict, set)
+_cloners: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _copy_fields(names: Tuple[str, ...]) -> Callable[[Any], Any]:
+    def clone(component: Any) -> Any:
+        copied = object.__new__(type(component))
+        for name in names:
+            value = getattr(component, name)
+            if isinstance(value, _CONTAINERS):
+                value = copy.copy(value)
+            object.__setattr__(copied, name, value)
+        return copied
+    return clone
+
+
+def _copy_model(component: BaseModel) -> BaseModel:
+    copied = component.model_copy()
+    for name in type(component).model_fields:
+        value = getattr(copied, name)
+        if isinstance(value, _CONTAINERS):
+            object.__setattr__(copied, name, copy.copy(value))
+    return copied
+
+
+def clone_component(component: Any) -> Any:
+    component_type = type(component)
+    cloner = _cloners.get(component_type)
+    if cloner is None:
+        if is_dataclass(component_type):
+            cloner = _copy_fields(tuple(field.name for field in fields(component_type)))
+        elif issubclass(component_type, BaseModel):
+            cloner = _copy_model
+        else:
+            cloner = copy.copy
+        _cloners[component_type] = cloner
+    return cloner(component)
@@ -1,7 +1,62 @@
+import json
+import os
+import pickle
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from ecs_framework.ecs import ECS, SystemProtocol
+import numpy as np
+from pydantic import ValidationError
+
+from ecs_framework.ecs import ECS, Component, SystemProtocol
+from ecs_framework.entity import entity_generation, entity_slot
+from ecs_framework.pool import Scalar
+from ecs_framework.profiler import PROFILE_VARIABLE, Profiler, profiler_from_environment
+from ecs_framework.runner import Runner
+from ecs_framework.serialization import WorldSerializer
+
+
+@dataclass(slots=True)
+class Health(Component):
+    current: float
+    maximum: float = 10.0
+
+
+@dataclass(slots=True)
+class Inventory(Component):
+    items: list
+
+
+class DeclaredSystem:
+
+    def __init__(self, reads: tuple = (), writes: tuple = ()):
+        self.reads = reads
+        self.writes = writes
+        self.execute = MagicMock()
+
+
+class TestComponent(unittest.TestCase):
+
+    def test_component_has_no_instance_dict(self):
+        health = Health(5.0)
+
+        self.assertFalse(hasattr(health, '__dict__'))
+        self.assertEqual(Health(5.0), health)
+
+    def test_component_skips_validation_by_default(self):
+        health = Health('5')
+
+        self.assertEqual('5', health.current)
+
+    def test_component_validate(self):
+        health = Health.validate(current='5')
+
+        self.assertEqual(5.0, health.current)
+        self.assertEqual(10.0, health.maximum)
+        with self.assertRaises(ValidationError):
+            Health.validate(current='five')
 
 
 class TestECS(unittest.TestCase):
@@ -57,6 +112,42 @@ class TestECS(unittest.TestCase):
         for component in ecs.world.keys():
             self.assertFalse(ecs.entity_has_component(entity_id, component))
 
+    def test_deleted_entity_slot_is_recycled_with_new_generation(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.delete_entity(entity_id)
+
+        recycled_id = ecs.create_entity()
+
+        self.assertNotEqual(entity_id, recycled_id)
+        self.assertEqual(entity_slot(entity_id), entity_slot(recycled_id))
+        self.assertEqual(entity_generation(entity_id) + 1, entity_generation(recycled_id))
+        self.assertEqual(1, ecs.entities.capacity)
+
+    def test_stale_entity_handle_is_rejected(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'a')
+        ecs.delete_entity(entity_id)
+        recycled_id = ecs.create_entity()
+
+        ecs.add_component(entity_id, 3)
+        ecs.delete_entity(entity_id)
+
+        self.assertFalse(ecs.has_entity(entity_id))
+        self.assertTrue(ecs.has_entity(recycled_id))
+        self.assertIsNone(ecs.get_entity_component(entity_id, str))
+        self.assertFalse(ecs.entity_has_component(recycled_id, str))
+        self.assertFalse(ecs.entity_has_component(recycled_id, int))
+
+    def test_entities_iterates_alive_handles(self):
+        ecs = ECS()
+        entity_ids = [ecs.create_entity() for _ in range(3)]
+        ecs.delete_entity(entity_ids[1])
+
+        self.assertListEqual([entity_ids[0], entity_ids[2]], list(ecs.entities))
+        self.assertEqual(2, len(ecs.entities))
+
     # Component
     def test_add_entity_component(self):
         ecs = ECS()
@@ -268,6 +359,748 @@ class TestECS(unittest.TestCase):
 
         self.assertListEqual([], eligible_entities)
         
+    # Archetype
+    def test_entities_with_same_components_share_archetype(self):
+        ecs = ECS()
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, 'a')
+        ecs.add_component(entity_id1, 3)
+        ecs.add_component(entity_id2, 4)
+        ecs.add_component(entity_id2, 'b')
+
+        self.assertIs(ecs.locations[entity_id1], ecs.locations[entity_id2])
+        self.assertSetEqual({str, int}, set(ecs.locations[entity_id1].signature))
+
+    def test_remove_component_moves_entity_to_smaller_archetype(self):
+        ecs = ECS()
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, 'a')
+        ecs.add_component(entity_id1, 3)
+        ecs.add_component(entity_id2, 'b')
+
+        ecs.remove_component(entity_id1, int)
+
+        self.assertIs(ecs.locations[entity_id1], ecs.locations[entity_id2])
+        self.assertListEqual([], ecs.get_entities_with(int))
+        self.assertListEqual([entity_id1, entity_id2], sorted(ecs.get_entities_with(str)))
+
+    def test_delete_entity_keeps_archetype_neighbours(self):
+        ecs = ECS()
+        entity_ids = [ecs.create_entity() for _ in range(3)]
+        for index, entity_id in enumerate(entity_ids):
+            ecs.add_component(entity_id, str(index))
+            ecs.add_component(entity_id, index)
+
+        ecs.delete_entity(entity_ids[0])
+
+        self.assertListEqual(sorted(entity_ids[1:]), sorted(ecs.get_entities_with(str, int)))
+        for index, entity_id in enumerate(entity_ids[1:], start=1):
+            self.assertEqual(str(index), ecs.get_entity_component(entity_id, str))
+            self.assertEqual(index, ecs.get_entity_component(entity_id, int))
+
+    def test_get_entities_with_components_while_removing(self):
+        ecs = ECS()
+        entity_ids = [ecs.create_entity() for _ in range(3)]
+        for index, entity_id in enumerate(entity_ids):
+            ecs.add_component(entity_id, str(index))
+            ecs.add_component(entity_id, index)
+
+        visited = []
+        for entity_id, (text, number) in ecs.get_entities_with_components(str, int):
+            visited.append((entity_id, text, number))
+            ecs.remove_component(entity_id, int)
+
+        self.assertListEqual([(entity_id, str(index), index) for index, entity_id in enumerate(entity_ids)], visited)
+        self.assertListEqual([], ecs.get_entities_with(int))
+
+    # Query
+    def test_query_is_cached(self):
+        ecs = ECS()
+
+        self.assertIs(ecs.query(str, int), ecs.query(str, int))
+
+    def test_query_tracks_component_changes(self):
+        ecs = ECS()
+        query = ecs.query(str, int)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, 'a')
+        ecs.add_component(entity_id1, 1)
+        ecs.add_component(entity_id2, 'b')
+
+        self.assertListEqual([entity_id1], query.entities())
+
+        ecs.add_component(entity_id2, 2)
+        ecs.remove_component(entity_id1, int)
+
+        self.assertListEqual([(entity_id2, ('b', 2))], list(query))
+
+        ecs.delete_entity(entity_id2)
+
+        self.assertEqual(0, len(query))
+
+    def test_query_without_components_is_empty(self):
+        ecs = ECS()
+        ecs.create_entity()
+
+        self.assertListEqual([], ecs.query().entities())
+
+    def test_query_survives_reset(self):
+        ecs = ECS()
+        query = ecs.query(str)
+        ecs.add_component(ecs.create_entity(), 'a')
+
+        ecs.reset()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'b')
+
+        self.assertListEqual([entity_id], query.entities())
+
+    # Pool
+    def test_pooled_components_are_views_over_columns(self):
+        ecs = ECS()
+        pool = ecs.add_pool(Health)
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Health(5.0))
+
+        health = ecs.get_entity_component(entity_id, Health)
+        health.current -= 2.0
+
+        self.assertEqual(3.0, pool['current'][entity_slot(entity_id)])
+        self.assertEqual(Health(3.0), pool.get(entity_slot(entity_id)))
+
+    def test_add_pool_migrates_existing_components(self):
+        ecs = ECS()
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, Health(5.0))
+        ecs.add_component(entity_id2, Health(7.0, 8.0))
+
+        pool = ecs.add_pool(Health)
+        pool['current'][ecs.query(Health).slots()] += 1.0
+
+        self.assertIs(pool, ecs.add_pool(Health))
+        self.assertEqual(6.0, ecs.get_entity_component(entity_id1, Health).current)
+        self.assertEqual(8.0, ecs.get_entity_component(entity_id2, Health).current)
+        self.assertEqual(8.0, ecs.get_entity_component(entity_id2, Health).maximum)
+
+    def test_pool_tracks_component_removal(self):
+        ecs = ECS()
+        pool = ecs.add_pool(Health)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, Health(5.0))
+        ecs.add_component(entity_id2, Health(7.0))
+
+        ecs.remove_component(entity_id1, Health)
+        ecs.delete_entity(entity_id2)
+
+        self.assertEqual(0, len(pool))
+
+    def test_pool_grows_with_entities(self):
+        ecs = ECS()
+        pool = ecs.add_pool(Health)
+        for index in range(100):
+            ecs.add_component(ecs.create_entity(), Health(float(index)))
+
+        self.assertEqual(100, len(pool))
+        self.assertEqual(float(sum(range(100))), pool['current'][ecs.query(Health).slots()].sum())
+
+    def test_pooled_views_are_instances_of_the_component_type(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Health(5.0))
+
+        self.assertIsInstance(ecs.get_entity_component(entity_id, Health), Health)
+
+    def test_adding_a_view_copies_it_under_the_component_type(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, Health(5.0))
+
+        ecs.add_component(entity_id2, ecs.get_entity_component(entity_id1, Health))
+        ecs.get_entity_component(entity_id1, Health).current = 1.0
+
+        self.assertListEqual([entity_id1, entity_id2], ecs.query(Health).entities())
+        self.assertEqual(5.0, ecs.get_entity_component(entity_id2, Health).current)
+
+    def test_deferred_view_is_keyed_by_component_type(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, Health(5.0))
+        ecs.add_component(entity_id2, Health(7.0))
+
+        ecs.defer().add_component(entity_id2, ecs.get_entity_component(entity_id1, Health))
+        ecs.flush()
+
+        self.assertListEqual([entity_id1, entity_id2], ecs.query(Health).entities())
+        self.assertEqual(5.0, ecs.get_entity_component(entity_id2, Health).current)
+
+    def test_pool_lookup_requires_registration(self):
+        ecs = ECS()
+
+        with self.assertRaises(KeyError):
+            ecs.pool(Health)
+
+    # Command Buffer
+    def test_deferred_changes_are_applied_on_flush(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'a')
+
+        ecs.defer().add_component(entity_id, 3)
+        ecs.defer().remove_component(entity_id, str)
+
+        self.assertTrue(ecs.entity_has_component(entity_id, str))
+        self.assertFalse(ecs.entity_has_component(entity_id, int))
+
+        ecs.flush()
+
+        self.assertFalse(ecs.entity_has_component(entity_id, str))
+        self.assertEqual(3, ecs.get_entity_component(entity_id, int))
+        self.assertEqual(0, len(ecs.defer()))
+
+    def test_deferred_changes_keep_last_command_per_component(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'a')
+
+        commands = ecs.defer()
+        commands.remove_component(entity_id, str)
+        commands.add_component(entity_id, 'b')
+        commands.add_component(entity_id, 1)
+        commands.remove_component(entity_id, int)
+        ecs.flush()
+
+        self.assertEqual('b', ecs.get_entity_component(entity_id, str))
+        self.assertFalse(ecs.entity_has_component(entity_id, int))
+
+    def test_deferred_delete_discards_pending_changes(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+
+        commands = ecs.defer()
+        commands.add_component(entity_id, 'a')
+        commands.delete_entity(entity_id)
+        commands.add_component(entity_id, 1)
+        ecs.flush()
+
+        self.assertFalse(ecs.has_entity(entity_id))
+        self.assertListEqual([], ecs.get_entities_with(str))
+        self.assertListEqual([], ecs.get_entities_with(int))
+
+    def test_execute_flushes_between_systems(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        seen = []
+        writer = MagicMock(SystemProtocol)
+        writer.execute.side_effect = lambda _: ecs.defer().add_component(entity_id, 'a')
+        reader = MagicMock(SystemProtocol)
+        reader.execute.side_effect = lambda _: seen.extend(ecs.get_entities_with(str))
+        ecs.add_system(writer)
+        ecs.add_system(reader)
+
+        ecs.execute(1.0)
+
+        self.assertListEqual([entity_id], seen)
+
+    # Scheduler
+    def test_non_conflicting_systems_share_a_stage(self):
+        ecs = ECS()
+        mover = DeclaredSystem(reads=(float,), writes=(int,))
+        namer = DeclaredSystem(reads=(float,), writes=(str,))
+        reader = DeclaredSystem(reads=(int,))
+        ecs.add_system(mover)
+        ecs.add_system(namer)
+        ecs.add_system(reader)
+
+        self.assertListEqual([[mover, namer], [reader]], ecs.stages)
+
+    def test_undeclared_system_is_a_barrier(self):
+        ecs = ECS()
+        first = DeclaredSystem(writes=(int,))
+        barrier = MagicMock(SystemProtocol)
+        last = DeclaredSystem(writes=(str,))
+        ecs.add_system(first)
+        ecs.add_system(barrier)
+        ecs.add_system(last)
+
+        self.assertListEqual([[first], [barrier], [last]], ecs.stages)
+
+    def test_stages_are_rebuilt_when_systems_change(self):
+        ecs = ECS()
+        writer = DeclaredSystem(writes=(int,))
+        ecs.add_system(writer)
+        self.assertListEqual([[writer]], ecs.stages)
+
+        reader = DeclaredSystem(reads=(int,))
+        ecs.add_system(reader)
+
+        self.assertListEqual([[writer], [reader]], ecs.stages)
+
+    def test_parallel_stages_flush_before_next_stage(self):
+        ecs = ECS(workers=2)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        seen = []
+        adds_str = DeclaredSystem(writes=(str,))
+        adds_str.execute.side_effect = lambda _: ecs.defer().add_component(entity_id1, 'a')
+        adds_int = DeclaredSystem(writes=(int,))
+        adds_int.execute.side_effect = lambda _: ecs.defer().add_component(entity_id2, 1)
+        reader = DeclaredSystem(reads=(str, int))
+        reader.execute.side_effect = lambda _: seen.extend(ecs.get_entities_with(str) + ecs.get_entities_with(int))
+        ecs.add_system(adds_str)
+        ecs.add_system(adds_int)
+        ecs.add_system(reader)
+
+        ecs.execute(1.0)
+
+        self.assertEqual(2, len(ecs.stages))
+        self.assertListEqual([entity_id1, entity_id2], seen)
+
+    def test_reset_shuts_down_worker_threads(self):
+        ecs = ECS(workers=2)
+        ecs.add_system(DeclaredSystem(writes=(str,)))
+        ecs.add_system(DeclaredSystem(writes=(int,)))
+        ecs.execute(1.0)
+        executor = ecs.scheduler.executor
+
+        ecs.reset()
+
+        self.assertIsNotNone(executor)
+        self.assertIsNone(ecs.scheduler.executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+    # Change Detection
+    def test_query_changed_since_tick(self):
+        ecs = ECS()
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, 'a')
+        ecs.add_component(entity_id2, 'b')
+        tick = ecs.tick
+        ecs.tick += 1
+
+        ecs.add_component(entity_id2, 'c')
+        ecs.add_component(entity_id1, 1)
+
+        self.assertListEqual([(entity_id2, ('c',))], ecs.query(str).changed(tick))
+        self.assertListEqual([(entity_id1, ('a', 1))], ecs.query(str, int).changed(tick, int))
+
+    def test_mark_changed(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'a')
+        tick = ecs.tick
+        ecs.tick += 1
+
+        self.assertFalse(ecs.is_changed(entity_id, str, tick))
+
+        ecs.mark_changed(entity_id, str)
+        ecs.mark_changed(entity_id, int)
+
+        self.assertTrue(ecs.is_changed(entity_id, str, tick))
+        self.assertFalse(ecs.is_changed(entity_id, int, tick))
+
+    def test_mark_changed_many_after_pool_write(self):
+        ecs = ECS()
+        pool = ecs.add_pool(Health)
+        entity_ids = [ecs.create_entity() for _ in range(3)]
+        for entity_id in entity_ids:
+            ecs.add_component(entity_id, Health(5.0))
+        tick = ecs.tick
+        ecs.tick += 1
+
+        pool['current'][ecs.query(Health).slots()[:2]] -= 1.0
+        ecs.mark_changed_many(entity_ids[:2], Health)
+
+        self.assertListEqual(entity_ids[:2], [entity_id for entity_id, _ in ecs.query(Health).changed(tick)])
+
+    def test_systems_see_each_change_once(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        seen = []
+        system = DeclaredSystem(reads=(str,))
+        system.last_run = 0
+        system.execute.side_effect = lambda _: seen.append(ecs.query(str).changed(system.last_run))
+        ecs.add_system(system)
+        ecs.add_component(entity_id, 'a')
+
+        ecs.execute(1.0)
+        ecs.execute(1.0)
+        ecs.add_component(entity_id, 'b')
+        ecs.execute(1.0)
+
+        self.assertListEqual([[(entity_id, ('a',))], [], [(entity_id, ('b',))]], seen)
+
+    # Snapshot
+    def test_restore_snapshot(self):
+        ecs = ECS()
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.add_component(entity_id1, Inventory(['sword']))
+        ecs.add_component(entity_id2, 'a')
+        snapshot = ecs.snapshot()
+
+        ecs.get_entity_component(entity_id1, Inventory).items.append('shield')
+        ecs.delete_entity(entity_id2)
+        entity_id3 = ecs.create_entity()
+        ecs.add_component(entity_id3, 'b')
+        ecs.restore(snapshot)
+
+        self.assertTrue(ecs.has_entity(entity_id2))
+        self.assertFalse(ecs.has_entity(entity_id3))
+        self.assertListEqual(['sword'], ecs.get_entity_component(entity_id1, Inventory).items)
+        self.assertListEqual([(entity_id2, ('a',))], list(ecs.query(str)))
+
+    def test_snapshot_can_be_restored_many_times(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Inventory(['sword']))
+        snapshot = ecs.snapshot()
+
+        for _ in range(2):
+            ecs.restore(snapshot)
+            ecs.get_entity_component(entity_id, Inventory).items.clear()
+            ecs.add_component(entity_id, 1)
+
+        ecs.restore(snapshot)
+        self.assertListEqual([Inventory(['sword'])], ecs.get_all_entity_components(entity_id))
+
+    def test_restore_pooled_components(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Health(5.0))
+        snapshot = ecs.snapshot()
+
+        ecs.get_entity_component(entity_id, Health).current = 1.0
+        ecs.restore(snapshot)
+
+        self.assertEqual(5.0, ecs.get_entity_component(entity_id, Health).current)
+
+    def test_snapshot_is_private_from_held_references(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Inventory(['sword']))
+        held = ecs.get_entity_component(entity_id, Inventory)
+        snapshot = ecs.snapshot()
+
+        held.items = ['shield']
+        ecs.restore(snapshot)
+
+        self.assertListEqual(['sword'], ecs.get_entity_component(entity_id, Inventory).items)
+
+    def test_snapshot_does_not_copy_on_read(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Inventory(['sword']))
+        held = ecs.get_entity_component(entity_id, Inventory)
+
+        ecs.fork()
+
+        self.assertIs(held, ecs.get_entity_component(entity_id, Inventory))
+        self.assertIs(held, next(iter(ecs.query(Inventory)))[1][0])
+
+    def test_fork_is_independent(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Health(5.0))
+        ecs.add_component(entity_id, Inventory(['sword']))
+
+        fork = ecs.fork()
+        fork.get_entity_component(entity_id, Health).current = 1.0
+        fork.get_entity_component(entity_id, Inventory).items.append('shield')
+        fork.add_component(fork.create_entity(), 'a')
+
+        self.assertEqual(1.0, fork.get_entity_component(entity_id, Health).current)
+        self.assertEqual(5.0, ecs.get_entity_component(entity_id, Health).current)
+        self.assertListEqual(['sword'], ecs.get_entity_component(entity_id, Inventory).items)
+        self.assertEqual(1, len(ecs.entities))
+
+    # Resources
+    def test_insert_and_get_resource(self):
+        ecs = ECS()
+        health = Health(5.0)
+        ecs.insert_resource(health)
+
+        self.assertTrue(ecs.has_resource(Health))
+        self.assertIs(health, ecs.resource(Health))
+
+    def test_insert_resource_replaces_previous(self):
+        ecs = ECS()
+        ecs.insert_resource(Health(5.0))
+        ecs.insert_resource(Health(1.0))
+
+        self.assertEqual(Health(1.0), ecs.resource(Health))
+
+    def test_remove_resource(self):
+        ecs = ECS()
+        ecs.insert_resource(Health(5.0))
+
+        self.assertEqual(Health(5.0), ecs.remove_resource(Health))
+        self.assertFalse(ecs.has_resource(Health))
+        self.assertIsNone(ecs.resource(Health))
+        self.assertIsNone(ecs.remove_resource(Health))
+
+    def test_fork_copies_resources(self):
+        ecs = ECS()
+        ecs.insert_resource(Inventory(['sword']))
+
+        fork = ecs.fork()
+        fork.resource(Inventory).items.append('shield')
+
+        self.assertListEqual(['sword'], ecs.resource(Inventory).items)
+        self.assertListEqual(['sword', 'shield'], fork.resource(Inventory).items)
+
+    def test_fork_uses_supplied_resources(self):
+        ecs = ECS()
+        ecs.insert_resource(Health(5.0))
+        inventory = Inventory([])
+
+        fork = ecs.fork([inventory])
+
+        self.assertIs(inventory, fork.resource(Inventory))
+        self.assertFalse(fork.has_resource(Health))
+
+    # Events
+    def test_reader_reads_each_event_once(self):
+        ecs = ECS()
+        reader = ecs.reader(str)
+        ecs.send('a')
+        ecs.send('b')
+
+        self.assertListEqual(['a', 'b'], reader.read())
+        ecs.execute(0)
+        ecs.send('c')
+        self.assertListEqual(['c'], reader.read())
+        self.assertListEqual([], reader.read())
+
+    def test_events_live_for_two_updates(self):
+        ecs = ECS()
+        reader = ecs.reader(str)
+        ecs.send('a')
+
+        ecs.execute(0)
+        self.assertEqual(1, len(reader))
+        ecs.execute(0)
+        self.assertListEqual([], reader.read())
+
+    def test_late_system_reads_events_sent_after_it(self):
+        ecs = ECS()
+        received = []
+        reader = ecs.reader(str)
+        reading_system = DeclaredSystem(reads=(str,))
+        reading_system.execute.side_effect = lambda _: received.extend(reader.read())
+        sending_system = DeclaredSystem(writes=(str,))
+        sending_system.execute.side_effect = lambda _: ecs.send('a')
+        ecs.add_system(reading_system)
+        ecs.add_system(sending_system)
+
+        ecs.execute(0)
+        self.assertListEqual([], received)
+        ecs.execute(0)
+        self.assertListEqual(['a'], received)
+
+    def test_restore_drops_pending_events(self):
+        ecs = ECS()
+        reader = ecs.reader(str)
+        snapshot = ecs.snapshot()
+        ecs.send('a')
+
+        ecs.restore(snapshot)
+
+        self.assertListEqual([], reader.read())
+
+    # Serialization
+    def test_serialized_world_round_trip(self):
+        ecs = ECS()
+        ecs.add_pool(Health)
+        entity_id1 = ecs.create_entity()
+        entity_id2 = ecs.create_entity()
+        ecs.delete_entity(ecs.create_entity())
+        ecs.add_component(entity_id1, Health(5.0))
+        ecs.add_component(entity_id1, Inventory(['sword']))
+        ecs.add_component(entity_id2, Inventory([]))
+        ecs.add_component(entity_id2, 'a')
+
+        serializer = WorldSerializer(allowed=(Health, Inventory, str))
+        loaded = ECS()
+        loaded.restore(serializer.loads(serializer.dumps(ecs)))
+
+        self.assertEqual(5.0, loaded.get_entity_component(entity_id1, Health).current)
+        self.assertListEqual([Inventory([]), 'a'], loaded.get_all_entity_components(entity_id2))
+        self.assertListEqual(['sword'], loaded.get_entity_component(entity_id1, Inventory).items)
+        self.assertEqual(2, len(loaded.entities))
+        self.assertEqual(ecs.create_entity(), loaded.create_entity())
+
+    def test_serialized_world_uses_type_keys(self):
+        ecs = ECS()
+        ecs.add_component(ecs.create_entity(), Inventory(['sword']))
+
+        data = WorldSerializer({Inventory: 'items/inventory'}).dumps(ecs)
+
+        self.assertIn(b'items/inventory', data)
+        self.assertNotIn(b'test_ecs', data)
+
+    def test_serialized_world_skips_transient_components(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, Inventory(['sword']))
+        ecs.add_component(entity_id, 'a')
+
+        serializer = WorldSerializer(transient=(str,), allowed=(Inventory,))
+        loaded = ECS()
+        loaded.restore(serializer.loads(serializer.dumps(ecs)))
+
+        self.assertListEqual([Inventory(['sword'])], loaded.get_all_entity_components(entity_id))
+
+    def test_serialized_world_keeps_entities_without_saved_components(self):
+        ecs = ECS()
+        bare_id = ecs.create_entity()
+        transient_id = ecs.create_entity()
+        ecs.add_component(transient_id, 'a')
+
+        serializer = WorldSerializer(transient=(str,), allowed=(int,))
+        loaded = ECS()
+        loaded.restore(serializer.loads(serializer.dumps(ecs)))
+
+        for entity_id in (bare_id, transient_id):
+            self.assertTrue(loaded.has_entity(entity_id))
+            self.assertListEqual([], loaded.get_all_entity_components(entity_id))
+            loaded.add_component(entity_id, 3)
+            self.assertEqual(3, loaded.get_entity_component(entity_id, int))
+            loaded.delete_entity(entity_id)
+            self.assertFalse(loaded.has_entity(entity_id))
+
+    def test_load_rejects_pool_with_custom_layout(self):
+        ecs = ECS()
+        ecs.add_pool(Health, {'current': Scalar(np.int64)})
+        ecs.add_component(ecs.create_entity(), Health(5))
+        serializer = WorldSerializer(allowed=(Health,))
+
+        with self.assertRaises(ValueError):
+            serializer.loads(serializer.dumps(ecs))
+
+    def test_load_rejects_foreign_data(self):
+        with self.assertRaises(ValueError):
+            WorldSerializer().loads(b'nope')
+
+    def test_load_rejects_unregistered_types(self):
+        ecs = ECS()
+        ecs.add_component(ecs.create_entity(), Inventory(['sword']))
+        data = WorldSerializer().dumps(ecs)
+
+        with self.assertRaises(ValueError):
+            WorldSerializer().loads(data)
+
+    def test_load_refuses_unknown_pickled_globals(self):
+        ecs = ECS()
+        ecs.add_component(ecs.create_entity(), Inventory([Path('.')]))
+        serializer = WorldSerializer(allowed=(Inventory,))
+
+        with self.assertRaises(pickle.UnpicklingError):
+            serializer.loads(serializer.dumps(ecs))
+
+    # Runner
+    def test_runner_simulates_fixed_steps(self):
+        ecs = ECS()
+        system = DeclaredSystem()
+        ecs.add_system(system)
+        runner = Runner(ecs, step=0.25)
+
+        self.assertEqual(2, runner.advance(0.625))
+        system.execute.assert_called_with(0.25)
+        self.assertAlmostEqual(0.5, runner.alpha)
+        self.assertEqual(1, runner.advance(0.125))
+
+    def test_runner_caps_catch_up_steps(self):
+        ecs = ECS()
+        ecs.add_system(DeclaredSystem())
+        runner = Runner(ecs, step=0.25, max_steps=2)
+
+        self.assertEqual(2, runner.advance(10.1))
+        self.assertLess(runner.accumulator, runner.step)
+
+    def test_runner_renders_once_per_frame(self):
+        ecs = ECS()
+        simulation = DeclaredSystem()
+        render = DeclaredSystem()
+        ecs.add_system(simulation)
+        runner = Runner(ecs, step=0.25)
+        runner.add_render_system(render)
+
+        runner.advance(0.1)
+
+        simulation.execute.assert_not_called()
+        render.execute.assert_called_once_with(0.1)
+
+    def test_runner_headless_stops_when_world_stops(self):
+        ecs = ECS()
+        system = DeclaredSystem()
+        system.execute.side_effect = lambda _: setattr(ecs, 'running', ecs.tick < 5)
+        ecs.add_system(system)
+
+        self.assertEqual(5, Runner(ecs).run_headless(100))
+
+    # Profiler
+    def test_profiler_records_systems_and_frames(self):
+        ecs = ECS()
+        ecs.profiler = Profiler(capacity=2)
+        system = DeclaredSystem(reads=(str,))
+        system.query = ecs.query(str)
+        ecs.add_component(ecs.create_entity(), 'a')
+        ecs.add_system(system)
+
+        for _ in range(3):
+            ecs.execute(1.0)
+
+        stats = ecs.profiler.systems[id(system)]
+        self.assertEqual(3, stats.calls)
+        self.assertEqual(2, len(stats.samples))
+        self.assertEqual(1, stats.entities())
+        self.assertEqual(2, len(ecs.profiler.frames))
+        self.assertSetEqual({50, 95, 99}, set(ecs.profiler.percentiles()['DeclaredSystem']))
+
+    def test_runner_records_one_frame_per_advance(self):
+        ecs = ECS()
+        ecs.profiler = Profiler()
+        ecs.add_system(DeclaredSystem())
+        runner = Runner(ecs, step=1.0)
+        runner.add_render_system(DeclaredSystem())
+
+        self.assertEqual(3, runner.advance(3.0))
+        self.assertEqual(1, len(ecs.profiler.frames))
+
+    def test_profiler_is_enabled_by_environment(self):
+        with patch.dict(os.environ, {PROFILE_VARIABLE: '1'}):
+            self.assertIsInstance(profiler_from_environment(), Profiler)
+        with patch.dict(os.environ, clear=True):
+            self.assertIsNone(profiler_from_environment())
+
+    def test_profiler_exports_chrome_trace(self):
+        ecs = ECS()
+        ecs.profiler = Profiler()
+        ecs.add_system(DeclaredSystem())
+        ecs.execute(1.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'trace.json'
+            ecs.profiler.export(path)
+            trace = json.loads(path.read_text())
+
+        self.assertListEqual(['frame', 'DeclaredSystem'], [event['name'] for event in trace['traceEvents']])
+        self.assertTrue(all(event['ph'] == 'X' for event in trace['traceEvents']))
+
     # Debug
     def test_get_all_entity_components(self):
         ecs = ECS()
@@ -290,7 +1123,16 @@ class TestECS(unittest.TestCase):
 
         components = ecs.get_all_entity_components(entity_id)
 
-        self.assertListEqual(['a', 7, None], components)
+        self.assertListEqual(['a', 7], components)
+
+    def test_get_entity_signature(self):
+        ecs = ECS()
+        entity_id = ecs.create_entity()
+        ecs.add_component(entity_id, 'a')
+        ecs.add_component(entity_id, 7)
+
+        self.assertSetEqual({str, int}, ecs.get_entity_signature(entity_id))
+        self.assertIsNone(ecs.get_entity_signature(entity_id+1))
 
     def test_get_all_entity_components_of_non_existing_entity(self):
         ecs = ECS()
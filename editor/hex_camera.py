@@ -1,7 +1,9 @@
 from typing import Optional
+import numpy as np
 import pygame
 
 from model.hex_coordinate import VecF2
+from model.hex_geometry import AxialRegion, HexLayout
 
 
 class HexCamera:
@@ -27,6 +29,14 @@ class HexCamera:
     def screen_to_world(self, screen_position: VecF2) -> VecF2:
         return (screen_position - self.position) / self.zoom
 
+    def world_to_screen_points(self, world_points: np.ndarray) -> np.ndarray:
+        return world_points * self.zoom + self.position.as_tuple
+
+    def visible_region(self, viewport: pygame.Rect, layout: HexLayout) -> AxialRegion:
+        top_left = self.screen_to_world(VecF2(viewport.left, viewport.top))
+        bottom_right = self.screen_to_world(VecF2(viewport.right, viewport.bottom))
+        return layout.region(top_left.x, top_left.y, bottom_right.x, bottom_right.y)
+
     def zoom_by(self, amount: float) -> None:
         self.zoom += amount
         self.zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM, self.zoom))
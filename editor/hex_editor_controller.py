@@ -98,6 +98,7 @@ class HexEditorController:
         self.hex_map_view = HexMapView(self.screen, self.layout, self.camera)
         self.hex_map_model.hex_map.bind(self.state.set_hex_map)
         self.hex_map_model.hex_map.bind(self.hex_map_view.set_hex_map)
+        self.hex_map_model.bind_cell_changed(self.hex_map_view.invalidate_cell)
         self.hex_map_model.hex_map.set(HexMap({}))
 
         self.ui_context = UIContext(self, self.state, self.screen)
@@ -10,7 +10,7 @@ from model.hex_coordinate import HexCoordinate
 from model.hex_map import HexCell, HexMap
 from model.spawn import SpawnLibrary
 from model.terrain import TerrainLibrary
-from pathfinding.pathfinding import PathfindingHelper
+from pathfinding.pathfinding import PathfindingHelper, ReachableSet
 
 
 class PopupType(Enum):
@@ -75,6 +75,7 @@ class HexMapEditorState:
         self.hovered_cell: Observable[Optional[HexCoordinate]] = Observable(None)
         self.path: Observable[List[HexCell]] = Observable([])
         self.reachable_cells: Observable[List[HexCell]] = Observable([])
+        self.reachable: Optional[ReachableSet] = None
         self.in_range: Observable[List[HexCell]] = Observable([])
         self.ring: Observable[List[HexCell]] = Observable([])
 
@@ -103,16 +104,23 @@ class HexMapEditorState:
 
     def update_path(self, _: Any) -> None:
         if self.editor_mode.get() == HexEditorMode.TEST and self.test_tools[HexTestTool.PATH].get() and self.selected_cell.get() and self.hovered_cell.get():
-            self.path.set(PathfindingHelper.astar(self.hex_map, self.selected_cell.get(), self.hovered_cell.get()))
+            self.path.set(self.find_path(self.selected_cell.get(), self.hovered_cell.get()))
         else:
             self.path.set([])
 
     def update_reachable_cells(self, _: Any) -> None:
         if self.editor_mode.get() == HexEditorMode.TEST and self.test_tools[HexTestTool.MOVE].get() and self.selected_cell.get() and self.move_power.get():
-            self.reachable_cells.set(PathfindingHelper.bfs(self.hex_map, self.selected_cell.get(), self.move_power.get()))
+            self.reachable = PathfindingHelper.reachable(self.hex_map, self.selected_cell.get(), self.move_power.get())
+            self.reachable_cells.set(self.reachable.cells)
         else:
+            self.reachable = None
             self.reachable_cells.set([])
 
+    def find_path(self, origin: HexCoordinate, destination: HexCoordinate) -> List[HexCell]:
+        if self.reachable is not None and self.reachable.origin == origin and destination in self.reachable:
+            return self.reachable.path(destination)
+        return PathfindingHelper.astar(self.hex_map, origin, destination)
+
     def update_in_range(self, _: Any) -> None:
         if self.editor_mode.get() == HexEditorMode.TEST and self.test_tools[HexTestTool.RANGE].get() and self.selected_cell.get() and self.distance.get():
             self.in_range.set(PathfindingHelper.in_range(self.hex_map, self.selected_cell.get(), self.distance.get()))
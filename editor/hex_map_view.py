@@ -1,3 +1,6 @@
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
 import pygame
 
 from battle.unit import Unit
@@ -5,12 +8,14 @@ from editor.hex_camera import HexCamera
 from editor.hex_editor_state import HexEditorMode, UIContext
 from model.hex_coordinate import HexCoordinate, VecF2
 from model.hex_geometry import HexLayout
-from model.hex_map import HexMap
+from model.hex_map import HexCell, HexMap
 from ui.elements import Panel
 
 
 class HexMapView:
 
+    MAX_LAYER_PIXELS = 4096 * 4096
+
     def __init__(self, screen: pygame.Surface, layout: HexLayout, camera: HexCamera):
         self.screen = screen
         self.area = None
@@ -18,14 +23,33 @@ class HexMapView:
         self.camera = camera
         self.hex_map = None
         self.font = pygame.font.SysFont('Arial', 20)
+        self.layer: Optional[pygame.Surface] = None
+        self.layer_zoom: Optional[float] = None
+        self.layer_origin = (0, 0)
+        self.layer_oversized = False
+        self.dirty_cells: Set[HexCoordinate] = set()
 
     def set_hex_map(self, hex_map: HexMap) -> None:
+        if hex_map is not self.hex_map:
+            self.invalidate()
         self.hex_map = hex_map
 
     def set_hex_map_area(self, area: pygame.Rect) -> None:
         self.area = area
         self.camera.set_origin(VecF2(*self.area.center))
 
+    def invalidate(self) -> None:
+        self.layer = None
+        self.layer_zoom = None
+        self.layer_oversized = False
+        self.dirty_cells.clear()
+
+    def invalidate_cell(self, coordinate: HexCoordinate) -> None:
+        if self.layer is not None:
+            self.dirty_cells.add(coordinate)
+        elif not self.layer_oversized:
+            self.invalidate()
+
     def hex_to_world_point(self, coordinate: HexCoordinate) -> VecF2:
         return self.layout.hex_to_point(coordinate)
 
@@ -38,12 +62,78 @@ class HexMapView:
             self.draw_hex_map(self.hex_map)
 
     def draw_hex_map(self, hex_map: HexMap) -> None:
+        if hex_map is not self.hex_map:
+            self.set_hex_map(hex_map)
+        if self.layer_zoom != self.camera.zoom:
+            self.invalidate()
+            self.render_layer(hex_map)
+        elif self.dirty_cells:
+            self.update_layer(hex_map)
+
         self.screen.set_clip(self.area)
-        for cell in hex_map.sorted_cells:
-            hex_center = self.hex_to_world_point(cell.coordinate)
-            self.draw_hex_cell(hex_center, cell.color, cell.frame_color)
+        if self.layer is not None:
+            position = self.camera.position
+            self.screen.blit(self.layer, (position.x + self.layer_origin[0], position.y + self.layer_origin[1]))
+        else:
+            self.draw_cells(self.screen, self.visible_cells(hex_map), self.camera.position.as_tuple)
         self.screen.set_clip(None)
 
+    def visible_cells(self, hex_map: HexMap) -> List[HexCell]:
+        region = self.camera.visible_region(self.area or self.screen.get_rect(), self.layout)
+        if region.size < len(hex_map.cells):
+            cells = [hex_map[coordinate] for coordinate in region if coordinate in hex_map]
+            return sorted(cells, key=lambda cell: cell.spawn.spawn_type)
+        return [cell for cell in hex_map.sorted_cells if cell.coordinate in region]
+
+    def hex_corners(self, coordinates: List[HexCoordinate], offset: Tuple[float, float]) -> np.ndarray:
+        axial = np.array([(coordinate.q, coordinate.r) for coordinate in coordinates]).reshape(-1, 2)
+        return self.layout.hex_corners(self.layout.hexes_to_points(axial)) * self.camera.zoom + offset
+
+    def draw_cells(self, surface: pygame.Surface, cells: List[HexCell], offset: Tuple[float, float]) -> None:
+        corners = self.hex_corners([cell.coordinate for cell in cells], offset)
+        for cell, corners in zip(cells, corners.tolist()):
+            pygame.draw.polygon(surface, cell.color, corners)
+            pygame.draw.polygon(surface, cell.frame_color, corners, 2)
+
+    def render_layer(self, hex_map: HexMap) -> None:
+        self.layer_zoom = self.camera.zoom
+        cells = hex_map.sorted_cells
+        if not cells:
+            return
+
+        corners = self.hex_corners([cell.coordinate for cell in cells], (0, 0))
+        left, top = np.floor(corners.min(axis=(0, 1))).astype(int) - 2
+        right, bottom = np.ceil(corners.max(axis=(0, 1))).astype(int) + 2
+        if (right - left) * (bottom - top) > self.MAX_LAYER_PIXELS:
+            self.layer_oversized = True
+            return
+
+        self.layer = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        self.layer_origin = (int(left), int(top))
+        self.draw_cells(self.layer, cells, (-left, -top))
+
+    def update_layer(self, hex_map: HexMap) -> None:
+        left, top = self.layer_origin
+        bounds = self.layer.get_rect()
+        offset = (-left, -top)
+        for coordinate in self.dirty_cells:
+            corners = self.hex_corners([coordinate], offset)[0]
+            region_left, region_top = np.floor(corners.min(axis=0)).astype(int) - 2
+            region_right, region_bottom = np.ceil(corners.max(axis=0)).astype(int) + 2
+            region = pygame.Rect(region_left, region_top, region_right - region_left, region_bottom - region_top)
+            if not bounds.contains(region):
+                self.invalidate()
+                self.render_layer(hex_map)
+                return
+
+            cells = [hex_map[coordinate]] if coordinate in hex_map else []
+            cells = sorted(cells + hex_map.neighbors(coordinate), key=lambda cell: cell.spawn.spawn_type)
+            self.layer.set_clip(region)
+            self.layer.fill((0, 0, 0, 0))
+            self.draw_cells(self.layer, cells, offset)
+            self.layer.set_clip(None)
+        self.dirty_cells.clear()
+
     def draw_hex_cell(self, hex_center: VecF2, color: pygame.Color = None, frame_color: pygame.Color = None) -> None:
         corners = self.layout.get_hex_corners(hex_center)
         corners_tuples = [self.camera.world_to_screen(corner).as_tuple for corner in corners]
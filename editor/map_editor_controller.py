@@ -7,19 +7,17 @@ from editor.map_editor_viewer import Map, MapDisplaySource, MapRendererSystem
 from ui.components.data import Variable
 from ui.components.rendering import ForceRedraw
 from ui.systems.event import EventConverterSystem
-from ui.systems.mouse_event import CleanupMouseClickedSystem, CleanupMouseReleasedSystem, MouseFocusSystem, MouseHoverSystem, MousePressedSystem, MouseReleasedSystem, MouseSelectSystem, MouseToggleSystem
+from ui.systems.mouse_event import MouseFocusSystem, MouseHoverSystem, MousePressedSystem, MouseReleasedSystem, MouseSelectSystem, MouseToggleSystem
 from ui.widgets import create_button, create_int_text_input, create_panel, create_radio_button, create_text, create_text_input, create_toggle
-from ui.systems.keyboard_event import CleanupKeyDownSystem, DeleteKeySystem, EnterKeySystem, TypingKeyDownSystem
-from ui.systems.renderer import CleanupRendererSystem, RelativeToRectConverter, RendererSystem
+from ui.systems.keyboard_event import DeleteKeySystem, EnterKeySystem, TypingKeyDownSystem
+from ui.systems.renderer import RelativeToRectConverter, RendererSystem
 
 
 class MapEditorController:
 
-    def __init__(self, world: ECS, screen: Surface, mouse: int, keyboard: int):
+    def __init__(self, world: ECS, screen: Surface):
         self.world = world
         self.screen = screen
-        self.mouse = mouse
-        self.keyboard = keyboard
 
         self.editor = self.create_editor()
 
@@ -93,17 +91,17 @@ class MapEditorController:
         self.world.add_component(notification_text, FeedbackDisplayer())
 
     def initialize_systems(self) -> None:
-        self.world.add_system(EventConverterSystem(self.world, self.mouse, self.keyboard))
-        self.world.add_system(MouseHoverSystem(self.world, self.mouse))
-        self.world.add_system(MouseFocusSystem(self.world, self.mouse))
-        self.world.add_system(MouseToggleSystem(self.world, self.mouse))
-        self.world.add_system(MouseSelectSystem(self.world, self.mouse))
-        self.world.add_system(MousePressedSystem(self.world, self.mouse))
-        self.world.add_system(MouseReleasedSystem(self.world, self.mouse))
+        self.world.add_system(EventConverterSystem(self.world))
+        self.world.add_system(MouseHoverSystem(self.world))
+        self.world.add_system(MouseFocusSystem(self.world))
+        self.world.add_system(MouseToggleSystem(self.world))
+        self.world.add_system(MouseSelectSystem(self.world))
+        self.world.add_system(MousePressedSystem(self.world))
+        self.world.add_system(MouseReleasedSystem(self.world))
         
-        self.world.add_system(EnterKeySystem(self.world, self.keyboard))
-        self.world.add_system(DeleteKeySystem(self.world, self.keyboard))
-        self.world.add_system(TypingKeyDownSystem(self.world, self.keyboard))
+        self.world.add_system(EnterKeySystem(self.world))
+        self.world.add_system(DeleteKeySystem(self.world))
+        self.world.add_system(TypingKeyDownSystem(self.world))
 
         self.world.add_system(MapCreator(self.world))
         self.world.add_system(MapLoader(self.world))
@@ -114,12 +112,6 @@ class MapEditorController:
         self.world.add_system(RendererSystem(self.world, self.screen))
         self.world.add_system(MapRendererSystem(self.world, self.screen))
 
-        self.world.add_system(CleanupMouseClickedSystem(self.world, self.mouse))
-        self.world.add_system(CleanupMouseReleasedSystem(self.world, self.mouse))
-        self.world.add_system(CleanupKeyDownSystem(self.world, self.keyboard))
-        
-        self.world.add_system(CleanupRendererSystem(self.world))
-
         self.world.add_system(CleanupSaveMap(self.world))
         self.world.add_system(CleanupLoadMap(self.world))
         self.world.add_system(CleanupCreateMap(self.world))
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 from random import randint
 
-from ecs_framework.ecs import ECS, ComponentProtocol, SystemProtocol
+from ecs_framework.ecs import ECS, Component, SystemProtocol
 from editor.map_editor_feedback import Feedback
 from editor.map_editor_io import MapInputReference
 from model.hex_map import HexMap
@@ -15,20 +15,20 @@ class MapType(Enum):
     Random = 2
 
 
-@dataclass
-class CreateMapTrigger(ComponentProtocol):
+@dataclass(slots=True)
+class CreateMapTrigger(Component):
     pass
 
 
-@dataclass
-class MapConfiguration(ComponentProtocol):
+@dataclass(slots=True)
+class MapConfiguration(Component):
     map_type: MapType
 
 
-@dataclass
-class RadiusInputReference(ComponentProtocol):
+@dataclass(slots=True)
+class RadiusInputReference(Component):
     entity: int
-    component: ComponentProtocol
+    component: type
     field: str
 
 
@@ -39,16 +39,17 @@ class MapCreator(SystemProtocol):
         self.hex_map_builder = HexMapBuilder()
 
     def execute(self, delta_time):
+        commands = self.world.defer()
         for entity, (map_configuration, radius_input, map_input, _) in self.world.get_entities_with_components(MapConfiguration, RadiusInputReference, MapInputReference, CreateMapTrigger):
             map_type = map_configuration.map_type
             radius = int(self.world.get_entity_component(radius_input.entity, radius_input.component).__getattribute__(radius_input.field))
             hex_map = self.create_map(map_type, radius)
 
-            self.world.add_component(map_input.entity, map_input.component(hex_map))
+            commands.add_component(map_input.entity, map_input.component(hex_map))
             radius_message = ''
             if map_type != MapType.Empty:
                 radius_message = f'with radius {radius} '
-            self.world.add_component(entity, Feedback(f'{map_type.name} Map {radius_message}created successfully'))
+            commands.add_component(entity, Feedback(f'{map_type.name} Map {radius_message}created successfully'))
             
     def create_map(self, map_type: MapType, radius: int) -> HexMap:
         match map_type:
@@ -67,9 +68,13 @@ class MapCreator(SystemProtocol):
 
 class CleanupCreateMap(SystemProtocol):
 
+    reads = ()
+    writes = (CreateMapTrigger,)
+
     def __init__(self, world: ECS):
         self.world = world
 
     def execute(self, delta_time):
+        commands = self.world.defer()
         for entity in self.world.get_entities_with(CreateMapTrigger):
-            self.world.remove_component(entity, CreateMapTrigger)
+            commands.remove_component(entity, CreateMapTrigger)
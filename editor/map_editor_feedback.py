@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from ecs_framework.ecs import ECS, ComponentProtocol, SystemProtocol
+from ecs_framework.ecs import ECS, Component, SystemProtocol
 from ui.components.data import Label
 from ui.components.rendering import NeedRedraw
 
 
-@dataclass
-class Feedback(ComponentProtocol):
+@dataclass(slots=True)
+class Feedback(Component):
     message: str
     timestamp: datetime = field(init=False)
 
@@ -14,21 +14,25 @@ class Feedback(ComponentProtocol):
         self.timestamp = datetime.now()
 
 
-@dataclass
-class FeedbackDisplayer(ComponentProtocol):
+@dataclass(slots=True)
+class FeedbackDisplayer(Component):
     pass
 
 
 class FeedbackBroadcastSystem(SystemProtocol):
 
+    reads = (Feedback, Label, FeedbackDisplayer)
+    writes = (Feedback, Label, NeedRedraw)
+
     def __init__(self, world: ECS):
         self.world = world
 
     def execute(self, delta_time):
+        commands = self.world.defer()
         all_feedbacks = []
         for entity, feedback in self.world.get_entities_with_single_component(Feedback):
             all_feedbacks.append(feedback)
-            self.world.remove_component(entity, Feedback)
+            commands.remove_component(entity, Feedback)
 
         if not all_feedbacks:
             return
@@ -38,4 +42,4 @@ class FeedbackBroadcastSystem(SystemProtocol):
 
         for entity, (label, _) in self.world.get_entities_with_components(Label, FeedbackDisplayer):
             label.label = feedback
-            self.world.add_component(entity, NeedRedraw())
+            self.world.mark_changed(entity, NeedRedraw)
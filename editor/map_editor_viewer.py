@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from pygame import Surface
 
-from ecs_framework.ecs import ECS, ComponentProtocol, SystemProtocol
+from ecs_framework.ecs import ECS, Component, SystemProtocol
 from editor.hex_camera import HexCamera
 from editor.hex_map_view import HexMapView
 from model.hex_coordinate import VecF2
@@ -11,18 +11,21 @@ from model.hex_map import HexMap
 from ui.components.layout import Rect
 
 
-@dataclass
-class Map(ComponentProtocol):
+@dataclass(slots=True)
+class Map(Component):
     hex_map: HexMap
 
 
-@dataclass
-class MapDisplaySource(ComponentProtocol):
+@dataclass(slots=True)
+class MapDisplaySource(Component):
     entity: int
 
 
 class MapRendererSystem(SystemProtocol):
 
+    reads = (Rect, MapDisplaySource, Map)
+    writes = (Surface,)
+
     def __init__(self, world: ECS, screen: Surface):
         self.world = world
         self.map_view = HexMapView(screen, HexLayout(POINTY, VecF2(20, 20)), HexCamera())
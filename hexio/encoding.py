@@ -1,6 +1,7 @@
 import json
 from typing import Any
 
+from model.dense_hex_map import DenseHexMap
 from model.hex_coordinate import HexCoordinate
 from model.hex_map import HexCell, HexMap
 from model.spawn import SpawnLibrary
@@ -38,7 +39,7 @@ class HexMapEncoder(json.JSONEncoder):
                 'terrain': object.terrain.value,
                 'spawn': object.spawn.value,
             }
-        elif isinstance(object, HexMap):
+        elif isinstance(object, HexMap | DenseHexMap):
             return {
                 'type': 'HexMap',
                 'cells': [cell for cell in object]
@@ -4,15 +4,17 @@ import pygame
 from battle.battle import BattleManager
 from battle.battle_view_ui import BattleController
 from battle.unit import Party, Unit
-from ecs_architecture.component.combat import AttackCommand, AttackTarget, AttackTargetDirty
-from ecs_architecture.component.path import MoveCommand, TargetGridPosition
-from ecs_architecture.component.position import GridPosition, GridPositionChanged
+from ecs_architecture.component.combat import AttackCommand, AttackTarget
+from ecs_architecture.component.path import MoveCommand, MovementProgress, TargetGridPosition
+from ecs_architecture.component.position import GridPosition, ScreenPosition, WorldPosition
 from ecs_architecture.component.sprite import Sprite
 from ecs_architecture.component.stats import HP, Attack, Defense
 from ecs_architecture.system.combat import AttackResolutionSystem, AttackTriggerSystem, CombatPreviewerSystem, CombatSimulatorSystem, DamageApplicationSystem, DeathSystem
 from ecs_architecture.system.movement import MovementSystem, PathCalculatorSystem, PathPreviewerSystem, PathStepperSystem, StartMovementSystem
 from ecs_architecture.system.renderer import RendererSystem, SpriteScalerSystem, SyncGridToWorldPositionSystem, WorldToScreenPositionSystem
 from ecs_framework.ecs import ECS
+from ecs_framework.profiler import profiler_from_environment
+from ecs_framework.runner import Runner
 from hexio.hex_map_io import HexMapIO
 from model.hex_coordinate import HexCoordinate
 
@@ -23,6 +25,10 @@ if __name__ == '__main__':
     clock = pygame.time.Clock()
 
     ecs = ECS()
+    ecs.profiler = profiler_from_environment()
+    for component_type in (HP, MovementProgress, WorldPosition, ScreenPosition):
+        ecs.add_pool(component_type)
+    runner = Runner(ecs)
     archer = Unit('archer', 20, 3, 4, 6, pygame.Color('lightseagreen'))
     archer_entity = ecs.create_entity()
     ecs.add_component(archer_entity, Sprite(pygame.image.load('images\\archer_small.png')))
@@ -61,12 +67,6 @@ if __name__ == '__main__':
     ecs.add_component(rogue_entity, GridPosition(rogue.position))
     ecs.add_component(bard_entity, GridPosition(bard.position))
 
-    ecs.add_component(archer_entity, GridPositionChanged())
-    ecs.add_component(knight_entity, GridPositionChanged())
-    ecs.add_component(mage_entity, GridPositionChanged())
-    ecs.add_component(rogue_entity, GridPositionChanged())
-    ecs.add_component(bard_entity, GridPositionChanged())
-
     ecs.add_component(archer_entity, Attack(10, 5))
     ecs.add_component(knight_entity, Attack(12, 2))
     ecs.add_component(mage_entity, Attack(20, 9))
@@ -86,12 +86,7 @@ if __name__ == '__main__':
     ecs.add_component(bard_entity, HP(10, 10, 5, 5))
 
     ecs.add_system(SyncGridToWorldPositionSystem(ecs, battle_ui.layout))
-    ecs.add_system(WorldToScreenPositionSystem(ecs, battle_ui.camera))
-    ecs.add_system(SpriteScalerSystem(ecs, battle_ui.camera))
-    ecs.add_system(RendererSystem(ecs, screen))
-
     ecs.add_system(PathCalculatorSystem(ecs, battle_map))
-    ecs.add_system(PathPreviewerSystem(ecs, screen, battle_ui.layout, battle_ui.camera))
     ecs.add_system(StartMovementSystem(ecs))
     ecs.add_system(PathStepperSystem(ecs, battle_ui.layout))
     ecs.add_system(MovementSystem(ecs, battle_ui.layout, 100.0))
@@ -103,6 +98,11 @@ if __name__ == '__main__':
     ecs.add_system(DamageApplicationSystem(ecs))
     ecs.add_system(DeathSystem(ecs))
 
+    runner.add_render_system(WorldToScreenPositionSystem(ecs, battle_ui.camera))
+    runner.add_render_system(SpriteScalerSystem(ecs, battle_ui.camera))
+    runner.add_render_system(RendererSystem(ecs, screen))
+    runner.add_render_system(PathPreviewerSystem(ecs, screen, battle_ui.layout, battle_ui.camera))
+
     party_entities = [archer_entity, knight_entity, mage_entity, rogue_entity, bard_entity]
 
     running = True
@@ -114,7 +114,7 @@ if __name__ == '__main__':
         screen.fill((30, 30, 30))
 
         battle_ui.draw()
-        ecs.execute(delta_time)
+        runner.advance(delta_time)
 
         # pygame.draw.rect(screen, line_color, (0, 735, 1440, 40), 2)
 
@@ -139,11 +139,9 @@ if __name__ == '__main__':
 
                 if event.unicode == 'q':
                     ecs.add_component(party_entities[0], AttackTarget(party_entities[1]))
-                    ecs.add_component(party_entities[0], AttackTargetDirty())
 
                 if event.unicode == 'w':
                     ecs.add_component(party_entities[0], AttackTarget(party_entities[2]))
-                    ecs.add_component(party_entities[0], AttackTargetDirty())
 
                 if event.unicode == 'e':
                     ecs.add_component(party_entities[0], AttackCommand())
@@ -157,4 +155,6 @@ if __name__ == '__main__':
 
         # clock.tick(60)
 
+    if ecs.profiler is not None:
+        print(ecs.profiler.summary())
     pygame.quit()
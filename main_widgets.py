@@ -2,11 +2,12 @@ from dataclasses import dataclass
 import pygame
 
 from ecs_framework.ecs import ECS
+from ecs_framework.profiler import profiler_from_environment
 from ui.systems.event import EventConverterSystem
-from ui.systems.mouse_event import CleanupMouseClickedSystem, CleanupMouseReleasedSystem, MouseFocusSystem, MouseHoverSystem, MousePressedSystem, MouseReleasedSystem, MouseSelectSystem, MouseToggleSystem
+from ui.systems.mouse_event import MouseFocusSystem, MouseHoverSystem, MousePressedSystem, MouseReleasedSystem, MouseSelectSystem, MouseToggleSystem
 from ui.widgets import create_button, create_int_text_input, create_panel, create_radio_button, create_text, create_text_input, create_toggle
-from ui.systems.keyboard_event import CleanupKeyDownSystem, DeleteKeySystem, EnterKeySystem, TypingKeyDownSystem
-from ui.systems.renderer import CleanupRendererSystem, RelativeToRectConverter, RendererSystem
+from ui.systems.keyboard_event import DeleteKeySystem, EnterKeySystem, TypingKeyDownSystem
+from ui.systems.renderer import RelativeToRectConverter, RendererSystem
 from utils.observable import Observable
 from ui.elements import Button, IntTextInput, RadioButton, Text, TextInput, Toggle, Panel
 from model.terrain import Terrain, TerrainType
@@ -29,8 +30,7 @@ if __name__ == '__main__':
     text = TextState('', '', Terrain(TerrainType.GRASS, 'green', 'black', True, 2), False)
 
     ecs = ECS()
-    mouse = ecs.create_entity()
-    keyboard = ecs.create_entity()
+    ecs.profiler = profiler_from_environment()
 
     panel = create_panel(ecs, pygame.Rect(500, 100, 300, 600))
     create_button(ecs, 'Button', pygame.Rect(10, 10, 100, 30), None, panel)
@@ -41,26 +41,22 @@ if __name__ == '__main__':
     create_toggle(ecs, 'Toggle', pygame.Rect(10, 500, 100, 30), panel)
     create_text(ecs, 'Text', pygame.Rect(10, 400, 100, 30), panel)
 
-    ecs.add_system(EventConverterSystem(ecs, mouse, keyboard))
+    ecs.add_system(EventConverterSystem(ecs))
 
-    ecs.add_system(MouseHoverSystem(ecs, mouse))
-    ecs.add_system(MouseFocusSystem(ecs, mouse))
-    ecs.add_system(MouseToggleSystem(ecs, mouse))
-    ecs.add_system(MouseSelectSystem(ecs, mouse))
-    ecs.add_system(MousePressedSystem(ecs, mouse))
-    ecs.add_system(MouseReleasedSystem(ecs, mouse))
+    ecs.add_system(MouseHoverSystem(ecs))
+    ecs.add_system(MouseFocusSystem(ecs))
+    ecs.add_system(MouseToggleSystem(ecs))
+    ecs.add_system(MouseSelectSystem(ecs))
+    ecs.add_system(MousePressedSystem(ecs))
+    ecs.add_system(MouseReleasedSystem(ecs))
 
-    ecs.add_system(EnterKeySystem(ecs, keyboard))
-    ecs.add_system(DeleteKeySystem(ecs, keyboard))
-    ecs.add_system(TypingKeyDownSystem(ecs, keyboard))
+    ecs.add_system(EnterKeySystem(ecs))
+    ecs.add_system(DeleteKeySystem(ecs))
+    ecs.add_system(TypingKeyDownSystem(ecs))
 
     ecs.add_system(RelativeToRectConverter(ecs))
     ecs.add_system(RendererSystem(ecs, screen))
 
-    ecs.add_system(CleanupMouseClickedSystem(ecs, mouse))
-    ecs.add_system(CleanupMouseReleasedSystem(ecs, mouse))
-    ecs.add_system(CleanupKeyDownSystem(ecs, keyboard))
-    ecs.add_system(CleanupRendererSystem(ecs))
 
     panel = Panel(screen, pygame.Rect(100, 100, 300, 600), pygame.Color((30, 30, 30)), pygame.Color('red'))
 
@@ -95,4 +91,6 @@ if __name__ == '__main__':
 
         clock.tick(60)
 
+    if ecs.profiler is not None:
+        print(ecs.profiler.summary())
     pygame.quit()
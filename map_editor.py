@@ -1,6 +1,7 @@
 import pygame
 
 from ecs_framework.ecs import ECS
+from ecs_framework.profiler import profiler_from_environment
 from editor.map_editor_controller import MapEditorController
 
 
@@ -11,10 +12,9 @@ if __name__ == '__main__':
     clock = pygame.time.Clock()
 
     world = ECS()
-    mouse = world.create_entity()
-    keyboard = world.create_entity()
+    world.profiler = profiler_from_environment()
 
-    map_editor = MapEditorController(world, screen, mouse, keyboard)
+    map_editor = MapEditorController(world, screen)
 
     while world.running:
         delta_time = clock.get_time()
@@ -22,4 +22,6 @@ if __name__ == '__main__':
         pygame.display.flip()
         clock.tick(60)
 
+    if world.profiler is not None:
+        print(world.profiler.summary())
     pygame.quit()
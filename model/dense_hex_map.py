@@ -0,0 +1,270 @@
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Dict, List, Optional, Self, Tuple
+
+import numpy as np
+
+from battle.unit import Unit
+from model.hex_coordinate import DIRECTIONS, HexCoordinate
+from model.hex_map import HexCell, HexMap
+from model.spawn import Spawn, SpawnLibrary, SpawnType
+from model.terrain import Terrain, TerrainLibrary, TerrainType
+
+NO_TERRAIN = 0
+NEIGHBOR_OFFSETS = [[(dq + (parity + dr) // 2, dr) for dq, dr in DIRECTIONS] for parity in (0, 1)]
+
+
+def offset_column(q: int, r: int) -> int:
+    return q + r // 2
+
+
+class DenseHexCell(HexCell):
+
+    def __init__(self, hex_map: 'DenseHexMap', index: int):
+        self.hex_map = hex_map
+        self.index = index
+
+    @property
+    def coordinate(self) -> HexCoordinate:
+        return self.hex_map.coordinate(self.index)
+
+    @property
+    def terrain(self) -> Terrain:
+        return TerrainLibrary.get(TerrainType(int(self.hex_map.terrain[self.index])))
+
+    @terrain.setter
+    def terrain(self, terrain: Terrain) -> None:
+        self.hex_map.set_terrain(self.index, terrain)
+
+    @property
+    def spawn(self) -> Spawn:
+        return SpawnLibrary.get(SpawnType(int(self.hex_map.spawn[self.index])))
+
+    @spawn.setter
+    def spawn(self, spawn: Spawn) -> None:
+        self.hex_map.spawn[self.index] = spawn.value
+
+    @property
+    def unit(self) -> Optional[Unit]:
+        return self.hex_map.units.get(self.index)
+
+    @unit.setter
+    def unit(self, unit: Optional[Unit]) -> None:
+        self.hex_map.set_unit(self.index, unit)
+
+    @property
+    def is_occupied(self) -> bool:
+        return bool(self.hex_map.occupied[self.index])
+
+    @property
+    def is_traversable(self) -> bool:
+        return bool(self.hex_map.walkable[self.index]) and not self.is_occupied
+
+
+class DenseCells(Mapping):
+
+    def __init__(self, hex_map: 'DenseHexMap'):
+        self.hex_map = hex_map
+
+    def __getitem__(self, coordinate: HexCoordinate) -> DenseHexCell:
+        return self.hex_map[coordinate]
+
+    def __iter__(self) -> Iterator[HexCoordinate]:
+        return iter(self.hex_map.coordinates)
+
+    def __len__(self) -> int:
+        return len(self.hex_map)
+
+
+class DenseHexMap:
+
+    def __init__(self, rows: int = 0, columns: int = 0, first_row: int = 0, first_column: int = 0):
+        self.first_row = first_row
+        self.first_column = first_column
+        self.rows = rows
+        self.columns = columns
+        size = rows * columns
+        self.terrain = np.zeros(size, dtype=np.int8)
+        self.move_cost = np.zeros(size, dtype=np.float64)
+        self.walkable = np.zeros(size, dtype=np.bool_)
+        self.spawn = np.zeros(size, dtype=np.int8)
+        self.occupied = np.zeros(size, dtype=np.bool_)
+        self.units: Dict[int, Unit] = {}
+        self.cells = DenseCells(self)
+
+    @classmethod
+    def hexagon(cls, radius: int, terrain: Terrain | None = None) -> Self:
+        q, r = np.meshgrid(np.arange(-radius, radius + 1), np.arange(-radius, radius + 1))
+        inside = np.abs(q + r) <= radius
+        return cls.from_arrays(q[inside], r[inside], terrain)
+
+    @classmethod
+    def rectangle(cls, width: int, height: int, terrain: Terrain | None = None) -> Self:
+        column, r = np.meshgrid(np.arange(width), np.arange(height))
+        return cls.from_arrays((column - r // 2).ravel(), r.ravel(), terrain)
+
+    @classmethod
+    def from_arrays(cls, q: np.ndarray, r: np.ndarray, terrain: Terrain | None = None) -> Self:
+        columns = q + r // 2
+        hex_map = cls(int(r.max() - r.min() + 1), int(columns.max() - columns.min() + 1), int(r.min()), int(columns.min())) if len(q) else cls()
+        hex_map.set_terrain(hex_map._flat(q, r), terrain or TerrainLibrary.default())
+        return hex_map
+
+    @classmethod
+    def from_hex_map(cls, source: HexMap) -> Self:
+        cells = list(source)
+        q = np.array([cell.coordinate.q for cell in cells], dtype=np.int64)
+        r = np.array([cell.coordinate.r for cell in cells], dtype=np.int64)
+        hex_map = cls.from_arrays(q, r)
+        for index, cell in zip(hex_map._flat(q, r).tolist(), cells):
+            hex_map.set_terrain(index, cell.terrain)
+            hex_map.spawn[index] = cell.spawn.value
+            hex_map.set_unit(index, cell.unit)
+        return hex_map
+
+    def to_hex_map(self) -> HexMap:
+        return HexMap({cell.coordinate: HexCell(cell.coordinate, cell.terrain, cell.spawn, cell.unit) for cell in self})
+
+    def __getitem__(self, coordinate: HexCoordinate) -> DenseHexCell:
+        index = self.index(coordinate)
+        if index < 0:
+            raise KeyError(coordinate)
+        return DenseHexCell(self, index)
+
+    def __contains__(self, coordinate: HexCoordinate) -> bool:
+        return self.index(coordinate) >= 0
+
+    def __iter__(self) -> Iterable[DenseHexCell]:
+        return (DenseHexCell(self, int(index)) for index in self.indices)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.terrain))
+
+    @property
+    def indices(self) -> np.ndarray:
+        return np.flatnonzero(self.terrain)
+
+    @property
+    def coordinates(self) -> List[HexCoordinate]:
+        q, r = self.axial(self.indices)
+        return [HexCoordinate(q, r) for q, r in zip(q.tolist(), r.tolist())]
+
+    @property
+    def sorted_cells(self) -> List[DenseHexCell]:
+        indices = self.indices
+        return [DenseHexCell(self, int(index)) for index in indices[np.argsort(self.spawn[indices], kind='stable')]]
+
+    def index(self, coordinate: HexCoordinate) -> int:
+        row = coordinate.r - self.first_row
+        column = offset_column(coordinate.q, coordinate.r) - self.first_column
+        if not (0 <= row < self.rows and 0 <= column < self.columns):
+            return -1
+        index = row * self.columns + column
+        return index if self.terrain[index] != NO_TERRAIN else -1
+
+    def coordinate(self, index: int) -> HexCoordinate:
+        row, column = divmod(index, self.columns)
+        r = row + self.first_row
+        return HexCoordinate(column + self.first_column - r // 2, r)
+
+    def axial(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        row, column = np.divmod(indices, self.columns)
+        r = row + self.first_row
+        return column + self.first_column - r // 2, r
+
+    def neighbor_indices(self, index: int) -> List[int]:
+        row, column = divmod(index, self.columns)
+        neighbors = []
+        for column_offset, row_offset in NEIGHBOR_OFFSETS[(row + self.first_row) & 1]:
+            neighbor_row = row + row_offset
+            neighbor_column = column + column_offset
+            if 0 <= neighbor_row < self.rows and 0 <= neighbor_column < self.columns:
+                neighbor = neighbor_row * self.columns + neighbor_column
+                if self.terrain[neighbor] != NO_TERRAIN:
+                    neighbors.append(neighbor)
+        return neighbors
+
+    def neighbors(self, coordinate: HexCoordinate) -> List[DenseHexCell]:
+        index = self.index(coordinate)
+        if index < 0:
+            return [self[neighbor] for neighbor in coordinate.neighbors if neighbor in self]
+        return [DenseHexCell(self, neighbor) for neighbor in self.neighbor_indices(index)]
+
+    def add_cell(self, coordinate: HexCoordinate, terrain: Terrain) -> None:
+        self._reserve(coordinate)
+        index = self._flat(coordinate.q, coordinate.r)
+        self.set_terrain(index, terrain)
+        self.spawn[index] = SpawnLibrary.none().value
+        self.set_unit(index, None)
+
+    def delete_cell(self, coordinate: HexCoordinate) -> None:
+        index = self.index(coordinate)
+        if index < 0:
+            raise KeyError(coordinate)
+        self.terrain[index] = NO_TERRAIN
+        self.move_cost[index] = 0
+        self.walkable[index] = False
+        self.spawn[index] = SpawnLibrary.none().value
+        self.set_unit(index, None)
+
+    def change_terrain(self, coordinate: HexCoordinate, terrain: Terrain) -> None:
+        self.set_terrain(self[coordinate].index, terrain)
+
+    def change_spawn(self, coordinate: HexCoordinate, spawn: Spawn) -> None:
+        self.spawn[self[coordinate].index] = spawn.value
+
+    def remove_spawn(self, coordinate: HexCoordinate) -> None:
+        self.change_spawn(coordinate, SpawnLibrary.none())
+
+    def get_terrain(self, coordinate: HexCoordinate) -> Terrain:
+        return self[coordinate].terrain
+
+    def get_spawn(self, coordinate: HexCoordinate) -> Spawn:
+        return self[coordinate].spawn
+
+    def has_spawn(self, coordinate: HexCoordinate) -> bool:
+        return self.get_spawn(coordinate) != SpawnLibrary.none()
+
+    def get_spawn_cells(self, spawn: Spawn) -> List[DenseHexCell]:
+        return [DenseHexCell(self, int(index)) for index in np.flatnonzero((self.spawn == spawn.value) & (self.terrain != NO_TERRAIN))]
+
+    def set_terrain(self, index: int | np.ndarray, terrain: Terrain) -> None:
+        self.terrain[index] = terrain.value
+        self.move_cost[index] = terrain.move_cost
+        self.walkable[index] = terrain.walkable
+
+    def set_unit(self, index: int, unit: Optional[Unit]) -> None:
+        if unit is None:
+            self.units.pop(index, None)
+        else:
+            self.units[index] = unit
+        self.occupied[index] = unit is not None
+
+    def _flat(self, q: int | np.ndarray, r: int | np.ndarray) -> int | np.ndarray:
+        return (r - self.first_row) * self.columns + (q + r // 2 - self.first_column)
+
+    def _reserve(self, coordinate: HexCoordinate) -> None:
+        row = coordinate.r
+        column = offset_column(coordinate.q, coordinate.r)
+        if self.rows and self.first_row <= row < self.first_row + self.rows and self.first_column <= column < self.first_column + self.columns:
+            return
+
+        if self.rows:
+            first_row = min(self.first_row, row)
+            first_column = min(self.first_column, column)
+            rows = max(self.first_row + self.rows, row + 1) - first_row
+            columns = max(self.first_column + self.columns, column + 1) - first_column
+        else:
+            first_row, first_column, rows, columns = row, column, 1, 1
+
+        grown = DenseHexMap(rows, columns, first_row, first_column)
+        indices = self.indices
+        if len(indices):
+            target = grown._flat(*self.axial(indices))
+            for name in ('terrain', 'move_cost', 'walkable', 'spawn', 'occupied'):
+                getattr(grown, name)[target] = getattr(self, name)[indices]
+            grown.units = {int(grown._flat(*self.axial(np.array([index])))[0]): unit for index, unit in self.units.items()}
+
+        self.first_row, self.first_column = grown.first_row, grown.first_column
+        self.rows, self.columns = grown.rows, grown.columns
+        self.terrain, self.move_cost, self.walkable = grown.terrain, grown.move_cost, grown.walkable
+        self.spawn, self.occupied, self.units = grown.spawn, grown.occupied, grown.units
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Self, Tuple
 
 
@@ -52,11 +53,45 @@ class VecI2:
         return (self.x, self.y)
 
 
-@dataclass(frozen=True)
+def pack(q: int, r: int) -> int:
+    return (q << 32) + r
+
+
+def unpack(key: int) -> Tuple[int, int]:
+    r = ((key + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    return (key - r) >> 32, r
+
+
+def hex_distance(q1: int, r1: int, q2: int, r2: int) -> int:
+    dq = q1 - q2
+    dr = r1 - r2
+    return max(abs(dq), abs(dr), abs(dq + dr))
+
+
+DIRECTIONS = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+COORDINATE_CACHE_SIZE = 1 << 16
+
+
+@dataclass(frozen=True, slots=True)
 class HexCoordinate:
     q: int
     r: int
 
+    @classmethod
+    def of(cls, q: int, r: int) -> Self:
+        return _intern(q, r)
+
+    @classmethod
+    def from_key(cls, key: int) -> Self:
+        return cls.of(*unpack(key))
+
+    @property
+    def key(self) -> int:
+        return (self.q << 32) + self.r
+
+    def __hash__(self) -> int:
+        return (self.q << 32) + self.r
+
     @property
     def s(self) -> int:
         return -self.q - self.r
@@ -67,32 +102,44 @@ class HexCoordinate:
 
     @property
     def length(self) -> int:
-        return max([abs(self.q), abs(self.r), abs(self.s)])
+        return max(abs(self.q), abs(self.r), abs(self.q + self.r))
 
     @staticmethod
     def directions() -> List[VecI2]:
         return [VecI2(1, 0), VecI2(1, -1), VecI2(0, -1), VecI2(-1, 0), VecI2(-1, 1), VecI2(0, 1)]
 
     @property
-    def neighbors(self) -> List[Self]:
-        return [self + neighbor for neighbor in self.directions()]
+    def neighbors(self) -> Tuple[Self, ...]:
+        return _neighbors(self.q, self.r)
 
     def __add__(self, other: Self|VecI2) -> Self:
         if isinstance(other, HexCoordinate):
-            return HexCoordinate(self.q + other.q, self.r + other.r)
+            return _intern(self.q + other.q, self.r + other.r)
         elif isinstance(other, VecI2):
-            return HexCoordinate(self.q + other.x, self.r + other.y)
+            return _intern(self.q + other.x, self.r + other.y)
         raise TypeError(f'Unsupported operand type(s) for +: "HexCoordinate" and "{type(other).__name__}"')
 
     def __sub__(self, other: Self|VecI2) -> Self:
         if isinstance(other, HexCoordinate):
-            return HexCoordinate(self.q - other.q, self.r - other.r)
+            return _intern(self.q - other.q, self.r - other.r)
         elif isinstance(other, VecI2):
-            return HexCoordinate(self.q - other.x, self.r - other.y)
+            return _intern(self.q - other.x, self.r - other.y)
         raise TypeError(f'Unsupported operand type(s) for -: "HexCoordinate" and "{type(other).__name__}"')
 
     def __mul__(self, scalar: int) -> Self:
-        return HexCoordinate(self.q * scalar, self.r * scalar)
+        return _intern(self.q * scalar, self.r * scalar)
 
     def distance(self, other: Self|VecI2) -> int:
-        return self.__sub__(other).length
+        if isinstance(other, HexCoordinate):
+            return hex_distance(self.q, self.r, other.q, other.r)
+        return hex_distance(self.q, self.r, other.x, other.y)
+
+
+@lru_cache(maxsize=COORDINATE_CACHE_SIZE)
+def _intern(q: int, r: int) -> HexCoordinate:
+    return HexCoordinate(q, r)
+
+
+@lru_cache(maxsize=COORDINATE_CACHE_SIZE)
+def _neighbors(q: int, r: int) -> Tuple[HexCoordinate, ...]:
+    return tuple(_intern(q + dq, r + dr) for dq, dr in DIRECTIONS)
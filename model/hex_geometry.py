@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List
 import math
 
+import numpy as np
+
 from model.hex_coordinate import HexCoordinate, VecF2, VecI2
 
 
@@ -32,6 +35,41 @@ FLAT = HexOrientation(
 )
 
 
+@dataclass(frozen=True)
+class AxialRegion:
+    q_min: int
+    q_max: int
+    r_min: int
+    r_max: int
+    s_min: int
+    s_max: int
+
+    def __contains__(self, coordinate: HexCoordinate) -> bool:
+        return self.q_min <= coordinate.q <= self.q_max and self.r_min <= coordinate.r <= self.r_max and self.s_min <= coordinate.s <= self.s_max
+
+    def __iter__(self) -> Iterator[HexCoordinate]:
+        for r in range(self.r_min, self.r_max + 1):
+            for q in range(max(self.q_min, -r - self.s_max), min(self.q_max, -r - self.s_min) + 1):
+                yield HexCoordinate(q, r)
+
+    @property
+    def size(self) -> int:
+        return (self.q_max - self.q_min + 1) * (self.r_max - self.r_min + 1)
+
+    def mask(self, coordinates: np.ndarray) -> np.ndarray:
+        q, r = coordinates[:, 0], coordinates[:, 1]
+        s = -q - r
+        return (q >= self.q_min) & (q <= self.q_max) & (r >= self.r_min) & (r <= self.r_max) & (s >= self.s_min) & (s <= self.s_max)
+
+
+@lru_cache(maxsize=None)
+def corner_offsets(orientation: HexOrientation, size: VecI2) -> np.ndarray:
+    angles = np.radians(60 * np.arange(6) + orientation.angle)
+    offsets = np.stack([size.x * np.cos(angles), size.y * np.sin(angles)], axis=1)
+    offsets.flags.writeable = False
+    return offsets
+
+
 @dataclass
 class HexLayout:
     orientation: HexOrientation
@@ -72,10 +110,45 @@ class HexLayout:
         return HexCoordinate(q, r)
 
     def get_hex_corners(self, center: VecF2) -> List[VecF2]:
-        corners = []
-        for i in range(6):
-            angle = math.radians(60 * i + self.orientation.angle)
-            x = center.x + self.size.x * math.cos(angle)
-            y = center.y + self.size.y * math.sin(angle)
-            corners.append(VecF2(x, y))
-        return corners
+        return [VecF2(center.x + x, center.y + y) for x, y in self.corner_offsets.tolist()]
+
+    @property
+    def corner_offsets(self) -> np.ndarray:
+        return corner_offsets(self.orientation, self.size)
+
+    def hexes_to_points(self, coordinates: np.ndarray) -> np.ndarray:
+        forward = np.array([self.orientation.forward_x.as_tuple, self.orientation.forward_y.as_tuple])
+        return np.asarray(coordinates, dtype=np.float64) @ forward.T * (self.size.x, self.size.y)
+
+    def points_to_hexes(self, points: np.ndarray) -> np.ndarray:
+        backward = np.array([self.orientation.backward_x.as_tuple, self.orientation.backward_y.as_tuple])
+        return self.round_coordinates(np.asarray(points, dtype=np.float64) / (self.size.x, self.size.y) @ backward.T)
+
+    def round_coordinates(self, coordinates: np.ndarray) -> np.ndarray:
+        q, r = coordinates[:, 0], coordinates[:, 1]
+        s = -q - r
+        rounded_q, rounded_r, rounded_s = np.rint(q), np.rint(r), np.rint(s)
+        q_diff = np.abs(rounded_q - q)
+        r_diff = np.abs(rounded_r - r)
+        s_diff = np.abs(rounded_s - s)
+
+        fix_q = (q_diff > r_diff) & (q_diff > s_diff)
+        fix_r = ~fix_q & (r_diff > s_diff)
+        rounded_q = np.where(fix_q, -rounded_r - rounded_s, rounded_q)
+        rounded_r = np.where(fix_r, -rounded_q - rounded_s, rounded_r)
+        return np.stack([rounded_q, rounded_r], axis=1).astype(np.int64)
+
+    def hex_corners(self, centers: np.ndarray) -> np.ndarray:
+        return np.asarray(centers, dtype=np.float64)[:, np.newaxis, :] + self.corner_offsets
+
+    def region(self, left: float, top: float, right: float, bottom: float) -> AxialRegion:
+        corners = np.array([(left, top), (right, top), (left, bottom), (right, bottom)], dtype=np.float64)
+        backward = np.array([self.orientation.backward_x.as_tuple, self.orientation.backward_y.as_tuple])
+        axial = corners / (self.size.x, self.size.y) @ backward.T
+        q, r = axial[:, 0], axial[:, 1]
+        s = -q - r
+        return AxialRegion(
+            int(np.floor(q.min())) - 1, int(np.ceil(q.max())) + 1,
+            int(np.floor(r.min())) - 1, int(np.ceil(r.max())) + 1,
+            int(np.floor(s.min())) - 1, int(np.ceil(s.max())) + 1,
+        )
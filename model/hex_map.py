@@ -36,6 +36,7 @@ class HexMap:
     
     def __init__(self, cells: Dict[HexCoordinate, HexCell]):
         self.cells = cells
+        self.adjacency: Dict[HexCoordinate, List[HexCell]] = {coordinate: self._neighbor_cells(coordinate) for coordinate in cells}
 
     def __getitem__(self, coordinate: HexCoordinate) -> Optional[HexCell]:
         return self.cells[coordinate]
@@ -54,11 +55,21 @@ class HexMap:
     def sorted_cells(self) -> List[HexCell]:
         return sorted(self.cells.values(), key=lambda cell: cell.spawn.spawn_type)
 
+    def neighbors(self, coordinate: HexCoordinate) -> List[HexCell]:
+        neighbors = self.adjacency.get(coordinate)
+        if neighbors is None:
+            return self._neighbor_cells(coordinate)
+        return neighbors
+
     def add_cell(self, coordinate: HexCoordinate, terrain: Terrain) -> None:
         self.cells[coordinate] = HexCell(coordinate, terrain, SpawnLibrary.none(), None)
+        self.adjacency[coordinate] = self._neighbor_cells(coordinate)
+        self._relink_neighbors(coordinate)
 
     def delete_cell(self, coordinate: HexCoordinate) -> None:
         self.cells.pop(coordinate)
+        self.adjacency.pop(coordinate, None)
+        self._relink_neighbors(coordinate)
     
     def change_terrain(self, coordinate: HexCoordinate, terrain: Terrain) -> None:
         self.cells[coordinate].terrain = terrain
@@ -80,3 +91,11 @@ class HexMap:
     
     def get_spawn_cells(self, spawn: Spawn) -> List[HexCell]:
         return [cell for coordinate, cell in self.cells.items() if self.get_spawn(coordinate) == spawn]
+
+    def _neighbor_cells(self, coordinate: HexCoordinate) -> List[HexCell]:
+        return [self.cells[neighbor] for neighbor in coordinate.neighbors if neighbor in self.cells]
+
+    def _relink_neighbors(self, coordinate: HexCoordinate) -> None:
+        for neighbor in coordinate.neighbors:
+            if neighbor in self.adjacency:
+                self.adjacency[neighbor] = self._neighbor_cells(neighbor)
@@ -8,6 +8,8 @@ from model.spawn import Spawn
 
 class HexMapCommand(Protocol):
 
+    coordinate: HexCoordinate
+
     def execute(self) -> None:
         ...
 
@@ -1,5 +1,6 @@
-from typing import List
+from typing import Callable, List
 
+from model.hex_coordinate import HexCoordinate
 from model.hex_map_commands import HexMapCommand
 from model.hex_map import HexMap
 from utils.observable import Observable
@@ -10,6 +11,7 @@ class HexMapModel:
     def __init__(self, hex_map: HexMap):
         self.hex_map = Observable(hex_map)
         self.history: List[HexMapCommand] = []
+        self.cell_listeners: List[Callable[[HexCoordinate], None]] = []
 
     def set_hex_map(self, hex_map: HexMap) -> None:
         self.hex_map.set(hex_map)
@@ -18,8 +20,17 @@ class HexMapModel:
     def apply_command(self, command: HexMapCommand) -> None:
         command.execute()
         self.history.append(command)
+        self.notify_cell_changed(command.coordinate)
 
     def undo(self) -> None:
         if self.history:
             command = self.history.pop()
             command.undo()
+            self.notify_cell_changed(command.coordinate)
+
+    def bind_cell_changed(self, callback: Callable[[HexCoordinate], None]) -> None:
+        self.cell_listeners.append(callback)
+
+    def notify_cell_changed(self, coordinate: HexCoordinate) -> None:
+        for callback in self.cell_listeners:
+            callback(coordinate)
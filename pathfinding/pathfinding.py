@@ -1,6 +1,10 @@
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
+from math import inf
 from typing import Dict, List
 
-from model.hex_coordinate import HexCoordinate
+from model.hex_coordinate import HexCoordinate, hex_distance
 from model.hex_map import HexCell, HexMap
 
 
@@ -8,14 +12,14 @@ class PathfindingHelper:
 
     @staticmethod
     def neighbors(hex_map: HexMap, coordinate: HexCoordinate) -> List[HexCell]:
-        return [hex_map[neighbor] for neighbor in coordinate.neighbors if neighbor in hex_map]
+        return hex_map.neighbors(coordinate)
 
     @staticmethod
     def in_range(hex_map: HexMap, coordinate: HexCoordinate, radius: int) -> List[HexCell]:
         results = []
         for q in range(-radius, radius+1):
             for r in range(max(-radius, -radius-q), min(radius, -q+radius)+1):
-                range_coordinate = coordinate + HexCoordinate(q, r)
+                range_coordinate = HexCoordinate(coordinate.q + q, coordinate.r + r)
                 if range_coordinate in hex_map:
                     results.append(hex_map[range_coordinate])
         return results
@@ -37,47 +41,62 @@ class PathfindingHelper:
 
     @staticmethod
     def bfs(hex_map: HexMap, origin: HexCoordinate, distance: int) -> List[HexCell]:
-        open_set = [(origin, 0)]
-        visited = {origin: 0}
+        return PathfindingHelper.reachable(hex_map, origin, distance).cells
+
+    @staticmethod
+    def reachable(hex_map: HexMap, origin: HexCoordinate, distance: float) -> 'ReachableSet':
+        order = count()
+        open_set = [(0, next(order), origin)]
+        came_from = {}
+        g_score = {origin: 0}
+        costs = {}
 
         while open_set:
-            current, cost = open_set.pop(0)
+            cost, _, current = heappop(open_set)
+            if current in costs:
+                continue
+            costs[current] = cost
 
             for neighbor in PathfindingHelper.neighbors(hex_map, current):
                 if not neighbor.is_traversable:
                     continue
                 new_cost = cost + neighbor.terrain.move_cost
                 n_coordinate = neighbor.coordinate
-                if new_cost <= distance and (n_coordinate not in visited or new_cost < visited[n_coordinate]):
-                    visited[n_coordinate] = new_cost
-                    open_set.append((n_coordinate, new_cost))
-        return [hex_map[coordinate] for coordinate in visited.keys()]
+                if new_cost <= distance and new_cost < g_score.get(n_coordinate, inf):
+                    came_from[n_coordinate] = current
+                    g_score[n_coordinate] = new_cost
+                    heappush(open_set, (new_cost, next(order), n_coordinate))
+        return ReachableSet(hex_map, origin, costs, came_from)
 
     @staticmethod
     def astar(hex_map: HexMap, origin: HexCoordinate, destination: HexCoordinate) -> List[HexCell]:
-        open_set = [origin]
+        order = count()
+        destination_q, destination_r = destination.q, destination.r
+        open_set = [(origin.distance(destination), 0, next(order), origin)]
         came_from = {}
         g_score = {origin: 0}
-        f_score = {origin: origin.distance(destination)}
+        closed = set()
 
         while open_set:
-            open_set.sort(key=lambda x: f_score.get(x, 10000))
-            current = open_set.pop(0)
+            _, _, _, current = heappop(open_set)
+            if current in closed:
+                continue
+            closed.add(current)
 
             if current == destination:
                 return PathfindingHelper._reconstruct_path(hex_map, came_from, current)
-            
+
+            current_g_score = g_score[current]
             for neighbor in PathfindingHelper.neighbors(hex_map, current):
                 if not neighbor.is_traversable:
                     continue
-                tentative_g_score = g_score.get(current, 10000) + neighbor.terrain.move_cost
+                tentative_g_score = current_g_score + neighbor.terrain.move_cost
                 n_coordinate = neighbor.coordinate
-                if tentative_g_score < g_score.get(n_coordinate, 10000):
+                if tentative_g_score < g_score.get(n_coordinate, inf):
                     came_from[n_coordinate] = current
                     g_score[n_coordinate] = tentative_g_score
-                    f_score[n_coordinate] = tentative_g_score + n_coordinate.distance(destination)
-                    if n_coordinate not in open_set:
-                        open_set.append(n_coordinate)
+                    closed.discard(n_coordinate)
+                    heappush(open_set, (tentative_g_score + hex_distance(n_coordinate.q, n_coordinate.r, destination_q, destination_r), -tentative_g_score, next(order), n_coordinate))
         return []
 
     @staticmethod
@@ -87,3 +106,29 @@ class PathfindingHelper:
             current = came_from[current]
             path.append(hex_map[current])
         return path
+
+
+@dataclass
+class ReachableSet:
+    hex_map: HexMap
+    origin: HexCoordinate
+    costs: Dict[HexCoordinate, float]
+    came_from: Dict[HexCoordinate, HexCoordinate]
+
+    def __contains__(self, coordinate: HexCoordinate) -> bool:
+        return coordinate in self.costs
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    @property
+    def cells(self) -> List[HexCell]:
+        return [self.hex_map[coordinate] for coordinate in self.costs]
+
+    def cost(self, coordinate: HexCoordinate) -> float:
+        return self.costs[coordinate]
+
+    def path(self, destination: HexCoordinate) -> List[HexCell]:
+        if destination not in self.costs:
+            return []
+        return PathfindingHelper._reconstruct_path(self.hex_map, self.came_from, destination)
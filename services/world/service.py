@@ -1,16 +1,26 @@
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterable
 from ecs_architecture.component.builder import ComponentBuilder, ComponentBuilderProtocol
-from ecs_architecture.component.registry import ComponentRegistry
+from ecs_architecture.component.registry import ComponentRegistry, GlobalComponentRegistry
+from ecs_architecture.component.sprite import ScreenSprite, Sprite
+from ecs_architecture.component.sprites.board import UnitBoardSprite
 from ecs_framework.ecs import ECS
+from ecs_framework.serialization import WorldSerializer
+from ecs_framework.snapshot import WorldSnapshot
+from services.assets.service import AssetService
 from services.data.models import DataDescription
 from services.world.core import WorldServiceConfig
 
 
+TRANSIENT_COMPONENTS = (Sprite, ScreenSprite)
+
+
 class WorldService:
     
-    def __init__(self, builder: ComponentBuilderProtocol):
+    def __init__(self, builder: ComponentBuilderProtocol, component_types: Iterable[type] = ()):
         self.builder = builder
         self.worlds: Dict[str, ECS] = {}
+        self.component_types = tuple(component_types)
 
     def build_world(self, name: str) -> None:
         if not self.has_world(name):
@@ -25,6 +35,53 @@ class WorldService:
     def get_world(self, name: str) -> ECS | None:
         return self.worlds.get(name, None)
 
+    def fork_world(self, source: str, destination: str) -> ECS | None:
+        world = self.get_world(source)
+        if world is None:
+            return None
+
+        self.worlds[destination] = world.fork()
+        return self.worlds[destination]
+
+    def snapshot_world(self, name: str) -> WorldSnapshot | None:
+        world = self.get_world(name)
+        if world is None:
+            return None
+
+        return world.snapshot()
+
+    def restore_world(self, name: str, snapshot: WorldSnapshot) -> None:
+        world = self.get_world(name)
+        if world is None:
+            return
+
+        world.restore(snapshot)
+
+    def save_world(self, name: str, path: Path) -> bool:
+        world = self.get_world(name)
+        if world is None:
+            return False
+
+        self.serializer().save(world, path)
+        return True
+
+    def load_world(self, name: str, path: Path, assets: AssetService | None = None) -> ECS:
+        self.build_world(name)
+        world = self.get_world(name)
+        world.restore(self.serializer().load(path), copy=False)
+        if assets is not None:
+            self.rebuild_sprites(world, assets)
+        return world
+
+    def serializer(self) -> WorldSerializer:
+        return WorldSerializer(GlobalComponentRegistry.component_keys(), TRANSIENT_COMPONENTS, self.component_types)
+
+    def rebuild_sprites(self, world: ECS, assets: AssetService) -> None:
+        for entity, board_sprite in world.get_entities_with_single_component(UnitBoardSprite):
+            surface = assets.get(board_sprite.path)
+            if surface is not None:
+                world.add_component(entity, Sprite(surface))
+
     def build_entity(self, world_name: str, data: DataDescription) -> int | None:
         world = self.get_world(world_name)
         if world is None:
@@ -0,0 +1,18 @@
+from benchmarks.ecs_benchmark import regressions
+
+BASELINE = {'execute[1000]': {'ops_per_sec': 1000.0, 'peak_bytes': 1000}}
+
+
+def test_within_threshold_passes():
+    assert regressions({'execute[1000]': {'ops_per_sec': 800.0, 'peak_bytes': 1200}}, BASELINE, 0.3) == []
+
+def test_slower_case_fails():
+    assert len(regressions({'execute[1000]': {'ops_per_sec': 600.0, 'peak_bytes': 1000}}, BASELINE, 0.3)) == 1
+
+def test_memory_growth_fails():
+    failures = regressions({'execute[1000]': {'ops_per_sec': 1000.0, 'peak_bytes': 1400}}, BASELINE, 0.3)
+    assert len(failures) == 1
+    assert 'peak' in failures[0]
+
+def test_unknown_case_is_skipped():
+    assert regressions({'execute[5]': {'ops_per_sec': 1.0, 'peak_bytes': 10**9}}, BASELINE, 0.3) == []
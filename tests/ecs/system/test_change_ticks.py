@@ -0,0 +1,41 @@
+from ecs_architecture.component.combat import IncomingDamage
+from ecs_architecture.component.path import MovementProgress
+from ecs_architecture.component.position import WorldPosition
+from ecs_architecture.component.stats.hp import HP
+from ecs_architecture.system.combat import DamageApplicationSystem
+from ecs_architecture.system.movement import MovementSystem
+from ecs_framework.ecs import ECS
+from model.hex_coordinate import HexCoordinate, VecF2
+
+
+def test_damage_marks_hp_changed():
+    ecs = ECS()
+    ecs.add_pool(HP)
+    hit, untouched = ecs.create_entity(), ecs.create_entity()
+    for entity in (hit, untouched):
+        ecs.add_component(entity, HP(current=5, max_value=5, regeneration=0, growth=0))
+    system = DamageApplicationSystem(ecs)
+    tick = ecs.tick
+    ecs.tick += 1
+
+    ecs.send(IncomingDamage(hit, 2))
+    system.execute(0)
+
+    assert ecs.get_entity_component(hit, HP).current == 3
+    assert [entity for entity, _ in ecs.query(HP).changed(tick)] == [hit]
+
+def test_movement_marks_world_position_changed():
+    ecs = ECS()
+    ecs.add_pool(MovementProgress)
+    ecs.add_pool(WorldPosition)
+    entity = ecs.create_entity()
+    ecs.add_component(entity, WorldPosition(VecF2(0, 0)))
+    ecs.add_component(entity, MovementProgress(VecF2(0, 0), VecF2(100, 0), HexCoordinate(1, 0)))
+    system = MovementSystem(ecs, None, 10)
+    tick = ecs.tick
+    ecs.tick += 1
+
+    system.execute(1)
+
+    assert ecs.get_entity_component(entity, WorldPosition).point == VecF2(10, 0)
+    assert [entity for entity, _ in ecs.query(WorldPosition).changed(tick)] == [entity]
@@ -0,0 +1,34 @@
+import pygame
+
+from ecs_architecture.component.position import ScreenPosition
+from ecs_architecture.component.sprite import ScreenSprite
+from ecs_architecture.system.renderer import RendererSystem
+from ecs_framework.ecs import ECS
+from model.hex_coordinate import VecF2
+
+
+class RecordingSurface(pygame.Surface):
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.blitted = []
+
+    def blit(self, source, dest, *args, **kwargs):
+        self.blitted.append(source)
+        return super().blit(source, dest, *args, **kwargs)
+
+
+def test_renderer_culls_by_sprite_size():
+    ecs = ECS()
+    ecs.add_pool(ScreenPosition)
+    screen = RecordingSurface((100, 100))
+    system = RendererSystem(ecs, screen)
+    large, small = pygame.Surface((200, 200)), pygame.Surface((10, 10))
+    for sprite, x in ((large, -90), (small, -90)):
+        entity = ecs.create_entity()
+        ecs.add_component(entity, ScreenPosition(VecF2(x, 50)))
+        ecs.add_component(entity, ScreenSprite(sprite))
+
+    system.execute(0)
+
+    assert screen.blitted == [large]
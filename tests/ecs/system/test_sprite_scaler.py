@@ -0,0 +1,44 @@
+import pygame
+
+from ecs_architecture.component.sprite import ScreenSprite, Sprite
+from ecs_architecture.system.renderer import ScaledSpriteCache, SpriteScalerSystem
+from ecs_framework.ecs import ECS
+from editor.hex_camera import HexCamera
+
+
+def test_cache_reuses_scaled_surface():
+    cache = ScaledSpriteCache()
+    sprite = pygame.Surface((10, 10))
+    scaled = cache.get(sprite, 1.5)
+    assert scaled.get_size() == (15, 15)
+    assert cache.get(sprite, 1.5000001) is scaled
+    assert cache.get(sprite, 2.0) is not scaled
+
+def test_cache_evicts_least_recently_used():
+    sprite = pygame.Surface((10, 10))
+    cache = ScaledSpriteCache(budget=2 * sprite.get_pitch() * 10)
+    first = cache.get(sprite, 1.0)
+    cache.get(sprite, 1.01)
+    cache.get(sprite, 1.0)
+    cache.get(sprite, 0.99)
+    assert len(cache) == 2
+    assert cache.get(sprite, 1.0) is first
+    assert cache.size <= cache.budget
+
+def test_scaler_rescales_only_on_zoom_change():
+    ecs = ECS()
+    camera = HexCamera()
+    system = SpriteScalerSystem(ecs, camera)
+    ecs.add_system(system)
+    entity = ecs.create_entity()
+    ecs.add_component(entity, Sprite(pygame.Surface((10, 10))))
+
+    ecs.execute(0)
+    screen_sprite = ecs.get_entity_component(entity, ScreenSprite)
+    scaled = screen_sprite.sprite
+    ecs.execute(0)
+    assert ecs.get_entity_component(entity, ScreenSprite).sprite is scaled
+
+    camera.zoom = 2.0
+    ecs.execute(0)
+    assert ecs.get_entity_component(entity, ScreenSprite).sprite.get_size() == (20, 20)
@@ -0,0 +1,83 @@
+import pygame
+
+from editor.hex_camera import HexCamera
+from editor.hex_map_view import HexMapView
+from model.hex_coordinate import HexCoordinate, VecF2
+from model.hex_geometry import POINTY, HexLayout
+from model.hex_map_builder import HexMapTemplate
+from model.hex_map_commands import PaintTileCommand
+from model.hex_map_model import HexMapModel
+from model.terrain import TerrainLibrary
+
+
+def make_view(radius: int = 5):
+    pygame.font.init()
+    screen = pygame.Surface((400, 300))
+    view = HexMapView(screen, HexLayout(POINTY, VecF2(20, 20)), HexCamera())
+    view.set_hex_map_area(screen.get_rect())
+    hex_map = HexMapTemplate.hexagon_map(radius)
+    view.set_hex_map(hex_map)
+    model = HexMapModel(hex_map)
+    model.bind_cell_changed(view.invalidate_cell)
+    return view, model, hex_map
+
+def color_at(view: HexMapView, coordinate: HexCoordinate) -> pygame.Color:
+    point = view.camera.world_to_screen(view.layout.hex_to_point(coordinate))
+    return view.screen.get_at((int(point.x), int(point.y)))
+
+def paint(model: HexMapModel, hex_map, coordinate: HexCoordinate) -> None:
+    model.apply_command(PaintTileCommand(hex_map, coordinate, TerrainLibrary.water(), hex_map.get_terrain(coordinate)))
+
+def test_edit_invalidates_only_its_cell():
+    view, model, hex_map = make_view()
+    coordinate = HexCoordinate(1, 0)
+    view.draw()
+    layer = view.layer
+
+    paint(model, hex_map, coordinate)
+
+    assert view.dirty_cells == {coordinate}
+    view.draw()
+    assert view.layer is layer
+    assert not view.dirty_cells
+    assert color_at(view, coordinate) == pygame.Color(TerrainLibrary.water().color)
+    assert color_at(view, HexCoordinate(0, 0)) == pygame.Color(TerrainLibrary.default().color)
+
+def test_undo_repaints_cell():
+    view, model, hex_map = make_view()
+    coordinate = HexCoordinate(0, 1)
+    view.draw()
+    paint(model, hex_map, coordinate)
+    view.draw()
+
+    model.undo()
+    view.draw()
+
+    assert color_at(view, coordinate) == pygame.Color(TerrainLibrary.default().color)
+
+def test_zoom_change_rerenders_layer():
+    view, _, _ = make_view()
+    view.draw()
+    layer = view.layer
+
+    view.camera.zoom = 0.5
+    view.draw()
+
+    assert view.layer is not layer
+    assert view.layer_zoom == 0.5
+    assert view.layer.get_width() < layer.get_width()
+
+def test_oversized_layer_falls_back_to_direct_drawing():
+    view, model, hex_map = make_view()
+    view.MAX_LAYER_PIXELS = 0
+    coordinate = HexCoordinate(-1, 1)
+    view.draw()
+    zoom = view.layer_zoom
+
+    paint(model, hex_map, coordinate)
+
+    assert view.layer_zoom == zoom
+    view.draw()
+    assert view.layer is None
+    assert view.layer_oversized
+    assert color_at(view, coordinate) == pygame.Color(TerrainLibrary.water().color)
@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+
+from hexio.encoding import HexMapDecoder, HexMapEncoder
+from model.dense_hex_map import DenseHexMap
+from model.hex_coordinate import HexCoordinate
+from model.hex_map_builder import HexMapTemplate
+from model.spawn import SpawnLibrary
+from model.terrain import TerrainLibrary
+
+
+def neighbor_coordinates(hex_map, coordinate: HexCoordinate) -> set:
+    return {cell.coordinate for cell in hex_map.neighbors(coordinate)}
+
+
+def test_hexagon_matches_hex_map():
+    hex_map = HexMapTemplate.hexagon_map(3)
+    dense = DenseHexMap.hexagon(3)
+    assert set(dense.coordinates) == set(hex_map.coordinates)
+    for coordinate in hex_map.coordinates:
+        assert neighbor_coordinates(dense, coordinate) == neighbor_coordinates(hex_map, coordinate)
+
+def test_index_round_trip():
+    dense = DenseHexMap.rectangle(5, 4)
+    for coordinate in dense.coordinates:
+        assert dense.coordinate(dense.index(coordinate)) == coordinate
+    assert dense.index(HexCoordinate(100, 100)) == -1
+
+def test_cell_view_writes_arrays():
+    dense = DenseHexMap.hexagon(1)
+    cell = dense[HexCoordinate(1, 0)]
+    cell.terrain = TerrainLibrary.water()
+    cell.unit = 'unit'
+    assert not dense.walkable[cell.index]
+    assert dense.occupied[cell.index]
+    assert dense.get_terrain(HexCoordinate(1, 0)) == TerrainLibrary.water()
+    assert not cell.is_traversable
+
+def test_add_cell_grows_grid():
+    dense = DenseHexMap.hexagon(1)
+    dense.change_spawn(HexCoordinate(-1, 1), SpawnLibrary.default())
+    dense.add_cell(HexCoordinate(-3, 3), TerrainLibrary.default())
+    assert len(dense) == 8
+    assert dense.get_spawn(HexCoordinate(-1, 1)) == SpawnLibrary.default()
+    assert neighbor_coordinates(dense, HexCoordinate(-3, 3)) == set()
+
+def test_delete_cell_unlinks_neighbors():
+    dense = DenseHexMap.hexagon(1)
+    dense.delete_cell(HexCoordinate(1, 0))
+    assert HexCoordinate(1, 0) not in dense
+    assert len(dense.neighbors(HexCoordinate(0, 0))) == 5
+
+def test_hex_map_conversion_and_encoding():
+    hex_map = HexMapTemplate.square_map(4, 3)
+    hex_map.change_spawn(HexCoordinate(0, 0), SpawnLibrary.default())
+    dense = DenseHexMap.from_hex_map(hex_map)
+    assert dense.to_hex_map().cells == hex_map.cells
+    assert np.count_nonzero(dense.spawn) == 1
+    decoded = json.loads(json.dumps(dense, cls=HexMapEncoder), cls=HexMapDecoder)
+    assert decoded.cells == hex_map.cells
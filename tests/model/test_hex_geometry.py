@@ -0,0 +1,38 @@
+import numpy as np
+
+from model.hex_coordinate import HexCoordinate, VecF2, VecI2
+from model.hex_geometry import FLAT, POINTY, HexLayout
+
+
+COORDINATES = [HexCoordinate(q, r) for q in range(-3, 4) for r in range(-3, 4)]
+
+
+def test_hexes_to_points_matches_hex_to_point():
+    for orientation in (POINTY, FLAT):
+        layout = HexLayout(orientation, VecI2(30, 25))
+        points = layout.hexes_to_points(np.array([(c.q, c.r) for c in COORDINATES]))
+        expected = [layout.hex_to_point(c).as_tuple for c in COORDINATES]
+        assert np.allclose(points, expected)
+
+def test_points_to_hexes_matches_point_to_hex():
+    layout = HexLayout(POINTY, VecI2(30, 30))
+    points = np.random.default_rng(0).uniform(-200, 200, (500, 2))
+    expected = [layout.point_to_hex(VecF2(x, y)) for x, y in points.tolist()]
+    assert [HexCoordinate(q, r) for q, r in layout.points_to_hexes(points).tolist()] == expected
+
+def test_hex_corners_match_get_hex_corners():
+    layout = HexLayout(FLAT, VecI2(20, 20))
+    centers = np.array([(0.0, 0.0), (15.5, -4.0)])
+    corners = layout.hex_corners(centers)
+    assert corners.shape == (2, 6, 2)
+    for center, expected in zip(centers.tolist(), corners):
+        assert np.allclose([corner.as_tuple for corner in layout.get_hex_corners(VecF2(*center))], expected)
+
+def test_region_covers_viewport():
+    layout = HexLayout(POINTY, VecI2(20, 20))
+    region = layout.region(-130.0, -75.0, 210.0, 95.0)
+    points = np.random.default_rng(1).uniform((-130, -75), (210, 95), (500, 2))
+    for q, r in layout.points_to_hexes(points).tolist():
+        assert HexCoordinate(q, r) in region
+    assert all(coordinate in region for coordinate in region)
+    assert region.mask(np.array([(0, 0), (50, 0)])).tolist() == [True, False]
@@ -0,0 +1,56 @@
+from model import hex_coordinate
+from model.hex_coordinate import COORDINATE_CACHE_SIZE, HexCoordinate
+from model.hex_map import HexMap
+from model.hex_map_builder import HexMapTemplate
+from model.terrain import TerrainLibrary
+
+
+def neighbor_coordinates(hex_map: HexMap, coordinate: HexCoordinate) -> set:
+    return {cell.coordinate for cell in hex_map.neighbors(coordinate)}
+
+
+def test_neighbors_of_center_cell():
+    hex_map = HexMapTemplate.hexagon_map(1)
+    assert neighbor_coordinates(hex_map, HexCoordinate(0, 0)) == set(HexCoordinate(0, 0).neighbors)
+
+def test_neighbors_of_border_cell():
+    hex_map = HexMapTemplate.hexagon_map(1)
+    assert neighbor_coordinates(hex_map, HexCoordinate(1, 0)) == {HexCoordinate(0, 0), HexCoordinate(1, -1), HexCoordinate(0, 1)}
+
+def test_add_cell_links_neighbors():
+    hex_map = HexMapTemplate.hexagon_map(1)
+    hex_map.add_cell(HexCoordinate(2, 0), TerrainLibrary.default())
+    assert HexCoordinate(2, 0) in neighbor_coordinates(hex_map, HexCoordinate(1, 0))
+    assert neighbor_coordinates(hex_map, HexCoordinate(2, 0)) == {HexCoordinate(1, 0)}
+
+def test_delete_cell_unlinks_neighbors():
+    hex_map = HexMapTemplate.hexagon_map(1)
+    hex_map.delete_cell(HexCoordinate(1, 0))
+    assert HexCoordinate(1, 0) not in neighbor_coordinates(hex_map, HexCoordinate(0, 0))
+    assert len(hex_map.neighbors(HexCoordinate(0, 0))) == 5
+
+def test_replaced_cell_is_linked():
+    hex_map = HexMapTemplate.hexagon_map(1)
+    hex_map.add_cell(HexCoordinate(1, 0), TerrainLibrary.water())
+    assert hex_map[HexCoordinate(1, 0)] in hex_map.neighbors(HexCoordinate(0, 0))
+
+def test_coordinate_key_round_trip():
+    for coordinate in [HexCoordinate(0, 0), HexCoordinate(-3, 7), HexCoordinate(12, -40), HexCoordinate(-5, -9)]:
+        assert HexCoordinate.from_key(coordinate.key) == coordinate
+        assert hash(coordinate) == coordinate.key
+
+def test_interned_coordinates():
+    assert HexCoordinate.of(2, -1) is HexCoordinate.of(2, -1)
+    assert HexCoordinate.of(2, -1) == HexCoordinate(2, -1)
+    assert HexCoordinate(0, 0).neighbors is HexCoordinate(0, 0).neighbors
+    assert HexCoordinate(1, 2) + HexCoordinate(0, 1) is HexCoordinate.of(1, 3)
+
+def test_coordinate_cache_is_bounded():
+    for q in range(COORDINATE_CACHE_SIZE + 10):
+        HexCoordinate.of(q, 0).neighbors
+    assert hex_coordinate._intern.cache_info().currsize <= COORDINATE_CACHE_SIZE
+    assert hex_coordinate._neighbors.cache_info().currsize <= COORDINATE_CACHE_SIZE
+
+def test_distance():
+    assert HexCoordinate(-2, 1).distance(HexCoordinate(1, 1)) == 3
+    assert HexCoordinate(0, 0).distance(HexCoordinate(2, -3)) == 3
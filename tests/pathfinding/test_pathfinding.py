@@ -0,0 +1,66 @@
+from model.hex_coordinate import HexCoordinate
+from model.hex_map import HexMap
+from model.hex_map_builder import HexMapTemplate
+from model.terrain import TerrainLibrary, TerrainType
+from pathfinding.pathfinding import PathfindingHelper
+
+
+def create_map(radius: int = 3) -> HexMap:
+    return HexMapTemplate.hexagon_map(radius)
+
+def path_coordinates(path) -> list:
+    return [cell.coordinate for cell in path]
+
+def path_cost(path) -> float:
+    return sum(cell.terrain.move_cost for cell in path[:-1])
+
+
+def test_astar_returns_path_from_destination_to_origin():
+    hex_map = create_map()
+    path = PathfindingHelper.astar(hex_map, HexCoordinate(0, 0), HexCoordinate(2, 0))
+    assert path_coordinates(path) == [HexCoordinate(2, 0), HexCoordinate(1, 0), HexCoordinate(0, 0)]
+
+def test_astar_to_origin():
+    hex_map = create_map()
+    path = PathfindingHelper.astar(hex_map, HexCoordinate(0, 0), HexCoordinate(0, 0))
+    assert path_coordinates(path) == [HexCoordinate(0, 0)]
+
+def test_astar_avoids_expensive_terrain():
+    hex_map = create_map()
+    hex_map.change_terrain(HexCoordinate(1, 0), TerrainLibrary.get(TerrainType.SWAMP))
+    path = PathfindingHelper.astar(hex_map, HexCoordinate(0, 0), HexCoordinate(2, 0))
+    assert HexCoordinate(1, 0) not in path_coordinates(path)
+    assert path_cost(path) == 3
+
+def test_astar_without_path():
+    hex_map = create_map()
+    for neighbor in HexCoordinate(2, 0).neighbors:
+        if neighbor in hex_map:
+            hex_map.change_terrain(neighbor, TerrainLibrary.water())
+    assert PathfindingHelper.astar(hex_map, HexCoordinate(0, 0), HexCoordinate(2, 0)) == []
+
+def test_reachable_costs_each_cell_once():
+    hex_map = create_map()
+    hex_map.change_terrain(HexCoordinate(1, 0), TerrainLibrary.get(TerrainType.SWAMP))
+    reachable = PathfindingHelper.reachable(hex_map, HexCoordinate(0, 0), 3)
+    assert len(reachable.cells) == len(set(path_coordinates(reachable.cells)))
+    assert reachable.cost(HexCoordinate(0, 0)) == 0
+    assert reachable.cost(HexCoordinate(1, 0)) == 3
+    assert reachable.cost(HexCoordinate(2, 0)) == 3
+    assert HexCoordinate(3, 0) not in reachable
+
+def test_reachable_path_matches_astar_cost():
+    hex_map = create_map()
+    hex_map.change_terrain(HexCoordinate(1, 0), TerrainLibrary.get(TerrainType.SWAMP))
+    reachable = PathfindingHelper.reachable(hex_map, HexCoordinate(0, 0), 5)
+    path = reachable.path(HexCoordinate(2, 0))
+    assert path_coordinates(path)[0] == HexCoordinate(2, 0)
+    assert path_coordinates(path)[-1] == HexCoordinate(0, 0)
+    assert path_cost(path) == path_cost(PathfindingHelper.astar(hex_map, HexCoordinate(0, 0), HexCoordinate(2, 0)))
+
+def test_reachable_skips_impassable_terrain():
+    hex_map = create_map()
+    hex_map.change_terrain(HexCoordinate(1, 0), TerrainLibrary.water())
+    reachable = PathfindingHelper.reachable(hex_map, HexCoordinate(0, 0), 3)
+    assert HexCoordinate(1, 0) not in reachable
+    assert reachable.path(HexCoordinate(1, 0)) == []
@@ -1,7 +1,11 @@
 from typing import Any, Dict, List
+from pygame import Surface
 from ecs_architecture.component.builder import ComponentBuilderProtocol
 from ecs_architecture.component.identity.identifier import Identifier
+from ecs_architecture.component.sprite import ScreenSprite, Sprite
+from ecs_architecture.component.sprites.board import UnitBoardSprite
 from ecs_framework.ecs import ECS, ComponentProtocol
+from services.assets.service import AssetService
 from services.data.models import DataDescription, IdentityDataDescription
 from services.world.service import WorldService
 
@@ -94,3 +98,60 @@ def test_delete_entity_non_existing_entity():
     world_service = WorldService(MockComponentBuilder())
     world_service.build_world('test')
     world_service.destroy_entity('test', 0)
+
+def test_fork_world():
+    world_service = WorldService(MockComponentBuilder())
+    world_service.build_world('test')
+    data = create_data_description('data')
+    entity = world_service.build_entity('test', data)
+    fork = world_service.fork_world('test', 'fork')
+    world_service.destroy_entity('fork', entity)
+    assert fork is world_service.get_world('fork')
+    assert not fork.has_entity(entity)
+    assert world_service.get_world('test').has_entity(entity)
+
+def test_fork_non_existing_world():
+    world_service = WorldService(MockComponentBuilder())
+    assert world_service.fork_world('test', 'fork') is None
+    assert not world_service.has_world('fork')
+
+def test_restore_world():
+    world_service = WorldService(MockComponentBuilder())
+    world_service.build_world('test')
+    data = create_data_description('data')
+    entity = world_service.build_entity('test', data)
+    snapshot = world_service.snapshot_world('test')
+    world_service.destroy_entity('test', entity)
+    world_service.restore_world('test', snapshot)
+    world = world_service.get_world('test')
+    assert world.has_entity(entity)
+    assert world.get_entity_component(entity, Identifier).identity == 'data'
+
+def test_save_and_load_world(tmp_path):
+    world_service = WorldService(MockComponentBuilder())
+    world_service.build_world('test')
+    entity_id = world_service.build_entity('test', create_data_description('archer'))
+    assert world_service.save_world('test', tmp_path / 'save.bin')
+
+    world = world_service.load_world('loaded', tmp_path / 'save.bin')
+    assert world.get_entity_component(entity_id, Identifier).identity == 'archer'
+
+def test_save_non_existing_world(tmp_path):
+    world_service = WorldService(MockComponentBuilder())
+    assert not world_service.save_world('test', tmp_path / 'save.bin')
+
+def test_save_world_skips_sprites_and_rebuilds_them(tmp_path):
+    world_service = WorldService(MockComponentBuilder())
+    world_service.build_world('test')
+    world = world_service.get_world('test')
+    entity_id = world.create_entity()
+    world.add_component(entity_id, UnitBoardSprite(path='units/archer'))
+    world.add_component(entity_id, Sprite(Surface((4, 4))))
+    world.add_component(entity_id, ScreenSprite(Surface((8, 8))))
+    assert world_service.save_world('test', tmp_path / 'save.bin')
+
+    assets = AssetService(None, None, tmp_path)
+    assets.assets['units/archer'] = Surface((4, 4))
+    loaded = world_service.load_world('loaded', tmp_path / 'save.bin', assets)
+    assert loaded.get_entity_component(entity_id, Sprite).sprite is assets.get('units/archer')
+    assert not loaded.entity_has_component(entity_id, ScreenSprite)
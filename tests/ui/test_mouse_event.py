@@ -0,0 +1,36 @@
+from editor.map_editor_io import LoadMapTrigger
+from ecs_framework.ecs import ECS
+from ui.components.data import Trigger
+from ui.components.input import MouseButton, MouseReleased
+from ui.components.state import Enabled, Hovered, Pressed
+from ui.systems.mouse_event import MouseReleasedSystem
+
+
+class TriggerReader:
+
+    reads = (LoadMapTrigger,)
+    writes = ()
+
+    def __init__(self, world: ECS):
+        self.world = world
+        self.seen = []
+
+    def execute(self, delta_time: float):
+        self.seen.extend(self.world.get_entities_with(LoadMapTrigger))
+
+
+def test_trigger_readers_run_after_release():
+    ecs = ECS()
+    released = MouseReleasedSystem(ecs)
+    reader = TriggerReader(ecs)
+    ecs.add_system(released)
+    ecs.add_system(reader)
+    button = ecs.create_entity()
+    for component in (Enabled(), Hovered(), Pressed(), Trigger(LoadMapTrigger)):
+        ecs.add_component(button, component)
+
+    ecs.send(MouseReleased(MouseButton.left, (0, 0)))
+    ecs.execute(0)
+
+    assert ecs.stages == [[released], [reader]]
+    assert reader.seen == [button]
@@ -1,29 +1,29 @@
 from dataclasses import dataclass
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
-@dataclass
-class Label(ComponentProtocol):
+@dataclass(slots=True)
+class Label(Component):
     label: str
 
 
-@dataclass
-class RadioItem(ComponentProtocol):
+@dataclass(slots=True)
+class RadioItem(Component):
     radio_group: str
 
 
-@dataclass
-class Trigger(ComponentProtocol):
-    name: ComponentProtocol
+@dataclass(slots=True)
+class Trigger(Component):
+    name: type
 
 
-@dataclass
-class Variable(ComponentProtocol):
+@dataclass(slots=True)
+class Variable(Component):
     value: str
     variable_type: type
 
 
-@dataclass
-class RenderLayer(ComponentProtocol):
+@dataclass(slots=True)
+class RenderLayer(Component):
     layer: int
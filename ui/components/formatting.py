@@ -3,7 +3,7 @@ from enum import Enum
 
 import pygame
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
 class Allignment(Enum):
@@ -12,8 +12,8 @@ class Allignment(Enum):
     right = 2
 
 
-@dataclass
-class Color(ComponentProtocol):
+@dataclass(slots=True)
+class Color(Component):
     text: pygame.Color
     background: pygame.Color
     hover: pygame.Color
@@ -23,19 +23,19 @@ class Color(ComponentProtocol):
     frame: pygame.Color
 
 
-@dataclass
-class Font(ComponentProtocol):
+@dataclass(slots=True)
+class Font(Component):
     font: pygame.font.Font
 
 
-@dataclass
-class Padding(ComponentProtocol):
+@dataclass(slots=True)
+class Padding(Component):
     left: int = 0
     right: int = 0
     top: int = 0
     bottom: int = 0
 
 
-@dataclass
-class TextAllignment(ComponentProtocol):
+@dataclass(slots=True)
+class TextAllignment(Component):
     allignment: Allignment
@@ -2,8 +2,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Tuple
 
-from ecs_framework.ecs import ComponentProtocol
-
 
 class Key(Enum):
     DELETE = 8
@@ -15,29 +13,25 @@ class MouseButton(Enum):
     right = 3
 
 
-@dataclass
-class KeyDown(ComponentProtocol):
+@dataclass(slots=True)
+class KeyDown:
     char: str
     key: int
 
 
-@dataclass
-class MousePosition(ComponentProtocol):
-    position: Tuple[int, int]
-
-
-@dataclass
-class MouseClicked(ComponentProtocol):
+@dataclass(slots=True)
+class MouseClicked:
     button: MouseButton
     position: Tuple[int, int]
 
 
-@dataclass
-class MouseReleased(ComponentProtocol):
+@dataclass(slots=True)
+class MouseReleased:
     button: MouseButton
     position: Tuple[int, int]
 
 
-@dataclass
-class MousePressed(ComponentProtocol):
-    button: MouseButton
+@dataclass(slots=True)
+class MouseState:
+    position: Tuple[int, int] | None = None
+    pressed: MouseButton | None = None
@@ -2,29 +2,25 @@ from dataclasses import dataclass
 
 import pygame
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
-@dataclass
-class Widget(ComponentProtocol):
+@dataclass(slots=True)
+class Widget(Component):
     pass
 
 
-@dataclass
-class Parent(ComponentProtocol):
+@dataclass(slots=True)
+class Parent(Component):
     entity: int
 
 
-@dataclass
-class RelativeRect(ComponentProtocol):
+@dataclass(slots=True)
+class RelativeRect(Component):
     rectangle: pygame.Rect
 
 
-@dataclass
-class Rect(ComponentProtocol):
+@dataclass(slots=True)
+class Rect(Component):
     rectangle: pygame.Rect
 
-
-@dataclass
-class RectDirty(ComponentProtocol):
-    pass
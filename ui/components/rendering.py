@@ -1,33 +1,33 @@
 from dataclasses import dataclass
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
-@dataclass
-class ForceRedraw(ComponentProtocol):
+@dataclass(slots=True)
+class ForceRedraw(Component):
     pass
 
 
-@dataclass
-class NeedRedraw(ComponentProtocol):
+@dataclass(slots=True)
+class NeedRedraw(Component):
     pass
 
 
-@dataclass
-class Renderable(ComponentProtocol):
+@dataclass(slots=True)
+class Renderable(Component):
     pass
 
 
-@dataclass
-class Highlightable(ComponentProtocol):
+@dataclass(slots=True)
+class Highlightable(Component):
     pass
 
 
-@dataclass
-class Labelable(ComponentProtocol):
+@dataclass(slots=True)
+class Labelable(Component):
     pass
 
 
-@dataclass
-class Frameable(ComponentProtocol):
+@dataclass(slots=True)
+class Frameable(Component):
     pass
@@ -1,64 +1,64 @@
 from dataclasses import dataclass
 from typing import List
 
-from ecs_framework.ecs import ComponentProtocol
+from ecs_framework.ecs import Component
 
 
-@dataclass
-class Enabled(ComponentProtocol):
+@dataclass(slots=True)
+class Enabled(Component):
     pass
 
 
-@dataclass
-class Hoverable(ComponentProtocol):
+@dataclass(slots=True)
+class Hoverable(Component):
     pass
 
 
-@dataclass
-class Hovered(ComponentProtocol):
+@dataclass(slots=True)
+class Hovered(Component):
     pass
 
 
-@dataclass
-class Pressable(ComponentProtocol):
+@dataclass(slots=True)
+class Pressable(Component):
     pass
 
 
-@dataclass
-class Pressed(ComponentProtocol):
+@dataclass(slots=True)
+class Pressed(Component):
     pass
 
 
-@dataclass
-class Focusable(ComponentProtocol):
+@dataclass(slots=True)
+class Focusable(Component):
     pass
 
 
-@dataclass
-class Focused(ComponentProtocol):
+@dataclass(slots=True)
+class Focused(Component):
     pass
 
 
-@dataclass
-class Toggleable(ComponentProtocol):
+@dataclass(slots=True)
+class Toggleable(Component):
     pass
 
 
-@dataclass
-class Toggled(ComponentProtocol):
+@dataclass(slots=True)
+class Toggled(Component):
     pass
 
 
-@dataclass
-class Selectable(ComponentProtocol):
+@dataclass(slots=True)
+class Selectable(Component):
     pass
 
 
-@dataclass
-class Selected(ComponentProtocol):
+@dataclass(slots=True)
+class Selected(Component):
     pass
 
 
-@dataclass
-class Typeable(ComponentProtocol):
+@dataclass(slots=True)
+class Typeable(Component):
     accepted_chars: List[str]
@@ -1,29 +1,30 @@
 import pygame
 from ecs_framework.ecs import ECS, SystemProtocol
-from ui.components.input import KeyDown, MouseButton, MouseClicked, MousePosition, MousePressed, MouseReleased
+from ui.components.input import KeyDown, MouseButton, MouseClicked, MouseReleased, MouseState
 
 
 class EventConverterSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int, keyboard: int):
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
-        self.keyboard = keyboard
+        if not world.has_resource(MouseState):
+            world.insert_resource(MouseState())
 
     def execute(self, delta_time: float):
+        mouse: MouseState = self.world.resource(MouseState)
         for event in pygame.event.get():
             if event.type == pygame.MOUSEMOTION:
-                self.world.add_component(self.mouse, MousePosition(event.pos))
+                mouse.position = event.pos
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    self.world.add_component(self.mouse, MouseClicked(MouseButton.left, event.pos))
-                    self.world.add_component(self.mouse, MousePressed(MouseButton.left))
+                    self.world.send(MouseClicked(MouseButton.left, event.pos))
+                    mouse.pressed = MouseButton.left
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:
-                    self.world.add_component(self.mouse, MouseReleased(MouseButton.left, event.pos))
-                    self.world.remove_component(self.mouse, MousePressed)
+                    self.world.send(MouseReleased(MouseButton.left, event.pos))
+                    mouse.pressed = None
             elif event.type == pygame.KEYDOWN:
-                self.world.add_component(self.keyboard, KeyDown(event.unicode, event.key))
+                self.world.send(KeyDown(event.unicode, event.key))
 
             if event.type == pygame.QUIT:
                 self.world.running = False
\ No newline at end of file
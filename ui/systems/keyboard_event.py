@@ -7,58 +7,62 @@ from ui.components.state import Enabled, Focused, Typeable
 
 class EnterKeySystem(SystemProtocol):
 
-    def __init__(self, world: ECS, keyboard: int):
+    reads = (KeyDown, Enabled, Focused, Typeable)
+    writes = (Focused, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.keyboard = keyboard
+        self.query = world.query(Enabled, Focused, Typeable)
+        self.keys = world.reader(KeyDown)
 
     def execute(self, delta_time: float):
-        key_down: KeyDown = self.world.get_entity_component(self.keyboard, KeyDown)
-        if key_down is None or key_down.key != Key.ENTER.value:
+        commands = self.world.defer()
+        if not any(key_down.key == Key.ENTER.value for key_down in self.keys.read()):
             return
 
-        for entity in self.world.get_entities_with(Enabled, Focused, Typeable):
-            self.world.remove_component(entity, Focused)
-            self.world.add_component(entity, NeedRedraw())
+        for entity in self.query.entities():
+            commands.remove_component(entity, Focused)
+            self.world.mark_changed(entity, NeedRedraw)
 
 
 class DeleteKeySystem(SystemProtocol):
 
-    def __init__(self, world: ECS, keyboard: int):
+    reads = (KeyDown, Variable, Typeable, Enabled, Focused)
+    writes = (Variable, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.keyboard = keyboard
+        self.query = world.query(Variable, Typeable, Enabled, Focused)
+        self.keys = world.reader(KeyDown)
 
     def execute(self, delta_time: float):
-        key_down: KeyDown = self.world.get_entity_component(self.keyboard, KeyDown)
-        if key_down is None or key_down.key != Key.DELETE.value:
+        deletes = sum(1 for key_down in self.keys.read() if key_down.key == Key.DELETE.value)
+        if not deletes:
             return
 
-        for entity, (variable, _, _, _) in self.world.get_entities_with_components(Variable, Typeable, Enabled, Focused):
-            variable.value = variable.value[:-1]
-            self.world.add_component(entity, NeedRedraw())
+        for entity, (variable, _, _, _) in self.query:
+            variable.value = variable.value[:-deletes]
+            self.world.mark_changed(entity, NeedRedraw)
 
 
 class TypingKeyDownSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, keyboard: int):
+    reads = (KeyDown, Variable, Typeable, Enabled, Focused)
+    writes = (Variable, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.keyboard = keyboard
+        self.query = world.query(Variable, Typeable, Enabled, Focused)
+        self.keys = world.reader(KeyDown)
 
     def execute(self, delta_time: float):
-        key_down: KeyDown = self.world.get_entity_component(self.keyboard, KeyDown)
-        if key_down is None:
+        keys = self.keys.read()
+        if not keys:
             return
         
-        for entity, (variable, typeable, _, _) in self.world.get_entities_with_components(Variable, Typeable, Enabled, Focused):
-            if key_down.char in typeable.accepted_chars:
-                variable.value += key_down.char
-                self.world.add_component(entity, NeedRedraw())
-
+        for entity, (variable, typeable, _, _) in self.query:
+            typed = ''.join(key_down.char for key_down in keys if key_down.char in typeable.accepted_chars)
+            if typed:
+                variable.value += typed
+                self.world.mark_changed(entity, NeedRedraw)
 
-class CleanupKeyDownSystem(SystemProtocol):
-
-    def __init__(self, world: ECS, keyboard: int):
-        self.world = world
-        self.keyboard = keyboard
-
-    def execute(self, delta_time: float):
-        self.world.remove_component(self.keyboard, KeyDown)
@@ -1,6 +1,6 @@
 from ecs_framework.ecs import ECS, SystemProtocol
 from ui.components.data import Trigger, RadioItem
-from ui.components.input import MouseClicked, MousePosition, MousePressed, MouseReleased
+from ui.components.input import MouseClicked, MouseReleased, MouseState
 from ui.components.layout import Rect
 from ui.components.rendering import NeedRedraw
 from ui.components.state import Enabled, Focusable, Focused, Hoverable, Hovered, Pressable, Pressed, Selectable, Selected, Toggleable, Toggled
@@ -8,142 +8,144 @@ from ui.components.state import Enabled, Focusable, Focused, Hoverable, Hovered,
 
 class MouseHoverSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    reads = (MouseState, Rect, Enabled, Hoverable, Hovered)
+    writes = (Hovered, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Rect, Enabled, Hoverable)
 
     def execute(self, delta_time: float):
-        position_component = self.world.get_entity_component(self.mouse, MousePosition)
-        mouse_position = position_component.position if position_component else None
+        commands = self.world.defer()
+        mouse: MouseState = self.world.resource(MouseState)
+        mouse_position = mouse.position if mouse else None
 
-        for entity, (rect, _, _) in self.world.get_entities_with_components(Rect, Enabled, Hoverable):
+        for entity, (rect, _, _) in self.query:
             if self.world.entity_has_component(entity, Hovered):
-                self.world.remove_component(entity, Hovered)
-                self.world.add_component(entity, NeedRedraw())
+                commands.remove_component(entity, Hovered)
+                self.world.mark_changed(entity, NeedRedraw)
             if mouse_position and rect.rectangle.collidepoint(mouse_position):
-                self.world.add_component(entity, Hovered())
-                self.world.add_component(entity, NeedRedraw())
+                commands.add_component(entity, Hovered())
+                self.world.mark_changed(entity, NeedRedraw)
 
 
 class MouseFocusSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    reads = (MouseClicked, Enabled, Focusable, Hovered, Focused)
+    writes = (Focused, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Enabled, Focusable)
+        self.clicks = world.reader(MouseClicked)
 
     def execute(self, delta_time: float):
-        mouse_clicked = self.world.get_entity_component(self.mouse, MouseClicked)
-        if mouse_clicked is None:
+        commands = self.world.defer()
+        if not self.clicks.read():
             return
 
-        for entity in self.world.get_entities_with(Enabled, Focusable):
+        for entity in self.query.entities():
             hovered = self.world.get_entity_component(entity, Hovered)
             if hovered:
-                self.world.add_component(entity, Focused())
-                self.world.add_component(entity, NeedRedraw())
+                commands.add_component(entity, Focused())
+                self.world.mark_changed(entity, NeedRedraw)
             elif self.world.entity_has_component(entity, Focused):
-                self.world.remove_component(entity, Focused)
-                self.world.add_component(entity, NeedRedraw())
+                commands.remove_component(entity, Focused)
+                self.world.mark_changed(entity, NeedRedraw)
 
 
 class MouseToggleSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    reads = (MouseClicked, Enabled, Toggleable, Hovered, Toggled)
+    writes = (Toggled, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Enabled, Toggleable, Hovered)
+        self.clicks = world.reader(MouseClicked)
 
     def execute(self, delta_time: float):
-        mouse_clicked = self.world.get_entity_component(self.mouse, MouseClicked)
-        if mouse_clicked is None:
+        commands = self.world.defer()
+        if not self.clicks.read():
             return
         
-        for entity in self.world.get_entities_with(Enabled, Toggleable, Hovered):
+        for entity in self.query.entities():
             if self.world.entity_has_component(entity, Toggled):
-                self.world.remove_component(entity, Toggled)
-                self.world.add_component(entity, NeedRedraw())
+                commands.remove_component(entity, Toggled)
+                self.world.mark_changed(entity, NeedRedraw)
             else:
-                self.world.add_component(entity, Toggled())
-                self.world.add_component(entity, NeedRedraw())
+                commands.add_component(entity, Toggled())
+                self.world.mark_changed(entity, NeedRedraw)
 
 
 class MouseSelectSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    reads = (MouseClicked, Enabled, Selectable, Hovered, RadioItem, Selected)
+    writes = (Selected, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Enabled, Selectable, Hovered)
+        self.radio_items = world.query(RadioItem, Enabled)
+        self.clicks = world.reader(MouseClicked)
 
     def execute(self, delta_time: float):        
-        mouse_clicked = self.world.get_entity_component(self.mouse, MouseClicked)
-        if mouse_clicked is None:
+        commands = self.world.defer()
+        if not self.clicks.read():
             return
         
-        for entity in self.world.get_entities_with(Enabled, Selectable, Hovered):
+        for entity in self.query.entities():
 
             radio_item = self.world.get_entity_component(entity, RadioItem)
             if radio_item:
-                for other_entity, (other_radio, _) in self.world.get_entities_with_components(RadioItem, Enabled):
+                for other_entity, (other_radio, _) in self.radio_items:
                     if radio_item.radio_group == other_radio.radio_group and self.world.entity_has_component(other_entity, Selected):
-                        self.world.remove_component(other_entity, Selected)
-                        self.world.add_component(other_entity, NeedRedraw())
-
-            self.world.add_component(entity, Selected())
-            self.world.add_component(entity, NeedRedraw())
+                        commands.remove_component(other_entity, Selected)
+                        self.world.mark_changed(other_entity, NeedRedraw)
 
-
-class CleanupMouseClickedSystem(SystemProtocol):
-
-    def __init__(self, world: ECS, mouse: int):
-        self.world = world
-        self.mouse = mouse
-
-    def execute(self, delta_time: float):
-        self.world.remove_component(self.mouse, MouseClicked)
+            commands.add_component(entity, Selected())
+            self.world.mark_changed(entity, NeedRedraw)
 
 
 class MouseReleasedSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Enabled, Hovered, Pressed)
+        self.releases = world.reader(MouseReleased)
 
     def execute(self, delta_time: float):
-        mouse_released = self.world.get_entity_component(self.mouse, MouseReleased)
-        if mouse_released is None:
+        commands = self.world.defer()
+        if not self.releases.read():
             return
 
-        for entity in self.world.get_entities_with(Enabled, Hovered, Pressed):
-            self.world.remove_component(entity, Pressed)
-            self.world.add_component(entity, NeedRedraw())
+        for entity in self.query.entities():
+            commands.remove_component(entity, Pressed)
+            self.world.mark_changed(entity, NeedRedraw)
             trigger = self.world.get_entity_component(entity, Trigger)
             if trigger:
-                self.world.add_component(entity, trigger.name())
-
-
-class CleanupMouseReleasedSystem(SystemProtocol):
-
-    def __init__(self, world: ECS, mouse: int):
-        self.world = world
-        self.mouse = mouse
-
-    def execute(self, delta_time: float):
-        self.world.remove_component(self.mouse, MouseReleased)
+                commands.add_component(entity, trigger.name())
 
 
 class MousePressedSystem(SystemProtocol):
 
-    def __init__(self, world: ECS, mouse: int):
+    reads = (MouseState, Enabled, Pressable, Hovered, Pressed)
+    writes = (Pressed, NeedRedraw)
+
+    def __init__(self, world: ECS):
         self.world = world
-        self.mouse = mouse
+        self.query = world.query(Enabled, Pressable)
 
     def execute(self, delta_time: float):
-        mouse_pressed = self.world.get_entity_component(self.mouse, MousePressed)
-        if mouse_pressed is None:
+        commands = self.world.defer()
+        mouse: MouseState = self.world.resource(MouseState)
+        if mouse is None or mouse.pressed is None:
             return
 
-        for entity in self.world.get_entities_with(Enabled, Pressable):
+        for entity in self.query.entities():
             if self.world.entity_has_component(entity, Hovered):
-                self.world.add_component(entity, Pressed())
-                self.world.add_component(entity, NeedRedraw())
+                commands.add_component(entity, Pressed())
+                self.world.mark_changed(entity, NeedRedraw)
             elif self.world.entity_has_component(entity, Pressed):
-                self.world.remove_component(entity, Pressed)
-                self.world.add_component(entity, NeedRedraw())
+                commands.remove_component(entity, Pressed)
+                self.world.mark_changed(entity, NeedRedraw)
@@ -21,11 +21,16 @@ def _left_middle_position(rect: pygame.Rect, text_rect: pygame.Surface) -> pygam
 
 class RelativeToRectConverter(SystemProtocol):
 
+    reads = (Parent, RelativeRect, Widget, Enabled, Rect)
+    writes = (Rect, NeedRedraw)
+
     def __init__(self, world: ECS):
         self.world = world
+        self.query = world.query(Parent, RelativeRect, Widget, Enabled)
 
     def execute(self, delta_time: float):
-        for entity, (parent, relative_rect, _, _) in self.world.get_entities_with_components(Parent, RelativeRect, Widget, Enabled):
+        commands = self.world.defer()
+        for entity, (parent, relative_rect, _, _) in self.query:
             if self.world.entity_has_component(entity, Rect):
                 continue
 
@@ -34,18 +39,28 @@ class RelativeToRectConverter(SystemProtocol):
 
             parent_rect: Rect = self.world.get_entity_component(parent.entity, Rect)
             rect = Rect(relative_rect.rectangle.move(parent_rect.rectangle.topleft))
-            self.world.add_component(entity, rect)
+            commands.add_component(entity, rect)
+            self.world.mark_changed(entity, NeedRedraw)
 
 
 class RendererSystem(SystemProtocol):
 
+    reads = (Widget, Enabled, Renderable, Color, Rect, RenderLayer, ForceRedraw, NeedRedraw, Highlightable, Labelable, Frameable, Toggled, Selected, Pressed, Hovered, Focused, Font, Label, TextAllignment, Variable)
+    writes = (pygame.Surface,)
+
     def __init__(self, world: ECS, screen: pygame.Surface):
         self.world = world
         self.screen = screen
+        self.forced = world.query(Widget, Enabled, Renderable, Color, Rect, ForceRedraw)
+        self.redraws = world.query(Widget, Enabled, Renderable, Color, Rect, NeedRedraw)
+        self.last_run = 0
 
     def execute(self, delta_time: float):
+        entities = dict.fromkeys(self.forced.entities())
+        entities.update((entity, None) for entity, _ in self.redraws.changed(self.last_run, NeedRedraw))
+
         all_entities = []
-        for entity in self.world.get_entities_with(Widget, Enabled, Renderable, Color, Rect):
+        for entity in entities:
             render_layer: RenderLayer = self.world.get_entity_component(entity, RenderLayer)
             layer = render_layer.layer if render_layer is not None else 100
             all_entities.append((entity, layer))
@@ -53,9 +68,6 @@ class RendererSystem(SystemProtocol):
         all_entities.sort(key=lambda x: x[1])
 
         for entity, layer in all_entities:
-            if not (self.world.entity_has_component(entity, ForceRedraw) or self.world.entity_has_component(entity, NeedRedraw)):
-                continue
-
             rect: Rect = self.world.get_entity_component(entity, Rect)
             colors: Color = self.world.get_entity_component(entity, Color)
             self.screen.set_clip(rect.rectangle)
@@ -117,12 +129,3 @@ class RendererSystem(SystemProtocol):
                 cursor_height = text_surface.get_height()
                 pygame.draw.line(self.screen, colors.text, cursor_position, cursor_position + pygame.Vector2(0, cursor_height))
 
-
-class CleanupRendererSystem(SystemProtocol):
-
-    def __init__(self, world: ECS):
-        self.world = world
-
-    def execute(self, delta_time: float):
-        for entity in self.world.get_entities_with(NeedRedraw):
-            self.world.remove_component(entity, NeedRedraw)
@@ -1,6 +1,6 @@
 from typing import List, Optional
 import pygame
-from ecs_framework.ecs import ECS, ComponentProtocol
+from ecs_framework.ecs import ECS
 from ui.components.data import Trigger, Label, RadioItem, RenderLayer, Variable
 from ui.components.formatting import Allignment, TextAllignment, Color, Font
 from ui.components.layout import Widget, Parent, Rect, RelativeRect
@@ -95,7 +95,7 @@ def create_int_text_input(world: ECS, label: str, value: str, rect: pygame.Rect,
     return entity
 
 
-def create_button(world: ECS, label: str, rect: pygame.Rect, trigger: ComponentProtocol, parent: Optional[int] = None) -> int:
+def create_button(world: ECS, label: str, rect: pygame.Rect, trigger: type, parent: Optional[int] = None) -> int:
     entity = _create_base_widget(world, 10, rect, parent)
 
     world.add_component(entity, Hoverable())
@@ -111,14 +111,14 @@ def create_button(world: ECS, label: str, rect: pygame.Rect, trigger: ComponentP
     return entity
 
 
-def create_radio_button(world: ECS, label: str, radio_group: str, rect: pygame.Rect, parent: Optional[int] = None, trigger: Optional[ComponentProtocol] = None) -> int:
+def create_radio_button(world: ECS, label: str, radio_group: str, rect: pygame.Rect, parent: Optional[int] = None, trigger: Optional[type] = None) -> int:
     entity = create_button(world, label, rect, trigger, parent)
     world.add_component(entity, Selectable())
     world.add_component(entity, RadioItem(radio_group))
     return entity
 
 
-def create_toggle(world: ECS, label: str, rect: pygame.Rect, parent: Optional[int] = None, trigger: Optional[ComponentProtocol] = None) -> int:
+def create_toggle(world: ECS, label: str, rect: pygame.Rect, parent: Optional[int] = None, trigger: Optional[type] = None) -> int:
     entity = create_button(world, label, rect, trigger, parent)
     world.add_component(entity, Toggleable())
     return entity